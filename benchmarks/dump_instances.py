@@ -0,0 +1,100 @@
+"""
+Measure bulk serialization of resource instances.
+
+Serializes ``--entries`` components with every format supported by
+``Manager.dump_instances`` and recreates them with ``load_instances``.
+The baseline is one ``json.dumps`` / ``instance_from_json`` per instance.
+
+Usage::
+
+    python benchmarks/dump_instances.py [--entries 10000] [--repeat 10]
+"""
+
+import argparse
+import json
+import time
+
+from cachetclient.base import DUMP_FORMATS
+from cachetclient.v1.components import ComponentManager
+
+
+class FakeHttp:
+    codec = None
+
+
+def components(manager: ComponentManager, entries: int) -> list:
+    return [
+        manager.instance_from_dict(
+            {
+                "id": num,
+                "name": "Component {}".format(num),
+                "description": "Component number {}".format(num),
+                "link": "https://example.test/{}".format(num),
+                "status": num % 4 + 1,
+                "status_name": "Operational",
+                "order": num,
+                "group_id": num % 10,
+                "enabled": True,
+                "tags": {"web": "Web", "tag-{}".format(num % 7): "Tag"},
+                "created_at": "2019-05-24 09:26:22",
+                "updated_at": "2019-05-24 09:26:22",
+                "deleted_at": None,
+            }
+        )
+        for num in range(entries)
+    ]
+
+
+def best(func, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    manager = ComponentManager(FakeHttp())
+    instances = components(manager, args.entries)
+
+    print("{:<16} {:>10} {:>10} {:>10}".format("format", "dump ms", "load ms", "KB"))
+
+    dump_time, dumped = best(
+        lambda: [json.dumps(instance.attrs) for instance in instances], args.repeat
+    )
+    load_time, _ = best(
+        lambda: [manager.instance_from_json(data) for data in dumped], args.repeat
+    )
+    print(
+        "{:<16} {:>10.2f} {:>10.2f} {:>10.0f}".format(
+            "json per object",
+            dump_time * 1000,
+            load_time * 1000,
+            sum(len(data) for data in dumped) / 1024,
+        )
+    )
+
+    for fmt in DUMP_FORMATS:
+        try:
+            dump_time, data = best(
+                lambda: manager.dump_instances(instances, fmt=fmt), args.repeat
+            )
+        except ImportError:
+            print("{:<16} not installed".format(fmt))
+            continue
+        load_time, _ = best(lambda: manager.load_instances(data, fmt=fmt), args.repeat)
+        print(
+            "{:<16} {:>10.2f} {:>10.2f} {:>10.0f}".format(
+                fmt, dump_time * 1000, load_time * 1000, len(data) / 1024
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measure the time it takes to import cachetclient modules.
+
+Each module is imported in a fresh interpreter several times
+and the best time is reported. Importing the cli should not
+pull in requests or the v1 managers.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat 10]
+"""
+
+import argparse
+import subprocess
+import sys
+
+MODULES = [
+    "cachetclient",
+    "cachetclient.cli",
+    "cachetclient.client",
+    "cachetclient.v1.client",
+    "requests",
+]
+
+CODE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, int('requests' in sys.modules))
+"""
+
+
+def measure(module: str, repeat: int):
+    best, loads_requests = None, False
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", CODE.format(module=module)],
+            universal_newlines=True,
+        )
+        seconds, requests_loaded = output.split()
+        best = min(best or float(seconds), float(seconds))
+        loads_requests = requests_loaded == "1"
+    return best, loads_requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print("{:<28} {:>10} {:>10}".format("module", "ms", "requests"))
+    for module in MODULES:
+        seconds, loads_requests = measure(module, args.repeat)
+        print(
+            "{:<28} {:>10.1f} {:>10}".format(
+                module, seconds * 1000, "yes" if loads_requests else "no"
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
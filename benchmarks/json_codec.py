@@ -0,0 +1,115 @@
+"""
+Measure json codecs on large list payloads.
+
+A list response with ``--entries`` components is encoded and
+decoded with every installed codec, and decoded into resources
+with ``instance_list_from_json``. ``requests`` is included as the
+previous baseline decoding through ``Response.json()``.
+
+Usage::
+
+    python benchmarks/json_codec.py [--entries 10000] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+
+import requests
+
+from cachetclient import codec
+from cachetclient.v1.components import ComponentManager
+
+
+def payload(entries: int) -> dict:
+    return {
+        "meta": {
+            "pagination": {
+                "total": entries,
+                "count": entries,
+                "per_page": entries,
+                "current_page": 1,
+                "total_pages": 1,
+            }
+        },
+        "data": [
+            {
+                "id": num,
+                "name": "Component {}".format(num),
+                "description": "Component number {} ✓".format(num),
+                "link": "https://example.test/{}".format(num),
+                "status": num % 4 + 1,
+                "status_name": "Operational",
+                "order": num,
+                "group_id": num % 10,
+                "enabled": True,
+                "tags": {"web": "Web", "tag-{}".format(num % 7): "Tag"},
+                "created_at": "2019-05-24 09:26:22",
+                "updated_at": "2019-05-24 09:26:22",
+                "deleted_at": None,
+            }
+            for num in range(entries)
+        ],
+    }
+
+
+def best(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+class FakeHttp:
+    def __init__(self, json_codec):
+        self.codec = json_codec
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = payload(args.entries)
+    body = json.dumps(data).encode()
+    items = json.dumps(data["data"])
+    print("payload: {} entries, {:.1f} MB".format(args.entries, len(body) / 1e6))
+
+    response = requests.Response()
+    response._content = body
+    response.encoding = "utf-8"
+
+    print(
+        "{:<10} {:>10} {:>10} {:>12}".format(
+            "codec", "loads ms", "dumps ms", "resources ms"
+        )
+    )
+    print(
+        "{:<10} {:>10.2f} {:>10} {:>12}".format(
+            "requests", best(response.json, args.repeat) * 1000, "-", "-"
+        )
+    )
+    for name in codec.CODECS:
+        try:
+            json_codec = codec.get_codec(name)
+        except ImportError:
+            print("{:<10} not installed".format(name))
+            continue
+
+        manager = ComponentManager(FakeHttp(json_codec))
+        print(
+            "{:<10} {:>10.2f} {:>10.2f} {:>12.2f}".format(
+                name,
+                best(lambda: json_codec.loads(body), args.repeat) * 1000,
+                best(lambda: json_codec.dumps(data), args.repeat) * 1000,
+                best(lambda: manager.instance_list_from_json(items), args.repeat)
+                * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
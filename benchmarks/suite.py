@@ -0,0 +1,218 @@
+"""
+Throughput benchmarks for the common client operations.
+
+Every case runs against the in-memory fake api (``fake``) and
+the local http server from ``tests/fakeserver.py`` (``server``)
+exercising the real ``requests`` stack. Cases not doing any
+requests run once (``local``).
+
+Results can be saved as a baseline and later runs compared
+against it, so performance changes can prove themselves::
+
+    python benchmarks/suite.py --save baseline.json
+    ... change something ...
+    python benchmarks/suite.py --compare baseline.json
+
+Usage::
+
+    python benchmarks/suite.py [--target fake|server|all] [--filter list] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests")
+)
+
+from cachetclient import utils, v1  # noqa: E402
+from cachetclient.httpclient import HttpClient  # noqa: E402
+from cachetclient.v1.components import ComponentManager  # noqa: E402
+from fakeapi import FakeHttpClient  # noqa: E402
+from fakeserver import FakeServer  # noqa: E402
+
+ENTRIES = 2000
+
+
+def component(num: int) -> dict:
+    return {
+        "id": num,
+        "name": "Component {}".format(num),
+        "description": "Component number {}".format(num),
+        "link": "https://example.test/{}".format(num),
+        "status": num % 4 + 1,
+        "status_name": "Operational",
+        "order": num,
+        "group_id": num % 10,
+        "enabled": True,
+        "tags": {"web": "Web"},
+        "created_at": "2019-05-24 09:26:22",
+        "updated_at": "2019-05-24 09:26:22",
+    }
+
+
+def seed(routes, entries: int) -> None:
+    """Fill the fake api with components and a metric"""
+    for num in range(1, entries + 1):
+        routes.components.add_entry(component(num))
+        routes.components.last_id = num
+    routes.metrics.post(
+        data={"name": "Latency", "description": "Latency", "suffix": "ms"}
+    )
+
+
+def cases(client, entries: int):
+    """Yield ``(name, operations, function)`` for a seeded client"""
+    for per_page in (20, 100, 500):
+        yield (
+            "list per_page={}".format(per_page),
+            entries,
+            lambda per_page=per_page: sum(
+                1 for _ in client.components.list(per_page=per_page)
+            ),
+        )
+    yield (
+        "list per_page=100 workers=4",
+        entries,
+        lambda: sum(1 for _ in client.components.list(per_page=100, workers=4)),
+    )
+    yield (
+        "get",
+        200,
+        lambda: [client.components.get(num) for num in range(1, 201)],
+    )
+    yield (
+        "create points",
+        200,
+        lambda: [
+            client.metric_points.create(metric_id=1, value=num) for num in range(200)
+        ],
+    )
+
+    def create_concurrent():
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda num: client.metric_points.create(metric_id=1, value=num),
+                    range(200),
+                )
+            )
+
+    yield "create points workers=8", 200, create_concurrent
+
+
+def local_cases(entries: int):
+    """Cases not doing any requests"""
+    manager = ComponentManager(FakeHttpClient("", ""))
+    data = [component(num) for num in range(entries * 10)]
+    start = datetime(2019, 1, 1)
+    timestamps = [
+        (start + timedelta(seconds=num)).strftime("%Y-%m-%d %H:%M:%S")
+        for num in range(entries * 10)
+    ]
+
+    yield (
+        "resource construction",
+        len(data),
+        lambda: [manager.instance_from_dict(entry) for entry in data],
+    )
+    yield (
+        "resource created_at",
+        len(data),
+        lambda: [manager.instance_from_dict(entry).created_at for entry in data],
+    )
+
+    def parse():
+        utils._cached_parse_datetime.cache_clear()
+        for timestamp in timestamps:
+            utils.to_datetime(timestamp)
+
+    yield "to_datetime", len(timestamps), parse
+
+
+def measure(func, operations: int, repeat: int) -> float:
+    """Best operations per second of ``repeat`` runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return operations / best
+
+
+def run(target: str, name_filter: str, repeat: int, entries: int) -> dict:
+    results = {}
+
+    def report(name, operations, func):
+        if name_filter and name_filter not in name:
+            return
+        key = "{} {}".format(target, name)
+        results[key] = measure(func, operations, repeat)
+        print("{:<40} {:>14,.0f}".format(key, results[key]), flush=True)
+
+    if target == "local":
+        for case in local_cases(entries):
+            report(*case)
+        return results
+
+    if target == "fake":
+        http = FakeHttpClient("", "")
+        seed(http.routes, entries)
+        for case in cases(v1.Client(http), entries):
+            report(*case)
+        return results
+
+    with FakeServer() as server:
+        seed(server.routes, entries)
+        http = HttpClient(server.endpoint, server.token, pool_size=16)
+        for case in cases(v1.Client(http), entries):
+            report(*case)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--target", choices=("fake", "server", "local", "all"), default="all"
+    )
+    parser.add_argument("--filter", help="Only run cases containing this string")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--entries", type=int, default=ENTRIES)
+    parser.add_argument("--save", help="Save the results as json")
+    parser.add_argument("--compare", help="Compare with results saved with --save")
+    args = parser.parse_args()
+
+    targets = ("local", "fake", "server") if args.target == "all" else (args.target,)
+    print("{:<40} {:>14}".format("case", "ops/s"))
+    results = {}
+    for target in targets:
+        results.update(run(target, args.filter, args.repeat, args.entries))
+
+    if args.save:
+        with open(args.save, "w") as fd:
+            json.dump(results, fd, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as fd:
+            baseline = json.load(fd)
+        print()
+        print(
+            "{:<40} {:>14} {:>14} {:>8}".format("case", "baseline", "ops/s", "change")
+        )
+        for key, value in results.items():
+            if key in baseline:
+                print(
+                    "{:<40} {:>14,.0f} {:>14,.0f} {:>+7.0%}".format(
+                        key, baseline[key], value, value / baseline[key] - 1
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
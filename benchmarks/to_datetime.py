@@ -0,0 +1,88 @@
+"""
+Measure timestamp parsing in ``cachetclient.utils.to_datetime``.
+
+Compares the previous strptime based implementation with the
+current parser, both with and without memoization. Unique
+timestamps show the cost of parsing alone while repeated
+timestamps (as in metric points sharing ``created_at`` and
+``updated_at`` values) show the effect of the memo.
+
+Usage::
+
+    python benchmarks/to_datetime.py [--count 1000000]
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime, timedelta
+
+from cachetclient import utils
+
+
+def legacy_to_datetime(timestamp):
+    """The strptime based implementation this benchmark compares against"""
+    if timestamp is None:
+        return None
+
+    try:
+        return datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        pass
+
+    try:
+        sub_timestamp = re.sub(r"\b([0123]?[0-9])(st|th|nd|rd)\b", r"\1", timestamp)
+        return datetime.strptime(sub_timestamp, "%A %d %B %Y %H:%M:%S")
+    except ValueError:
+        pass
+
+    raise ValueError("datetime string '{}' not supported".format(timestamp))
+
+
+def timestamps(count: int, distinct: int):
+    start = datetime(2019, 1, 1)
+    values = [
+        (start + timedelta(seconds=num * 7)).strftime("%Y-%m-%d %H:%M:%S")
+        for num in range(distinct)
+    ]
+    return [values[num % distinct] for num in range(count)]
+
+
+def measure(func, values) -> float:
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=1000000)
+    args = parser.parse_args()
+
+    datasets = [
+        ("unique", timestamps(args.count, args.count)),
+        ("repeated", timestamps(args.count, 1000)),
+    ]
+    parsers = [
+        ("legacy", legacy_to_datetime),
+        ("parse", utils._parse_datetime),
+        ("to_datetime", utils.to_datetime),
+    ]
+
+    print(
+        "{:<10} {:<12} {:>10} {:>12}".format("data", "parser", "seconds", "per second")
+    )
+    for data_name, values in datasets:
+        for parser_name, func in parsers:
+            utils._cached_parse_datetime.cache_clear()
+            seconds = measure(func, values)
+            print(
+                "{:<10} {:<12} {:>10.3f} {:>12,.0f}".format(
+                    data_name, parser_name, seconds, len(values) / seconds
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,20 @@
-from cachetclient.client import Client  # noqa
+import sys
 
 ___version__ = "4.0.1"
+
+if sys.version_info >= (3, 7):
+    # The clients are imported on first access so importing
+    # the package (or the cli) does not load the http stack
+
+    def __getattr__(name):
+        if name in ("AsyncClient", "Client"):
+            from cachetclient import client
+
+            return getattr(client, name)
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(list(globals()) + ["AsyncClient", "Client"])
+
+else:
+    from cachetclient.client import AsyncClient, Client  # noqa
@@ -1,12 +1,24 @@
-import json
-from typing import Any, Generator, Optional, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncGenerator, Generator, Iterable, Optional, List
 
-from cachetclient.httpclient import HttpClient
+from cachetclient import tracing, utils
+from cachetclient.codec import JsonCodec, get_codec
+from cachetclient.httpclient import AsyncHttpClient, HttpClient
+
+#: Formats supported by :py:meth:`Manager.dump_instances`
+DUMP_FORMATS = ("json", "msgpack", "pickle")
 
 
 class Resource:
     """Bag of attributes"""
 
+    # Compact resource classes declare (empty) __slots__ all the way down
+    # so they have no instance dict. The regular resource classes subclass
+    # them without __slots__ and keep their __dict__.
+    __slots__ = ("_manager", "_data")
+
     def __init__(self, manager, data):
         """Resource initializer.
 
@@ -57,7 +69,7 @@ class Resource:
         Raises:
             HTTPException if the resource don't exist.
         """
-        self._manager.delete(self.get("id"))
+        return self._manager.delete(self.get("id"))
 
     def __repr__(self) -> str:
         return str(self)
@@ -72,6 +84,8 @@ class Manager:
     """
 
     resource_class = Resource
+    #: Resource class without an instance ``__dict__`` used in compact mode
+    compact_resource_class = Resource
     path: Optional[str] = None
 
     def __init__(self, http_client: HttpClient):
@@ -81,6 +95,7 @@ class Manager:
             http_client: The httpclient
         """
         self._http = http_client
+        self._compact = False
 
         if self.resource_class is None:
             raise ValueError(
@@ -90,6 +105,26 @@ class Manager:
         # if self.path is None:
         #     raise ValueError("path not defined for class {}".format(self.__class__))
 
+    @property
+    def compact(self) -> bool:
+        """
+        bool: Create resources of ``compact_resource_class``.
+
+        Compact resources have no instance ``__dict__``, so they use less
+        memory when keeping large listings around. Arbitrary attributes
+        can not be set on them and they are not instances of
+        ``resource_class``. Disabled by default.
+        """
+        return self._compact
+
+    @compact.setter
+    def compact(self, value: bool):
+        self._compact = bool(value)
+        cls = type(self)
+        self.resource_class = (
+            cls.compact_resource_class if value else cls.resource_class
+        )
+
     def instance_from_dict(self, data: dict) -> Resource:
         """Creates a resource instance from a dictionary.
 
@@ -118,7 +153,7 @@ class Manager:
         Returns:
             Resource: The resource class instance
         """
-        return self.resource_class(self, json.loads(data))
+        return self.resource_class(self, self._codec().loads(data))
 
     def instance_list_from_json(self, data: str) -> List[Resource]:
         """Creates a resource instance list from a json string.
@@ -135,7 +170,7 @@ class Manager:
         Raises:
             ValueError: if json data do not deserialize into a list
         """
-        instances = json.loads(data)
+        instances = self._codec().loads(data)
         if not isinstance(instances, list):
             raise ValueError(
                 "json data is {}, not a list : {}".format(type(instances), instances)
@@ -143,9 +178,71 @@ class Manager:
 
         return [self.resource_class(self, inst) for inst in instances]
 
+    def dump_instances(self, instances: Iterable[Resource], fmt: str = "json") -> bytes:
+        """Serializes a list of resource instances.
+
+        The raw data of all instances is serialized in one go,
+        which is much cheaper than serializing each instance.
+        Use :py:meth:`load_instances` to recreate the instances.
+        ``msgpack`` is the most compact format and requires
+        msgpack (``pip install cachet-client[msgpack]``).
+
+        Args:
+            instances: The resource instances
+            fmt (str): ``json``, ``msgpack`` or ``pickle``
+        Returns:
+            bytes: The serialized instance data
+        Raises:
+            ValueError: if the format is not supported
+        """
+        data = [instance.attrs for instance in instances]
+        if fmt == "json":
+            return self._codec().dumps(data)
+        if fmt == "msgpack":
+            return _import_msgpack().packb(data, use_bin_type=True)
+        if fmt == "pickle":
+            import pickle
+
+            return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+        raise ValueError(_unknown_format(fmt))
+
+    def load_instances(self, data: bytes, fmt: str = "json") -> List[Resource]:
+        """Creates resource instances from :py:meth:`dump_instances` data.
+
+        The instances are bound to this manager.
+        Only load pickle data from trusted sources.
+
+        Args:
+            data (bytes): The serialized instance data
+            fmt (str): ``json``, ``msgpack`` or ``pickle``
+        Returns:
+            list: The resource class instances
+        Raises:
+            ValueError: if the format is not supported or the data is not a list
+        """
+        if fmt == "json":
+            instances = self._codec().loads(data)
+        elif fmt == "msgpack":
+            instances = _import_msgpack().unpackb(data, raw=False)
+        elif fmt == "pickle":
+            import pickle
+
+            instances = pickle.loads(data)
+        else:
+            raise ValueError(_unknown_format(fmt))
+
+        if not isinstance(instances, list):
+            raise ValueError("{} data is {}, not a list".format(fmt, type(instances)))
+
+        resource_class = self.resource_class
+        return [resource_class(self, inst) for inst in instances]
+
     def _create(self, path: str, data: dict):
-        response = self._http.post(path, data=data)
-        return self.resource_class(self, response.json()["data"])
+        with self._span("create", path):
+            response = self._http.post(path, data=data)
+            self._invalidate(path)
+            return self.resource_class(self, self._decode(response)["data"])
 
     def _update(self, path: str, resource_id: int, data: dict) -> Resource:
         """Generic resource updater
@@ -158,11 +255,18 @@ class Manager:
         Returns:
             Resource: The updated resource from the server
         """
-        response = self._http.put("{}/{}".format(path, resource_id), data=data)
-        return self.resource_class(self, response.json()["data"])
+        with self._span("update", path, resource_id=resource_id):
+            response = self._http.put("{}/{}".format(path, resource_id), data=data)
+            self._invalidate(path)
+            return self.resource_class(self, self._decode(response)["data"])
 
     def _list_paginated(
-        self, path: str, page=1, per_page=20
+        self,
+        path: str,
+        page=1,
+        per_page=20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[Resource, None, None]:
         """List resources paginated.
 
@@ -172,30 +276,132 @@ class Manager:
         Keyword Args:
             page (int): Page to start on
             per_page (int): Number of entries per page
+            workers (int): Fetch the remaining pages concurrently
+                           using this many threads
+            read_ahead (int): Number of pages fetched in the background
+                              while the current page is consumed
 
         Returns:
             Generator of resources
         """
-        while True:
-            result = self._http.get(
+        pages = self._iter_pages(
+            path, page=page, per_page=per_page, workers=workers, read_ahead=read_ahead
+        )
+        for data in pages:
+            for entry in data:
+                yield self.resource_class(self, entry)
+
+    def _iter_pages(
+        self,
+        path: str,
+        page=1,
+        per_page=20,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> Generator[List[dict], None, None]:
+        """Iterate the raw data of each page in order.
+
+        The first page is always fetched alone since the total
+        number of pages is not known before we have a response.
+        The remaining pages are fetched in the background by
+        ``workers`` threads (1 if only ``read_ahead`` is given)
+        while the caller consumes the current page. At most
+        ``read_ahead`` pages (defaults to ``workers``) are in flight
+        or buffered at any time.
+
+        Args:
+            path (str): url path relative to base url
+
+        Keyword Args:
+            page (int): Page to start on
+            per_page (int): Number of entries per page
+            workers (int): Number of threads fetching pages
+            read_ahead (int): Max number of pages fetched ahead
+
+        Returns:
+            Generator of entry lists
+        """
+        span = self._start_span("list", path, per_page=per_page)
+        # Page spans are children of the list span, also in the worker threads
+        fetch = tracing.bind(span, self._fetch_page)
+        error = None
+        try:
+            json_data = fetch(path, page, per_page)
+            total_pages = json_data["meta"]["pagination"]["total_pages"]
+
+            if not read_ahead and (not workers or workers <= 1):
+                yield json_data["data"]
+                while page < total_pages:
+                    page += 1
+                    json_data = fetch(path, page, per_page)
+                    yield json_data["data"]
+                    total_pages = json_data["meta"]["pagination"]["total_pages"]
+                return
+
+            pages = iter(range(page + 1, total_pages + 1))
+            with ThreadPoolExecutor(max_workers=workers or 1) as executor:
+                # Start fetching ahead before the caller consumes the first page
+                pending = deque(
+                    executor.submit(fetch, path, num, per_page)
+                    for num in islice(pages, read_ahead or workers)
+                )
+                try:
+                    yield json_data["data"]
+                    while pending:
+                        json_data = pending.popleft().result()
+                        for num in pages:
+                            pending.append(executor.submit(fetch, path, num, per_page))
+                            break
+                        yield json_data["data"]
+                finally:
+                    for future in pending:
+                        future.cancel()
+        except Exception as ex:
+            error = ex
+            raise
+        finally:
+            tracing.end_span(span, error)
+
+    def _fetch_page(self, path: str, page: int, per_page: int) -> dict:
+        """Fetch the json response of a single page"""
+        with self._span("page", path, page=page, per_page=per_page):
+            return self._get_json(
                 path,
                 params={
                     "page": page,
                     "per_page": per_page,
                 },
             )
-            json_data = result.json()
 
-            meta = json_data["meta"]
-            data = json_data["data"]
+    def _get_json(self, path: str, params: dict = None) -> dict:
+        """Get the json response of a path.
 
-            for entry in data:
-                yield self.resource_class(self, entry)
+        Served from the response cache of the http client if enabled.
+
+        Args:
+            path (str): url path relative to base url
 
-            if page >= meta["pagination"]["total_pages"]:
-                break
+        Keyword Args:
+            params (dict): Query parameters
 
-            page += 1
+        Returns:
+            dict: The json response
+        """
+        cache = getattr(self._http, "cache", None)
+        if cache is None:
+            return self._http.get_json(path, params=params)
+
+        json_data = cache.get(path, params)
+        if json_data is None:
+            json_data = self._http.get_json(path, params=params)
+            cache.set(path, params, json_data)
+        return json_data
+
+    def _invalidate(self, path: str) -> None:
+        """Drop cached responses affected by a write to path"""
+        cache = getattr(self._http, "cache", None)
+        if cache is not None:
+            cache.invalidate(path)
 
     # def _search(self, path, params=None):
     #     params = params or {}
@@ -212,9 +418,9 @@ class Manager:
         Returns:
             :py:data:`Resource`: A resource instance
         """
-        result = self._http.get("{}/{}".format(path, resource_id))
-        json_data = result.json()
-        return self.resource_class(self, json_data["data"])
+        with self._span("get", path, resource_id=resource_id):
+            json_data = self._get_json("{}/{}".format(path, resource_id))
+            return self.resource_class(self, json_data["data"])
 
     def _count(self, path: str) -> int:
         """Generic count method
@@ -226,9 +432,9 @@ class Manager:
         Returns:
             int: Number of resources
         """
-        result = self._http.get(path, params={"per_page": 1})
-        json_data = result.json()
-        return json_data["meta"]["pagination"]["total"]
+        with self._span("count", path):
+            json_data = self._get_json(path, params={"per_page": 1})
+            return json_data["meta"]["pagination"]["total"]
 
     def _delete(self, path: str, resource_id: int) -> None:
         """Generic resource deleter
@@ -237,7 +443,36 @@ class Manager:
             path (str): url path relative to base url
             resource_id (int): The resource to delete
         """
-        self._http.delete(path, resource_id)
+        with self._span("delete", path, resource_id=resource_id):
+            self._http.delete(path, resource_id)
+            self._invalidate(path)
+
+    def _codec(self) -> JsonCodec:
+        """The json codec of the http client or the default codec"""
+        return getattr(self._http, "codec", None) or get_codec()
+
+    def _decode(self, response) -> Any:
+        """Decode a json response body"""
+        return tracing.decode(self._codec().loads, response.content)
+
+    def _span(self, operation: str, path: str, **attributes):
+        """Context manager tracing an operation. See :py:mod:`cachetclient.tracing`"""
+        return tracing.span(*self._span_info(operation, path, attributes))
+
+    def _start_span(self, operation: str, path: str, **attributes):
+        """Start a span for an operation spanning generator steps"""
+        return tracing.start_span(*self._span_info(operation, path, attributes))
+
+    def _span_info(self, operation: str, path: str, attributes: dict):
+        """The span name and attributes of an operation"""
+        attributes = {
+            "cachet.{}".format(key): value for key, value in attributes.items()
+        }
+        # The class attribute, so compact mode still reports Component and not CompactComponent
+        attributes["cachet.resource"] = type(self).resource_class.__name__
+        # Ids in paths such as metrics/1/points would make the attribute unbounded
+        attributes["cachet.path"] = utils.path_template(path)
+        return "{}.{}".format(type(self).__name__, operation), attributes
 
     def _build_data_dict(self, **kwargs) -> dict:
         """Builds a data dictionary for posting to the server.
@@ -249,3 +484,162 @@ class Manager:
             dict: dict without `None` values
         """
         return {key: value for key, value in kwargs.items() if value is not None}
+
+
+class AsyncManager(Manager):
+    """
+    Base class for handling crud resources through an :py:class:`AsyncHttpClient`.
+
+    Mixed in before a regular manager so the public methods of that manager
+    return awaitables and ``list()`` returns async generators::
+
+        class AsyncComponentManager(AsyncManager, ComponentManager):
+            pass
+    """
+
+    def __init__(self, http_client: AsyncHttpClient, *args):
+        """Manager initializer.
+
+        Args:
+            http_client: The async httpclient
+        """
+        super().__init__(http_client, *args)
+
+    async def _create(self, path: str, data: dict):
+        with self._span("create", path):
+            response = await self._http.post(path, data=data)
+            self._invalidate(path)
+            return self.resource_class(self, self._decode(response)["data"])
+
+    async def _update(self, path: str, resource_id: int, data: dict) -> Resource:
+        with self._span("update", path, resource_id=resource_id):
+            response = await self._http.put(
+                "{}/{}".format(path, resource_id), data=data
+            )
+            self._invalidate(path)
+            return self.resource_class(self, self._decode(response)["data"])
+
+    async def _list_paginated(
+        self,
+        path: str,
+        page=1,
+        per_page=20,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> AsyncGenerator[Resource, None]:
+        pages = self._iter_pages(
+            path, page=page, per_page=per_page, workers=workers, read_ahead=read_ahead
+        )
+        async for data in pages:
+            for entry in data:
+                yield self.resource_class(self, entry)
+
+    async def _iter_pages(
+        self,
+        path: str,
+        page=1,
+        per_page=20,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> AsyncGenerator[List[dict], None]:
+        span = self._start_span("list", path, per_page=per_page)
+        error = None
+        try:
+            # The span is only current while fetching since the context
+            # of an async generator is not kept across yield
+            with tracing.use_span(span):
+                json_data = await self._fetch_page(path, page, per_page)
+            total_pages = json_data["meta"]["pagination"]["total_pages"]
+
+            if not read_ahead and (not workers or workers <= 1):
+                yield json_data["data"]
+                while page < total_pages:
+                    page += 1
+                    with tracing.use_span(span):
+                        json_data = await self._fetch_page(path, page, per_page)
+                    yield json_data["data"]
+                    total_pages = json_data["meta"]["pagination"]["total_pages"]
+                return
+
+            import asyncio
+
+            semaphore = asyncio.Semaphore(workers or 1)
+
+            async def fetch(num):
+                async with semaphore:
+                    with tracing.use_span(span):
+                        return await self._fetch_page(path, num, per_page)
+
+            pages = iter(range(page + 1, total_pages + 1))
+            # Start fetching ahead before the caller consumes the first page
+            pending = deque(
+                asyncio.ensure_future(fetch(num))
+                for num in islice(pages, read_ahead or workers)
+            )
+            try:
+                yield json_data["data"]
+                while pending:
+                    json_data = await pending.popleft()
+                    for num in pages:
+                        pending.append(asyncio.ensure_future(fetch(num)))
+                        break
+                    yield json_data["data"]
+            finally:
+                for future in pending:
+                    future.cancel()
+        except Exception as ex:
+            error = ex
+            raise
+        finally:
+            tracing.end_span(span, error)
+
+    async def _fetch_page(self, path: str, page: int, per_page: int) -> dict:
+        with self._span("page", path, page=page, per_page=per_page):
+            return await self._get_json(
+                path,
+                params={
+                    "page": page,
+                    "per_page": per_page,
+                },
+            )
+
+    async def _get_json(self, path: str, params: dict = None) -> dict:
+        cache = self._http.cache
+        if cache is None:
+            return await self._http.get_json(path, params=params)
+
+        json_data = cache.get(path, params)
+        if json_data is None:
+            json_data = await self._http.get_json(path, params=params)
+            cache.set(path, params, json_data)
+        return json_data
+
+    async def _get(self, path: str, resource_id: int):
+        with self._span("get", path, resource_id=resource_id):
+            json_data = await self._get_json("{}/{}".format(path, resource_id))
+            return self.resource_class(self, json_data["data"])
+
+    async def _count(self, path: str) -> int:
+        with self._span("count", path):
+            json_data = await self._get_json(path, params={"per_page": 1})
+            return json_data["meta"]["pagination"]["total"]
+
+    async def _delete(self, path: str, resource_id: int) -> None:
+        with self._span("delete", path, resource_id=resource_id):
+            await self._http.delete(path, resource_id)
+            self._invalidate(path)
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "msgpack is required for the msgpack format: "
+            "pip install cachet-client[msgpack]"
+        )
+    return msgpack
+
+
+def _unknown_format(fmt: str) -> str:
+    return "Unknown format '{}'. Supported: {}".format(fmt, ", ".join(DUMP_FORMATS))
@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from cachetclient import utils
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache with time to live for json responses.
+
+    Used by the managers for ``get()``, ``list()`` and ``count()``
+    when passed to the http client. Writes (create, update, delete)
+    through the same client invalidate all cached responses for
+    the written path, its sub paths and its parent paths.
+    Updating a component will for example invalidate cached
+    components and component groups.
+
+    Example::
+
+        cache = ResponseCache(ttl=30, maxsize=2048, ttls={"components/groups": 300})
+    """
+
+    def __init__(
+        self, ttl: float = 60.0, maxsize: int = 1024, ttls: Dict[str, float] = None
+    ):
+        """
+        Keyword Args:
+            ttl (float): Default seconds a response is cached
+            maxsize (int): Max number of cached responses
+            ttls (dict): Seconds to cache responses per path prefix, for example
+                         ``{"components": 300, "metrics/{}/points": 10}``.
+                         The longest matching prefix is used.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = {prefix.strip("/"): value for prefix, value in (ttls or {}).items()}
+        self._entries: "OrderedDict[Hashable, Tuple[str, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """int: Number of lookups served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """int: Number of lookups not in the cache"""
+        return self._misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """float: Ratio of lookups served from the cache"""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Get the time to live for a path.
+
+        Args:
+            path (str): url path relative to base url
+
+        Returns:
+            float: Seconds to cache the response
+        """
+        template = utils.path_template(path.strip("/"))
+        matches = [
+            prefix
+            for prefix in self.ttls
+            if template == prefix or template.startswith(prefix + "/")
+        ]
+        if not matches:
+            return self.ttl
+        return self.ttls[max(matches, key=len)]
+
+    def get(self, path: str, params: dict = None) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            path (str): url path relative to base url
+            params (dict): Query parameters
+
+        Returns:
+            A copy of the cached json data or ``None``
+        """
+        key = self._key(path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            data = entry[2]
+
+        return utils.copy_json(data)
+
+    def set(self, path: str, params: Optional[dict], data: Any) -> None:
+        """
+        Cache a response.
+
+        Args:
+            path (str): url path relative to base url
+            params (dict): Query parameters
+            data: The json data. A copy is stored.
+        """
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+
+        key = self._key(path, params)
+        entry = (path.strip("/"), time.monotonic() + ttl, utils.copy_json(data))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> int:
+        """
+        Remove cached responses for a path, its sub paths and parent paths.
+
+        Args:
+            path (str): url path relative to base url
+
+        Returns:
+            int: Number of removed responses
+        """
+        parts = path.strip("/").split("/")
+        with self._lock:
+            keys = [
+                key
+                for key, (entry_path, _, _) in self._entries.items()
+                if self._related(parts, entry_path.split("/"))
+            ]
+            for key in keys:
+                del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _related(a: list, b: list) -> bool:
+        """Check if one path is the same as or a prefix of the other"""
+        size = min(len(a), len(b))
+        return a[:size] == b[:size]
+
+    @staticmethod
+    def _key(path: str, params: Optional[dict]) -> Hashable:
+        return path.strip("/"), tuple(sorted((params or {}).items()))
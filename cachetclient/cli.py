@@ -1,6 +1,407 @@
-# import os
+"""
+The ``cachet`` command line tool.
+
+Every resource has ``list``, ``count``, ``get``, ``create``, ``update``
+and ``delete`` subcommands when supported by its manager::
+
+    cachet components list
+    cachet components get 1 2 3
+    cachet components create name=Website status=1 tags=web,public
+    cachet components update id=1 status=4
+    cachet components update id=1 name=Website
+    cachet components delete id=1
+    cachet points list --metric-id 1
+
+Fields are passed as ``key=value`` arguments. Values of numeric and
+boolean fields (see ``JSON_FIELDS``) are parsed as json, so ``status=1``
+is an integer and ``visible=true`` a boolean. Other values are kept as
+strings, so ``name=123`` is the string ``"123"``.
+Updates only change the given fields. Fields the manager requires,
+such as the component ``status``, keep their current value when omitted.
+With ``--input ndjson`` or ``--input csv`` one record per line is read from
+stdin instead and the records are processed concurrently by ``--workers``
+threads sharing one client::
+
+    cat components.ndjson | cachet --workers 16 components update --input ndjson
+
+Results are written to stdout as ndjson (or csv with ``--output csv``)
+in the order of the input. Failed records are reported on stderr
+and make the command exit with status 1.
+
+The endpoint and token are read from the ``CACHET_ENDPOINT`` and
+``CACHET_API_TOKEN`` environment variables unless passed as options.
+"""
+
+import argparse
+import csv
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import cachetclient
+from cachetclient import utils
+
+#: Command name: client attribute of the manager
+RESOURCES = {
+    "components": "components",
+    "groups": "component_groups",
+    "incidents": "incidents",
+    "metrics": "metrics",
+    "points": "metric_points",
+    "schedules": "schedules",
+    "subscribers": "subscribers",
+}
+
+ACTIONS = ("list", "count", "get", "create", "update", "delete")
+
+#: Fields with json values (numbers and booleans) in csv and ``key=value`` input.
+#: Values of other fields are kept as strings.
+JSON_FIELDS = (
+    "id",
+    "status",
+    "order",
+    "group_id",
+    "collapsed",
+    "enabled",
+    "visible",
+    "stickied",
+    "notify",
+    "verify",
+    "component_id",
+    "component_status",
+    "incident_id",
+    "metric_id",
+    "value",
+    "default_value",
+    "display_chart",
+)
+
+#: Fields holding comma separated lists in csv and ``key=value`` input
+LIST_FIELDS = ("tags", "components", "template_vars")
+
+#: Fields holding timestamps (``YYYY-MM-DD HH:MM:SS`` or unix time)
+DATETIME_FIELDS = (
+    "timestamp",
+    "created_at",
+    "occurred_at",
+    "scheduled_at",
+    "completed_at",
+)
+
+
+def execute_from_command_line(argv: List[str] = None) -> None:
+    """Entry point of the ``cachet`` console script"""
+    sys.exit(main(argv))
+
+
+def main(
+    argv: List[str] = None,
+    stdin: TextIO = None,
+    stdout: TextIO = None,
+    stderr: TextIO = None,
+) -> int:
+    """
+    Run the command line tool.
+
+    Args:
+        argv (list): Command line arguments excluding the program name
+
+    Keyword Args:
+        stdin: Input stream. Defaults to ``sys.stdin``
+        stdout: Output stream. Defaults to ``sys.stdout``
+        stderr: Error stream. Defaults to ``sys.stderr``
+
+    Returns:
+        int: Exit status
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        records = _read_records(args, stdin)
+        client = cachetclient.Client(
+            endpoint=args.endpoint,
+            api_token=args.token,
+            verify_tls=not args.insecure,
+            timeout=args.timeout,
+            pool_size=max(10, args.workers),
+        )
+    except ValueError as ex:
+        print("error: {}".format(ex), file=stderr)
+        return 2
+
+    manager = getattr(client, RESOURCES[args.resource])
+    writer = _Writer(stdout, args.output)
+
+    if args.action in ("list", "count"):
+        try:
+            _list_or_count(manager, args, writer, stdout)
+        except Exception as ex:
+            print("error: {}".format(ex), file=stderr)
+            return 1
+        return 0
+
+    operation = _operation(manager, args.resource, args.action)
+    failed = 0
+    for record, result, error in _run(operation, records, args.workers):
+        if error is not None:
+            failed += 1
+            print(
+                json.dumps({"error": str(error), "record": record}, default=str),
+                file=stderr,
+            )
+        elif result is not None:
+            writer.write(result.attrs)
+
+    return 1 if failed else 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="cachet",
+        description="Command line client for the Cachet API",
+    )
+    parser.add_argument("--endpoint", help="The api endpoint (CACHET_ENDPOINT)")
+    parser.add_argument("--token", help="The api token (CACHET_API_TOKEN)")
+    parser.add_argument("--timeout", type=float, help="Request timeout in seconds")
+    parser.add_argument(
+        "--insecure", action="store_true", help="Do not verify tls certificates"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Number of concurrent requests"
+    )
+    parser.add_argument(
+        "--output", choices=("ndjson", "csv"), default="ndjson", help="Output format"
+    )
+
+    resources = parser.add_subparsers(dest="resource", metavar="resource")
+    resources.required = True
+    for name in RESOURCES:
+        resource = resources.add_parser(name, help="Manage {}".format(name))
+        actions = resource.add_subparsers(dest="action", metavar="action")
+        actions.required = True
+        for action in ACTIONS:
+            if action == "get" and name in ("points", "subscribers"):
+                continue
+            if action == "update" and name in ("metrics", "points", "subscribers"):
+                continue
+
+            sub = actions.add_parser(action, help="{} {}".format(action, name))
+            if action in ("list", "count") and name == "points":
+                sub.add_argument("--metric-id", type=int, required=True)
+            if action == "list":
+                sub.add_argument("--per-page", type=int, default=100)
+            if action == "get":
+                sub.add_argument("ids", nargs="*", type=int, help="Resource ids")
+            if action in ("create", "update", "delete"):
+                sub.add_argument(
+                    "fields",
+                    nargs="*",
+                    metavar="key=value",
+                    help="Fields of a single record",
+                )
+            if action in ("get", "create", "update", "delete"):
+                sub.add_argument(
+                    "--input",
+                    choices=("ndjson", "csv"),
+                    help="Read one record per line from stdin",
+                )
+
+    return parser
+
+
+def parse_value(key: str, value: Any) -> Any:
+    """
+    Convert a raw csv or ``key=value`` value.
+
+    Only values of ``JSON_FIELDS`` are parsed as json. Values of other
+    fields stay strings, so a name ``123`` or a description ``null``
+    is not changed.
+
+    Args:
+        key (str): The field name
+        value: The raw value
+
+    Returns:
+        The converted value
+    """
+    if isinstance(value, str) and key in JSON_FIELDS:
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+
+    if key in LIST_FIELDS and isinstance(value, (str, int)):
+        value = [part.strip() for part in str(value).split(",") if part.strip()]
+        if key == "components":
+            value = [int(part) for part in value]
+    elif key in DATETIME_FIELDS and value is not None:
+        if isinstance(value, str) and value.replace(".", "", 1).isdigit():
+            # Unix time
+            value = float(value)
+        if isinstance(value, (int, float)):
+            value = datetime.fromtimestamp(value)
+        else:
+            value = utils.to_datetime(value)
+
+    return value
+
+
+def _list_or_count(
+    manager, args: argparse.Namespace, writer: "_Writer", stdout: TextIO
+) -> None:
+    """Run the list or count action"""
+    if args.action == "list":
+        params = {"per_page": args.per_page, "workers": args.workers}
+        if args.resource == "points":
+            resources = manager.list(args.metric_id, **params)
+        else:
+            resources = manager.list(**params)
+        for resource in resources:
+            writer.write(resource.attrs)
+        return
+
+    count = (
+        manager.count(args.metric_id) if args.resource == "points" else manager.count()
+    )
+    print(count, file=stdout)
+
+
+def _read_records(args: argparse.Namespace, stdin: TextIO) -> List[Dict[str, Any]]:
+    """Read the records to process from the arguments or stdin"""
+    if args.action in ("list", "count"):
+        return []
+
+    if args.input:
+        if getattr(args, "ids", None) or getattr(args, "fields", None):
+            raise ValueError("arguments can not be combined with --input")
+        rows = _read_stdin(stdin, args.input)
+    elif args.action == "get":
+        rows = ({"id": resource_id} for resource_id in args.ids)
+    else:
+        rows = [dict(_split_field(field) for field in args.fields)]
+
+    return [
+        {key: parse_value(key, value) for key, value in row.items()} for row in rows
+    ]
+
+
+def _read_stdin(stdin: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    if fmt == "csv":
+        for row in csv.DictReader(stdin):
+            yield {key: value for key, value in row.items() if value not in ("", None)}
+        return
+
+    for num, line in enumerate(stdin, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            raise ValueError("line {} is not valid json".format(num))
+        if not isinstance(row, dict):
+            raise ValueError("line {} is not a json object".format(num))
+        yield row
+
+
+def _split_field(field: str):
+    key, sep, value = field.partition("=")
+    if not sep:
+        raise ValueError("'{}' is not a key=value pair".format(field))
+    return key, value
+
+
+def _operation(manager, resource: str, action: str) -> Callable[[dict], Any]:
+    """Get a function applying an action to a record"""
+
+    def pop_id(record: dict, key: str = "id") -> int:
+        if key not in record:
+            raise ValueError("'{}' is required".format(key))
+        return record.pop(key)
+
+    if action == "get":
+        return lambda record: manager.get(pop_id(record))
+    if action == "create":
+        return lambda record: manager.create(**record)
+    if action == "update":
+        import inspect
+
+        # Fields such as the component status are required by update().
+        # Records without them keep the current value so updates can be partial.
+        required = [
+            param.name
+            for param in inspect.signature(manager.update).parameters.values()
+            if param.kind == param.KEYWORD_ONLY and param.default is param.empty
+        ]
+
+        def update(record: dict) -> Any:
+            resource_id = pop_id(record)
+            missing = [field for field in required if field not in record]
+            if missing:
+                current = manager.get(resource_id)
+                record.update((field, current.get(field)) for field in missing)
+            return manager.update(resource_id, **record)
+
+        return update
+    if resource == "points":
+        return lambda record: manager.delete(
+            pop_id(record, "metric_id"), pop_id(record)
+        )
+    return lambda record: manager.delete(pop_id(record))
+
+
+def _run(
+    operation: Callable[[dict], Any], records: List[dict], workers: int
+) -> Iterable[tuple]:
+    """Apply the operation to all records yielding ``(record, result, error)`` in order"""
+
+    def run(record: dict) -> tuple:
+        try:
+            return record, operation(dict(record)), None
+        except Exception as ex:
+            return record, None, ex
+
+    if workers <= 1 or len(records) <= 1:
+        return map(run, records)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, records))
+
+
+class _Writer:
+    """Writes resources as ndjson or csv"""
+
+    def __init__(self, stream: TextIO, fmt: str):
+        self._stream = stream
+        self._fmt = fmt
+        self._csv: Optional[csv.DictWriter] = None
 
+    def write(self, data: dict) -> None:
+        if self._fmt == "ndjson":
+            print(json.dumps(data, default=str), file=self._stream)
+            return
 
-def execute_from_command_line():
-    print(sys.argv)
+        if self._csv is None:
+            self._csv = csv.DictWriter(
+                self._stream, fieldnames=list(data), extrasaction="ignore"
+            )
+            self._csv.writeheader()
+        self._csv.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in data.items()
+            }
+        )
@@ -1,7 +1,16 @@
 import os
+from typing import Callable, Dict, Iterable
 
 from cachetclient import v1
-from cachetclient.httpclient import HttpClient
+from cachetclient.cache import ResponseCache
+from cachetclient.codec import JsonCodec
+from cachetclient.httpclient import (
+    AsyncHttpClient,
+    HttpClient,
+    RequestEvent,
+    RetryPolicy,
+)
+from cachetclient.ratelimit import RateLimiter
 
 
 def Client(
@@ -9,6 +18,18 @@ def Client(
     api_token: str = None,
     version: str = None,
     verify_tls: bool = True,
+    timeout: float = None,
+    user_agent: str = None,
+    pool_size: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    retry: RetryPolicy = None,
+    rate_limiter: RateLimiter = None,
+    cache: ResponseCache = None,
+    conditional: bool = False,
+    codec: JsonCodec = None,
+    hooks: Dict[str, Iterable[Callable[[RequestEvent], None]]] = None,
+    compact: bool = False,
 ) -> v1.Client:
     """
     Creates a cachet client. Use this fuction to create clients to ensure
@@ -21,7 +42,133 @@ def Client(
         version (str): The api version. If not specified the version will be derived from the
                        endpoint url. The value "1" will create a v1 cachet client.
         verify_tls (bool): Enable/disable tls verify. When using self signed certificates this has to be ``False``.
+        timeout (float): Request timeout in seconds
+        user_agent (str): Custom user agent string
+        pool_size (int): Max number of connections kept open to the server.
+                         Should be at least the number of threads sharing the client.
+        pool_block (bool): Wait for a free connection when the pool is exhausted
+                           instead of opening a throwaway connection
+        keep_alive (bool): Reuse connections between requests
+        retry (RetryPolicy): Retry transient failures such as ``429`` and ``503`` responses
+        rate_limiter (RateLimiter): Client side rate limits
+        cache (ResponseCache): Cache ``get()``, ``list()`` and ``count()`` responses
+        conditional (bool): Use conditional requests (``ETag`` / ``If-Modified-Since``) for reads
+        codec (JsonCodec): Json codec. Defaults to the fastest installed of orjson, ujson and json.
+        hooks (dict): Request hooks per event, for example ``{"after_response": [func]}``.
+                      See :py:meth:`HttpClient.add_hook`
+        compact (bool): Create resources without an instance ``__dict__``
+                        using less memory. See :py:attr:`Manager.compact`
     """
+    endpoint, api_token = _resolve_credentials(endpoint, api_token, version)
+    return v1.Client(
+        HttpClient(
+            endpoint,
+            api_token,
+            timeout=timeout,
+            verify_tls=verify_tls,
+            user_agent=user_agent,
+            pool_size=pool_size,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            conditional=conditional,
+            codec=codec,
+            hooks=hooks,
+        ),
+        compact=compact,
+    )
+
+
+def AsyncClient(
+    endpoint: str = None,
+    api_token: str = None,
+    version: str = None,
+    verify_tls: bool = True,
+    timeout: float = None,
+    user_agent: str = None,
+    pool_size: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    retry: RetryPolicy = None,
+    rate_limiter: RateLimiter = None,
+    cache: ResponseCache = None,
+    conditional: bool = False,
+    codec: JsonCodec = None,
+    hooks: Dict[str, Iterable[Callable[[RequestEvent], None]]] = None,
+    max_workers: int = None,
+    compact: bool = False,
+) -> v1.AsyncClient:
+    """
+    Creates an asyncio cachet client. Manager methods return awaitables
+    and ``list()`` methods return async generators.
+
+    Requests run in a thread pool of ``max_workers`` threads
+    (``pool_size``, so 10, by default). Any number of calls can be
+    awaited concurrently, but only that many requests are in flight at
+    a time and the rest wait for a free worker. Raise both ``pool_size``
+    and ``max_workers`` for more parallel requests.
+
+    Example::
+
+        async with cachetclient.AsyncClient() as client:
+            component = await client.components.get(1)
+            async for incident in client.incidents.list():
+                print(incident.name)
+
+    Args:
+        endpoint (str): The api endpoint. for example 'https://status.examples.test/api/v1'.
+                        The endpoint can also be specified using the ``CACHET_ENDPOINT`` env variable.
+        api_token (str): The api token. Can also be specified using ``CACHET_API_TOKEN`` env variable.
+        version (str): The api version. If not specified the version will be derived from the
+                       endpoint url. The value "1" will create a v1 cachet client.
+        verify_tls (bool): Enable/disable tls verify. When using self signed certificates this has to be ``False``.
+        timeout (float): Request timeout in seconds
+        user_agent (str): Custom user agent string
+        pool_size (int): Max number of connections kept open to the server.
+                         Should be at least the number of threads sharing the client.
+        pool_block (bool): Wait for a free connection when the pool is exhausted
+                           instead of opening a throwaway connection
+        keep_alive (bool): Reuse connections between requests
+        retry (RetryPolicy): Retry transient failures such as ``429`` and ``503`` responses
+        rate_limiter (RateLimiter): Client side rate limits
+        cache (ResponseCache): Cache ``get()``, ``list()`` and ``count()`` responses
+        conditional (bool): Use conditional requests (``ETag`` / ``If-Modified-Since``) for reads
+        codec (JsonCodec): Json codec. Defaults to the fastest installed of orjson, ujson and json.
+        hooks (dict): Request hooks per event, for example ``{"after_response": [func]}``.
+                      See :py:meth:`HttpClient.add_hook`
+        max_workers (int): Max number of requests in flight at the same time. Defaults to ``pool_size``.
+        compact (bool): Create resources without an instance ``__dict__``
+                        using less memory. See :py:attr:`Manager.compact`
+    """
+    endpoint, api_token = _resolve_credentials(endpoint, api_token, version)
+    return v1.AsyncClient(
+        AsyncHttpClient(
+            HttpClient(
+                endpoint,
+                api_token,
+                timeout=timeout,
+                verify_tls=verify_tls,
+                user_agent=user_agent,
+                pool_size=pool_size,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+                retry=retry,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                conditional=conditional,
+                codec=codec,
+                hooks=hooks,
+            ),
+            max_workers=max_workers,
+        ),
+        compact=compact,
+    )
+
+
+def _resolve_credentials(endpoint: str, api_token: str, version: str):
+    """Obtain endpoint and token from arguments or environment variables"""
     if not api_token:
         api_token = os.environ.get("CACHET_API_TOKEN")
 
@@ -45,7 +192,7 @@ def Client(
     if not version:
         version = detect_version(endpoint)
 
-    return v1.Client(HttpClient(endpoint, api_token, verify_tls=verify_tls))
+    return endpoint, api_token
 
 
 def detect_version(endpoint: str) -> str:
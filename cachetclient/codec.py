@@ -0,0 +1,115 @@
+from typing import Any, Callable, Optional, Union
+
+#: Supported json libraries in order of preference
+CODECS = ("orjson", "ujson", "json")
+
+_default: Optional["JsonCodec"] = None
+
+
+class JsonCodec:
+    """
+    Encodes and decodes json request and response bodies.
+
+    Use :py:func:`get_codec` to create a codec for one of the
+    supported libraries, or pass any ``loads`` / ``dumps`` pair::
+
+        codec = JsonCodec("custom", loads=my_loads, dumps=my_dumps)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], Union[bytes, str]],
+    ):
+        """
+        Args:
+            name (str): Name of the codec
+            loads: Function decoding a json document from bytes or str
+            dumps: Function encoding an object as json bytes or str
+        """
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a json document.
+
+        Args:
+            data: utf-8 encoded bytes or a str
+
+        Returns:
+            The decoded data
+
+        Raises:
+            ValueError: if the data is not valid json
+        """
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as json.
+
+        Args:
+            obj: The object to encode
+
+        Returns:
+            bytes: utf-8 encoded json
+        """
+        data = self._dumps(obj)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return data
+
+    def __repr__(self) -> str:
+        return "<JsonCodec {}>".format(self.name)
+
+
+def get_codec(name: str = None) -> JsonCodec:
+    """
+    Get a json codec.
+
+    Without a name the fastest installed library is used:
+    ``orjson``, then ``ujson`` and finally the ``json`` module.
+
+    Args:
+        name (str): ``orjson``, ``ujson`` or ``json``
+
+    Returns:
+        :py:class:`JsonCodec` instance
+
+    Raises:
+        ValueError: if the name is unknown
+        ImportError: if the named library is not installed
+    """
+    global _default
+
+    if name is None:
+        if _default is None:
+            for candidate in CODECS:
+                try:
+                    _default = get_codec(candidate)
+                    break
+                except ImportError:
+                    continue
+        return _default
+
+    if name == "orjson":
+        import orjson
+
+        return JsonCodec("orjson", orjson.loads, orjson.dumps)
+
+    if name == "ujson":
+        import ujson
+
+        return JsonCodec("ujson", ujson.loads, ujson.dumps)
+
+    if name == "json":
+        import json
+
+        return JsonCodec("json", json.loads, json.dumps)
+
+    raise ValueError(
+        "Unknown json codec '{}'. Supported: {}".format(name, ", ".join(CODECS))
+    )
@@ -1,16 +1,254 @@
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Iterable,
+    List,
+    Optional,
 )
+import functools
 import logging
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin
 
-import requests
+from cachetclient import tracing, utils
+from cachetclient.cache import ResponseCache
+from cachetclient.codec import JsonCodec, get_codec
+from cachetclient.ratelimit import RateLimiter
+
+if TYPE_CHECKING:  # pragma: no cover
+    # requests and asyncio are imported on first use to keep imports cheap
+    import requests
 
 logger = logging.getLogger(__name__)
 
+#: Events hooks can be added for with :py:meth:`HttpClient.add_hook`
+HOOK_EVENTS = ("before_request", "after_response", "on_error")
+
+
+class RetryPolicy:
+    """
+    Decides if and when a failed request is retried.
+
+    Retries use exponential backoff with full jitter: the n-th retry waits
+    a random time between 0 and ``backoff_factor * 2 ** n`` seconds (capped
+    at ``max_backoff``). A ``Retry-After`` header from the server is honored
+    instead when present.
+
+    Only idempotent methods are retried on status codes and connection
+    errors. Other methods (``POST``) are only retried on
+    ``non_idempotent_status_codes`` (by default ``429 Too Many Requests``
+    where the server rejected the request) and when the connection
+    could not be established at all.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        status_codes: Iterable[int] = (429, 502, 503, 504),
+        methods: Iterable[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        non_idempotent_status_codes: Iterable[int] = (429,),
+        respect_retry_after: bool = True,
+    ):
+        """
+        Keyword Args:
+            max_retries (int): Max number of retries per request
+            backoff_factor (float): Base delay in seconds
+            max_backoff (float): Max delay in seconds between attempts
+            jitter (bool): Randomize the delay
+            status_codes (Iterable[int]): Status codes to retry
+            methods (Iterable[str]): Idempotent methods that are safe to retry
+            non_idempotent_status_codes (Iterable[int]): Status codes where other methods are retried
+            respect_retry_after (bool): Use the ``Retry-After`` header when present
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.non_idempotent_status_codes = frozenset(non_idempotent_status_codes)
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: "requests.Response" = None,
+        exception: Exception = None,
+    ) -> bool:
+        """
+        Check if a failed attempt should be retried.
+
+        Args:
+            method (str): The http method
+            attempt (int): Number of retries done so far
+
+        Keyword Args:
+            response: The failed response
+            exception: The exception raised by the request
+
+        Returns:
+            bool: If the request should be retried
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        idempotent = method.upper() in self.methods
+        if response is not None:
+            if idempotent:
+                return response.status_code in self.status_codes
+            return response.status_code in self.non_idempotent_status_codes
+
+        import requests
+
+        if isinstance(exception, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(exception, (requests.ConnectionError, requests.Timeout)):
+            return idempotent
+
+        return False
+
+    def backoff(self, attempt: int, response: "requests.Response" = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of retries done so far
+
+        Keyword Args:
+            response: The failed response
+
+        Returns:
+            float: Seconds to wait
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def retry_after(response: "requests.Response") -> Optional[float]:
+        """
+        Parse the ``Retry-After`` header in seconds or http date format.
+
+        Returns:
+            float: Seconds to wait or ``None`` if not present or invalid
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestEvent:
+    """
+    A single attempt of a request passed to :py:class:`HttpClient` hooks.
+
+    The same event is passed to ``before_request`` and then to
+    ``after_response`` and/or ``on_error`` as the attempt progresses.
+    Retries create a new event with ``retries`` incremented.
+
+    ``ttfb`` is the time from sending the request until the response
+    headers are parsed and ``total`` includes reading the body.
+    ``dns`` and ``connect`` are always ``None`` since requests does
+    not expose them; they are kept for hooks that can fill them in.
+    All times are in seconds.
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "path_template",
+        "params",
+        "retries",
+        "request_bytes",
+        "status",
+        "bytes",
+        "dns",
+        "connect",
+        "ttfb",
+        "total",
+        "error",
+        "will_retry",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any] = None,
+        retries: int = 0,
+        request_bytes: int = 0,
+    ):
+        """
+        Args:
+            method (str): The http method
+            path (str): url path relative to base url
+
+        Keyword Args:
+            params (dict): Query parameters
+            retries (int): Number of retries done before this attempt
+            request_bytes (int): Size of the request body
+        """
+        self.method = method
+        self.path = path
+        self.path_template = utils.path_template(path)
+        self.params = params
+        self.retries = retries
+        self.request_bytes = request_bytes
+        self.status: Optional[int] = None
+        self.bytes: Optional[int] = None
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.total: Optional[float] = None
+        self.error: Optional[Exception] = None
+        self.will_retry = False
+
+    @property
+    def endpoint(self) -> str:
+        """str: Method and path template, for example ``PUT components/{}``"""
+        return "{} {}".format(self.method, self.path_template)
+
+    def __repr__(self) -> str:
+        return "<RequestEvent {} status={} total={} retries={}>".format(
+            self.endpoint, self.status, self.total, self.retries
+        )
+
 
 class HttpClient:
+    #: Max number of urls validators and bodies are kept for in conditional mode
+    conditional_maxsize = 1024
+
     def __init__(
         self,
         base_url: str,
@@ -18,16 +256,71 @@ class HttpClient:
         timeout: float = None,
         verify_tls: bool = True,
         user_agent: str = None,
+        pool_size: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        cache: ResponseCache = None,
+        conditional: bool = False,
+        codec: JsonCodec = None,
+        hooks: Dict[str, Iterable[Callable[[RequestEvent], None]]] = None,
     ):
-
+        """
+        Args:
+            base_url (str): The api endpoint
+            api_token (str): The api token
+            timeout (float): Request timeout in seconds
+            verify_tls (bool): Enable/disable tls verify
+            user_agent (str): Custom user agent
+            pool_size (int): Max number of connections kept open to the server.
+                             Should be at least the number of threads sharing the client.
+            pool_block (bool): Wait for a free connection when the pool is exhausted
+                               instead of opening a connection that is discarded after use
+            keep_alive (bool): Reuse connections between requests
+            retry (RetryPolicy): Retry failed requests according to this policy
+            rate_limiter (RateLimiter): Wait for the rate limiter before each request
+            cache (ResponseCache): Cache responses read by the managers
+            conditional (bool): Send ``If-None-Match`` / ``If-Modified-Since`` in ``get_json()``
+                                reusing the previously decoded body on ``304 Not Modified``
+            codec (JsonCodec): Encodes request and decodes response bodies.
+                               Defaults to the fastest installed json library.
+            hooks (dict): Callbacks per event. See :py:meth:`add_hook`
+        """
         self.base_url = base_url
         if not self.base_url.endswith("/"):
             self.base_url += "/"
         self.verify_tls = verify_tls
         self.timeout = timeout
         self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.conditional = conditional
+        self.codec = codec or get_codec()
+        self._hooks: Dict[str, List[Callable[[RequestEvent], None]]] = {
+            event: [] for event in HOOK_EVENTS
+        }
+        self._hooks_lock = threading.Lock()
+        for event, callbacks in (hooks or {}).items():
+            for callback in callbacks:
+                self.add_hook(event, callback)
+        self._retries = Counter()
+        self._retries_lock = threading.Lock()
+        self._validators: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._validators_lock = threading.Lock()
+        self._not_modified = 0
+
+        import requests
+        from requests.adapters import HTTPAdapter
 
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size, pool_block=pool_block)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._session.headers.update(
             {
                 "X-Cachet-Token": api_token,
@@ -37,39 +330,373 @@ class HttpClient:
         )
         if user_agent:
             self._session.headers.update({"User-Agent": user_agent})
+        if not keep_alive:
+            self._session.headers.update({"Connection": "close"})
 
-    def get(self, path, params=None) -> requests.Response:
+    def get(self, path, params=None) -> "requests.Response":
         return self.request("GET", path, params=params)
 
-    def post(self, path, data) -> requests.Response:
+    def post(self, path, data) -> "requests.Response":
         return self.request("POST", path, data=data)
 
-    def put(self, path, data) -> requests.Response:
+    def put(self, path, data) -> "requests.Response":
         return self.request("PUT", path, data=data)
 
-    def delete(self, path, resource_id) -> requests.Response:
+    def delete(self, path, resource_id) -> "requests.Response":
         return self.request("DELETE", "{}/{}".format(path, resource_id))
 
+    def get_json(self, path, params=None) -> Any:
+        """
+        Get the decoded json response of a path.
+
+        In conditional mode the ``ETag`` and ``Last-Modified`` validators
+        of the response are stored with the decoded body. The next
+        request for the same url sends them, and on ``304 Not Modified``
+        a copy of the stored body is returned without decoding anything.
+
+        Args:
+            path (str): url path relative to base url
+            params (dict): Query parameters
+
+        Returns:
+            The decoded json response
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire("GET", path)
+
+        return self._get_json(path, params=params)
+
+    def add_hook(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        """
+        Call a function with a :py:class:`RequestEvent` for every request attempt.
+
+        * ``before_request``: before the request is sent
+        * ``after_response``: when a response is received, whatever the status
+        * ``on_error``: when the request failed with an exception or an error status.
+          ``event.error`` holds the exception (``None`` for error statuses)
+          and ``event.will_retry`` tells if the request is retried.
+
+        Hooks are called from the thread sending the request (a worker thread
+        for async clients) and should be fast. Exceptions raised by hooks
+        are logged and ignored.
+
+        Example::
+
+            def observe(event):
+                histogram.labels(event.endpoint).observe(event.total)
+
+            http_client.add_hook("after_response", observe)
+
+        Args:
+            event (str): ``before_request``, ``after_response`` or ``on_error``
+            callback: Function taking the event
+
+        Raises:
+            ValueError: if the event is unknown
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(
+                "Unknown hook event '{}'. Supported: {}".format(
+                    event, ", ".join(HOOK_EVENTS)
+                )
+            )
+        with self._hooks_lock:
+            # Replace the list so requests in flight can iterate without locking
+            self._hooks = dict(self._hooks, **{event: self._hooks[event] + [callback]})
+
+    def remove_hook(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        """
+        Remove a function added with :py:meth:`add_hook`.
+
+        Args:
+            event (str): ``before_request``, ``after_response`` or ``on_error``
+            callback: The function to remove
+
+        Raises:
+            ValueError: if the function is not a hook for the event
+        """
+        with self._hooks_lock:
+            callbacks = list(self._hooks.get(event, []))
+            callbacks.remove(callback)
+            self._hooks = dict(self._hooks, **{event: callbacks})
+
+    @property
+    def not_modified(self) -> int:
+        """int: Number of ``get_json()`` calls served from a ``304 Not Modified`` response"""
+        return self._not_modified
+
     def request(
         self,
         method: str,
         path: str,
         params: Dict[str, Any] = None,
         data: Dict[str, Any] = None,
-    ) -> requests.Response:
+        headers: Dict[str, str] = None,
+    ) -> "requests.Response":
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, path)
+
+        return self._send(method, path, params=params, data=data, headers=headers)
+
+    def _get_json(self, path, params=None) -> Any:
+        """get_json() without waiting for the rate limiter"""
+        if not self.conditional:
+            response = self._send("GET", path, params=params)
+            return tracing.decode(self.codec.loads, response.content)
+
+        key = (path.strip("/"), tuple(sorted((params or {}).items())))
+        with self._validators_lock:
+            entry = self._validators.get(key)
+
+        headers = {}
+        if entry is not None:
+            etag, last_modified, _ = entry
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self._send("GET", path, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            with self._validators_lock:
+                self._not_modified += 1
+                if key in self._validators:
+                    self._validators.move_to_end(key)
+            return utils.copy_json(entry[2])
+
+        data = tracing.decode(self.codec.loads, response.content)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._validators_lock:
+            if etag or last_modified:
+                self._validators[key] = (etag, last_modified, utils.copy_json(data))
+                self._validators.move_to_end(key)
+                while len(self._validators) > self.conditional_maxsize:
+                    self._validators.popitem(last=False)
+            else:
+                self._validators.pop(key, None)
+
+        return data
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any] = None,
+        data: Dict[str, Any] = None,
+        headers: Dict[str, str] = None,
+    ) -> "requests.Response":
+        """
+        Send a request. The caller waits for the rate limiter before
+        the first attempt and every retry waits here for its own token.
+        """
+        import requests
+
         url = urljoin(self.base_url, path)
-        response = self._session.request(
-            method,
-            url,
-            params=params,
-            json=data,
-            verify=self.verify_tls,
-            timeout=self.timeout,
-        )
-        logger.debug("%s %s", method, response.url)
-        if response.ok:
-            return response
+        body = self.codec.dumps(data) if data is not None else None
+        hooks = self._hooks
+        observed = any(hooks.values())
+        attempt = 0
+        while True:
+            if attempt and self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, path)
+            event = None
+            if observed:
+                event = RequestEvent(
+                    method,
+                    path,
+                    params=params,
+                    retries=attempt,
+                    request_bytes=len(body or b""),
+                )
+                self._emit(hooks, "before_request", event)
+            start = time.perf_counter()
+
+            try:
+                response = self._session.request(
+                    method,
+                    url,
+                    params=params,
+                    data=body,
+                    headers=headers,
+                    verify=self.verify_tls,
+                    timeout=self.timeout,
+                )
+            except requests.RequestException as ex:
+                retry = self._should_retry(method, path, attempt, exception=ex)
+                if event is not None:
+                    event.total = time.perf_counter() - start
+                    event.error = ex
+                    event.will_retry = retry
+                    self._emit(hooks, "on_error", event)
+                if not retry:
+                    raise
+                logger.debug("%s %s failed: %s", method, url, ex)
+                time.sleep(self.retry.backoff(attempt))
+                attempt += 1
+                continue
+
+            logger.debug("%s %s", method, response.url)
+            if event is not None:
+                event.status = response.status_code
+                event.bytes = len(response.content)
+                event.ttfb = response.elapsed.total_seconds()
+                event.total = time.perf_counter() - start
+                self._emit(hooks, "after_response", event)
+
+            if response.ok:
+                return response
 
-        logger.debug(response.text)
+            logger.debug(response.text)
+            retry = self._should_retry(method, path, attempt, response=response)
+            if event is not None:
+                event.will_retry = retry
+                self._emit(hooks, "on_error", event)
+            if not retry:
+                break
+
+            time.sleep(self.retry.backoff(attempt, response=response))
+            attempt += 1
+
+        # Only error statuses that are not retried leave the loop and
+        # response.ok is False exactly when raise_for_status() raises
         response.raise_for_status()
-        raise RuntimeError
+
+    @staticmethod
+    def _emit(hooks: dict, name: str, event: RequestEvent) -> None:
+        """Call the hooks of an event ignoring their errors"""
+        for callback in hooks[name]:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("%s hook %r failed", name, callback)
+
+    @property
+    def retries(self) -> Dict[str, int]:
+        """dict: Number of retries per endpoint, for example ``{'PUT components/{}': 2}``"""
+        with self._retries_lock:
+            return dict(self._retries)
+
+    def _should_retry(
+        self, method: str, path: str, attempt: int, response=None, exception=None
+    ) -> bool:
+        """Consult the retry policy and count the retry"""
+        if self.retry is None:
+            return False
+
+        if not self.retry.should_retry(
+            method, attempt, response=response, exception=exception
+        ):
+            return False
+
+        with self._retries_lock:
+            self._retries["{} {}".format(method, utils.path_template(path))] += 1
+        return True
+
+
+class AsyncHttpClient:
+    """
+    Asyncio wrapper around :py:class:`HttpClient`.
+
+    Requests are dispatched to a bounded thread pool sharing the
+    session (and connection pool) of the wrapped client, so coroutines
+    never block the event loop. Any number of concurrent calls can be
+    awaited; at most ``max_workers`` requests are in flight at a time.
+    """
+
+    def __init__(self, http_client: HttpClient, max_workers: int = None):
+        """
+        Args:
+            http_client: The http client performing the actual requests
+            max_workers (int): Max number of requests in flight.
+                               Defaults to the pool size of the http client.
+        """
+        self._http = http_client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or getattr(http_client, "pool_size", 10),
+            thread_name_prefix="cachetclient",
+        )
+
+    @property
+    def http_client(self) -> HttpClient:
+        """HttpClient: The wrapped http client"""
+        return self._http
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """ResponseCache: The response cache of the wrapped client"""
+        return getattr(self._http, "cache", None)
+
+    @property
+    def codec(self) -> Optional[JsonCodec]:
+        """JsonCodec: The json codec of the wrapped client"""
+        return getattr(self._http, "codec", None)
+
+    def add_hook(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        """Add a hook to the wrapped client. See :py:meth:`HttpClient.add_hook`"""
+        self._http.add_hook(event, callback)
+
+    def remove_hook(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        """Remove a hook from the wrapped client. See :py:meth:`HttpClient.remove_hook`"""
+        self._http.remove_hook(event, callback)
+
+    async def get(self, path, params=None) -> "requests.Response":
+        return await self.request("GET", path, params=params)
+
+    async def post(self, path, data) -> "requests.Response":
+        return await self.request("POST", path, data=data)
+
+    async def put(self, path, data) -> "requests.Response":
+        return await self.request("PUT", path, data=data)
+
+    async def delete(self, path, resource_id) -> "requests.Response":
+        return await self.request("DELETE", "{}/{}".format(path, resource_id))
+
+    async def get_json(self, path, params=None) -> Any:
+        """Get the decoded json response of a path. See :py:meth:`HttpClient.get_json`"""
+        get_json = self._http.get_json
+        rate_limiter = getattr(self._http, "rate_limiter", None)
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async("GET", path)
+            get_json = self._http._get_json
+
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        # Worker threads do not inherit the current span
+        get_json = tracing.bind(tracing.current_span(), get_json)
+        return await loop.run_in_executor(
+            self._executor, functools.partial(get_json, path, params=params)
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any] = None,
+        data: Dict[str, Any] = None,
+    ) -> "requests.Response":
+        send = self._http.request
+        rate_limiter = getattr(self._http, "rate_limiter", None)
+        if rate_limiter is not None:
+            # Wait in the event loop instead of blocking a worker thread
+            await rate_limiter.acquire_async(method, path)
+            send = self._http._send
+
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(send, method, path, params=params, data=data),
+        )
+
+    async def close(self) -> None:
+        """Shut down the worker threads once the pending requests are done"""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        # Waiting for the workers in the event loop thread would block it
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
@@ -0,0 +1,164 @@
+import threading
+import time
+from typing import List, Tuple
+
+from cachetclient import utils
+
+
+class TokenBucket:
+    """
+    Token bucket refilling ``rate`` tokens per second up to ``burst`` tokens.
+
+    Callers reserve a token and are told how long to wait for it.
+    Reservations are handed out in order, so waiting callers are
+    served first come first served.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Max number of tokens. Defaults to ``rate`` (min 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        Returns:
+            float: Seconds to wait before the token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Client side rate limiter for :py:class:`~cachetclient.httpclient.HttpClient`.
+
+    Limits apply to all requests or only to requests matching a
+    method and/or path prefix. Path prefixes are matched against the
+    path template where ids are replaced by ``{}``, for example
+    ``metrics/{}/points``. A request must get a token from every
+    matching limit. Blocking callers sleep and async callers await
+    until the tokens are available.
+
+    Example::
+
+        limiter = RateLimiter()
+        limiter.add_limit(20, burst=40)
+        limiter.add_limit(2, method="POST", path="incidents")
+        limiter.add_limit(10, path="metrics/{}/points")
+    """
+
+    def __init__(self):
+        self._limits: List[Tuple[str, str, TokenBucket]] = []
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self) -> int:
+        """int: Number of requests currently waiting for tokens"""
+        return self._waiting
+
+    def add_limit(
+        self, rate: float, burst: int = None, method: str = None, path: str = None
+    ) -> None:
+        """
+        Add a limit.
+
+        Args:
+            rate (float): Requests per second
+
+        Keyword Args:
+            burst (int): Number of requests allowed in a burst
+            method (str): Only limit this http method
+            path (str): Only limit paths starting with this prefix.
+                        ``components`` matches ``components/{}``
+                        but not ``components_archive``.
+        """
+        self._limits.append(
+            (
+                method.upper() if method else None,
+                path.strip("/") if path else None,
+                TokenBucket(rate, burst),
+            )
+        )
+
+    def reserve(self, method: str, path: str) -> float:
+        """
+        Take a token from every matching limit.
+
+        Args:
+            method (str): The http method
+            path (str): url path relative to base url
+
+        Returns:
+            float: Seconds to wait before the request can be sent
+        """
+        method = method.upper()
+        template = utils.path_template(path.strip("/"))
+        delay = 0.0
+        for limit_method, limit_path, bucket in self._limits:
+            if limit_method and limit_method != method:
+                continue
+            if limit_path and not (
+                template == limit_path or template.startswith(limit_path + "/")
+            ):
+                continue
+            delay = max(delay, bucket.reserve())
+        return delay
+
+    def acquire(self, method: str, path: str) -> float:
+        """
+        Block until the request is allowed.
+
+        Returns:
+            float: Seconds waited
+        """
+        delay = self.reserve(method, path)
+        if delay > 0:
+            self._wait(1)
+            try:
+                time.sleep(delay)
+            finally:
+                self._wait(-1)
+        return delay
+
+    async def acquire_async(self, method: str, path: str) -> float:
+        """
+        Wait until the request is allowed without blocking the event loop.
+
+        Returns:
+            float: Seconds waited
+        """
+        delay = self.reserve(method, path)
+        if delay > 0:
+            import asyncio
+
+            self._wait(1)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._wait(-1)
+        return delay
+
+    def _wait(self, delta: int) -> None:
+        with self._lock:
+            self._waiting += delta
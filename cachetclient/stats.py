@@ -0,0 +1,347 @@
+"""
+Client statistics in the OpenMetrics / Prometheus text format.
+
+:py:class:`StatsCollector` aggregates the requests of one or more
+clients through the http client hooks. Long running processes can
+expose the statistics for scraping without any extra dependency::
+
+    from cachetclient.cache import ResponseCache
+    from cachetclient.stats import StatsCollector
+
+    stats = StatsCollector()
+    cache = ResponseCache()
+    client = cachetclient.Client(cache=cache, hooks=stats.hooks())
+    stats.track_cache(cache)
+    stats.start_http_server(9100)
+"""
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple
+
+from cachetclient.cache import ResponseCache
+from cachetclient.httpclient import RequestEvent
+
+if TYPE_CHECKING:  # pragma: no cover
+    from http.server import HTTPServer
+
+#: Default upper bounds of the latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class StatsCollector:
+    """
+    Aggregates http client traffic into metrics.
+
+    * ``<prefix>_request_duration_seconds``: latency histogram
+      per method and path template
+    * ``<prefix>_requests``: responses per method, path template and status
+    * ``<prefix>_request_errors``: failed attempts per method, path template
+      and status (or exception name for connection errors)
+    * ``<prefix>_request_retries``: retried attempts per method and path template
+    * ``<prefix>_response_bytes``: response body bytes per method and path template
+    * ``<prefix>_requests_in_flight``: requests waiting for a response
+    * ``<prefix>_pages_fetched``: pages of ``list()`` calls per path template
+    * ``<prefix>_cache_hits``, ``<prefix>_cache_misses`` and
+      ``<prefix>_cache_hit_ratio``: statistics of tracked response caches
+    """
+
+    def __init__(
+        self, prefix: str = "cachetclient", buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Keyword Args:
+            prefix (str): Prefix of the metric names
+            buckets: Upper bounds of the latency histogram buckets in seconds
+        """
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # (method, path) -> [count per bucket..., count above the last bucket]
+        self._durations: Dict[Tuple[str, str], List[int]] = {}
+        self._duration_sums: Dict[Tuple[str, str], float] = Counter()
+        self._requests: Dict[Tuple[str, str, str], int] = Counter()
+        self._errors: Dict[Tuple[str, str, str], int] = Counter()
+        self._retries: Dict[Tuple[str, str], int] = Counter()
+        self._bytes: Dict[Tuple[str, str], int] = Counter()
+        self._pages: Dict[str, int] = Counter()
+        self._caches: List[ResponseCache] = []
+
+    def hooks(self) -> Dict[str, List[Callable[[RequestEvent], None]]]:
+        """
+        Hooks for the ``hooks`` argument of the clients.
+
+        Returns:
+            dict: Callbacks per hook event
+        """
+        return {
+            "before_request": [self._before_request],
+            "after_response": [self._after_response],
+            "on_error": [self._on_error],
+        }
+
+    def track_cache(self, cache: ResponseCache) -> None:
+        """
+        Report the hits and misses of a response cache.
+
+        Args:
+            cache (ResponseCache): The cache passed to the client
+        """
+        with self._lock:
+            if cache not in self._caches:
+                self._caches.append(cache)
+
+    @property
+    def in_flight(self) -> int:
+        """int: Number of requests waiting for a response"""
+        return self._in_flight
+
+    def render(self, openmetrics: bool = True) -> str:
+        """
+        Render the metrics.
+
+        Args:
+            openmetrics (bool): Use the OpenMetrics format. Otherwise the
+                                Prometheus text format (version 0.0.4) is used.
+
+        Returns:
+            str: The metrics
+        """
+        lines: List[str] = []
+        with self._lock:
+            self._render_histogram(lines)
+            self._render_counter(
+                lines,
+                "requests",
+                "Responses received",
+                ("method", "path", "status"),
+                self._requests,
+                openmetrics,
+            )
+            self._render_counter(
+                lines,
+                "request_errors",
+                "Failed request attempts",
+                ("method", "path", "status"),
+                self._errors,
+                openmetrics,
+            )
+            self._render_counter(
+                lines,
+                "request_retries",
+                "Retried request attempts",
+                ("method", "path"),
+                self._retries,
+                openmetrics,
+            )
+            self._render_counter(
+                lines,
+                "response_bytes",
+                "Response body bytes",
+                ("method", "path"),
+                self._bytes,
+                openmetrics,
+            )
+            self._render_counter(
+                lines,
+                "pages_fetched",
+                "Pages fetched by list()",
+                ("path",),
+                {(path,): value for path, value in self._pages.items()},
+                openmetrics,
+            )
+            name = self._name("requests_in_flight")
+            lines.append("# HELP {} Requests waiting for a response".format(name))
+            lines.append("# TYPE {} gauge".format(name))
+            lines.append("{} {}".format(name, self._in_flight))
+
+            if self._caches:
+                hits = sum(cache.hits for cache in self._caches)
+                misses = sum(cache.misses for cache in self._caches)
+                self._render_counter(
+                    lines,
+                    "cache_hits",
+                    "Response cache hits",
+                    (),
+                    {(): hits},
+                    openmetrics,
+                )
+                self._render_counter(
+                    lines,
+                    "cache_misses",
+                    "Response cache misses",
+                    (),
+                    {(): misses},
+                    openmetrics,
+                )
+                name = self._name("cache_hit_ratio")
+                lines.append("# HELP {} Response cache hit ratio".format(name))
+                lines.append("# TYPE {} gauge".format(name))
+                lines.append(
+                    "{} {}".format(
+                        name, _format(hits / (hits + misses) if hits + misses else 0.0)
+                    )
+                )
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port: int, host: str = "") -> "HTTPServer":
+        """
+        Serve the metrics over http from a daemon thread.
+
+        The OpenMetrics format is served when requested in the
+        ``Accept`` header, otherwise the Prometheus text format.
+
+        Args:
+            port (int): Port to listen on
+            host (str): Interface to listen on. All interfaces by default.
+
+        Returns:
+            The http server. Call ``shutdown()`` to stop it.
+        """
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from socketserver import ThreadingMixIn
+
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                openmetrics = "application/openmetrics-text" in self.headers.get(
+                    "Accept", ""
+                )
+                body = collector.render(openmetrics=openmetrics).encode()
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type",
+                    (
+                        OPENMETRICS_CONTENT_TYPE
+                        if openmetrics
+                        else PROMETHEUS_CONTENT_TYPE
+                    ),
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        server = Server((host, port), Handler)
+        thread = threading.Thread(
+            target=server.serve_forever, name="cachetclient-stats", daemon=True
+        )
+        thread.start()
+        return server
+
+    def _before_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def _after_response(self, event: RequestEvent) -> None:
+        key = (event.method, event.path_template)
+        with self._lock:
+            self._in_flight -= 1
+            counts = self._durations.get(key)
+            if counts is None:
+                counts = self._durations[key] = [0] * (len(self.buckets) + 1)
+            counts[bisect_left(self.buckets, event.total)] += 1
+            self._duration_sums[key] += event.total
+            self._requests[key + (str(event.status),)] += 1
+            self._bytes[key] += event.bytes
+            if (
+                event.method == "GET"
+                and event.params
+                and "page" in event.params
+                and 200 <= event.status < 300
+            ):
+                self._pages[event.path_template] += 1
+
+    def _on_error(self, event: RequestEvent) -> None:
+        key = (event.method, event.path_template)
+        with self._lock:
+            if event.status is None:
+                # No response, so after_response was not called
+                self._in_flight -= 1
+                status = type(event.error).__name__
+            else:
+                status = str(event.status)
+            self._errors[key + (status,)] += 1
+            if event.will_retry:
+                self._retries[key] += 1
+
+    def _name(self, name: str) -> str:
+        return "{}_{}".format(self.prefix, name) if self.prefix else name
+
+    def _render_counter(
+        self,
+        lines: List[str],
+        name: str,
+        description: str,
+        label_names: Tuple[str, ...],
+        values: Dict[tuple, float],
+        openmetrics: bool,
+    ) -> None:
+        name = self._name(name)
+        # OpenMetrics counter families omit the _total suffix of the samples
+        family = name if openmetrics else name + "_total"
+        lines.append("# HELP {} {}".format(family, description))
+        lines.append("# TYPE {} counter".format(family))
+        for label_values, value in sorted(values.items()):
+            lines.append(
+                "{}_total{} {}".format(
+                    name, _labels(zip(label_names, label_values)), _format(value)
+                )
+            )
+
+    def _render_histogram(self, lines: List[str]) -> None:
+        name = self._name("request_duration_seconds")
+        lines.append("# HELP {} Request latency".format(name))
+        lines.append("# TYPE {} histogram".format(name))
+        for (method, path), counts in sorted(self._durations.items()):
+            labels = [("method", method), ("path", path)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format(bound)
+                lines.append(
+                    "{}_bucket{} {}".format(
+                        name, _labels(labels + [("le", le)]), cumulative
+                    )
+                )
+            lines.append(
+                "{}_sum{} {}".format(
+                    name, _labels(labels), _format(self._duration_sums[(method, path)])
+                )
+            )
+            lines.append("{}_count{} {}".format(name, _labels(labels), cumulative))
+
+
+def _labels(pairs) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    return (
+        "{"
+        + ",".join('{}="{}"'.format(key, _escape(value)) for key, value in pairs)
+        + "}"
+    )
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
@@ -0,0 +1,225 @@
+"""
+Optional OpenTelemetry tracing.
+
+When ``opentelemetry-api`` is installed every manager operation
+creates a span named after the manager and operation, for example
+``IncidentManager.create`` or ``ComponentManager.list``, with a child
+span per page request. Spans have these attributes when available:
+
+* ``cachet.resource``: The resource class, for example ``Component``
+* ``cachet.path``: The path template, for example ``components/{}``
+* ``cachet.page`` and ``cachet.per_page``: The requested page
+* ``cachet.response_bytes``: Size of the decoded response body
+* ``cachet.decode_seconds``: Time spent decoding the json body
+
+Spans are exported by the tracer provider configured in the
+application (``pip install cachet-client[tracing]`` installs the api).
+Without the library all functions here are no-ops.
+
+Example::
+
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+
+    trace.set_tracer_provider(TracerProvider())
+    client = cachetclient.Client()
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+# None: not looked up yet, False: disabled or library missing
+_tracer: Any = None
+# The opentelemetry.trace module once imported
+_trace: Any = None
+
+
+class _NullContext:
+    """Context manager doing nothing (contextlib.nullcontext is python 3.7+)"""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL = _NullContext()
+
+
+def enable(tracer=None) -> None:
+    """
+    Enable tracing. Tracing is enabled by default when
+    OpenTelemetry is installed.
+
+    Args:
+        tracer: The tracer creating spans. Defaults to the
+                ``cachetclient`` tracer of the global tracer provider.
+    """
+    global _tracer
+    _tracer = tracer
+    if tracer is not None:
+        _import_trace()
+
+
+def disable() -> None:
+    """Stop creating spans"""
+    global _tracer
+    _tracer = False
+
+
+def get_tracer():
+    """
+    Get the tracer creating the spans.
+
+    Returns:
+        The tracer or ``None`` if tracing is disabled or OpenTelemetry is not installed
+    """
+    global _tracer
+    if _tracer is None:
+        try:
+            _tracer = _import_trace().get_tracer("cachetclient")
+        except ImportError:
+            _tracer = False
+    return _tracer or None
+
+
+def span(name: str, attributes: Dict[str, Any] = None):
+    """
+    Context manager running a block in a new current span.
+
+    Exceptions leaving the block are recorded on the span.
+
+    Args:
+        name (str): The span name
+        attributes (dict): The span attributes
+    """
+    new_span = start_span(name, attributes)
+    if new_span is None:
+        return _NULL
+    return _trace.use_span(new_span, end_on_exit=True)
+
+
+def start_span(name: str, attributes: Dict[str, Any] = None):
+    """
+    Start a span without making it current.
+
+    Used for spans covering generators where the current span can
+    not be kept across ``yield``. Child spans are created with
+    :py:func:`use_span` or :py:func:`bind` and the span must be
+    ended with :py:func:`end_span`.
+
+    Args:
+        name (str): The span name
+        attributes (dict): The span attributes
+
+    Returns:
+        The span or ``None`` if tracing is disabled or the span is not recording
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return None
+    new_span = tracer.start_span(name, attributes=attributes)
+    # Making spans nobody records current is the bulk of the overhead
+    # when no tracer provider is configured
+    return new_span if new_span.is_recording() else None
+
+
+def end_span(span, error: Exception = None) -> None:
+    """
+    End a span started with :py:func:`start_span`.
+
+    Args:
+        span: The span or ``None``
+        error (Exception): Exception to record on the span
+    """
+    if span is None:
+        return
+
+    if error is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.record_exception(error)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+    span.end()
+
+
+def use_span(span):
+    """
+    Context manager making a span current without ending it.
+
+    Args:
+        span: The span or ``None``
+    """
+    if span is None:
+        return _NULL
+    return _trace.use_span(span, end_on_exit=False)
+
+
+def bind(span, func: Callable) -> Callable:
+    """
+    Wrap a function so it runs with a span as the current span.
+
+    Used to keep the parent span in worker threads.
+
+    Args:
+        span: The span or ``None``
+        func: The function to wrap
+
+    Returns:
+        The wrapped function or ``func`` if span is ``None``
+    """
+    if span is None:
+        return func
+
+    def run(*args, **kwargs):
+        with use_span(span):
+            return func(*args, **kwargs)
+
+    return run
+
+
+def current_span():
+    """
+    Get the current span if it is recording.
+
+    Returns:
+        The span or ``None``
+    """
+    if get_tracer() is None:
+        return None
+
+    span = _trace.get_current_span()
+    return span if span.is_recording() else None
+
+
+def decode(loads: Callable[[bytes], Any], content: bytes) -> Any:
+    """
+    Decode a response body adding its size and decode time
+    to the current span.
+
+    Args:
+        loads: Function decoding the content
+        content (bytes): The response body
+
+    Returns:
+        The decoded data
+    """
+    span: Optional[Any] = current_span()
+    if span is None:
+        return loads(content)
+
+    start = time.perf_counter()
+    data = loads(content)
+    span.set_attribute("cachet.decode_seconds", time.perf_counter() - start)
+    span.set_attribute("cachet.response_bytes", len(content))
+    return data
+
+
+def _import_trace():
+    global _trace
+    if _trace is None:
+        from opentelemetry import trace
+
+        _trace = trace
+    return _trace
@@ -1,7 +1,44 @@
-from typing import Optional
+from typing import Any, Optional
+import functools
 import re
 from datetime import datetime
 
+PATH_ID_PATTERN = re.compile(r"(?<=/)\d+(?=/|$)")
+
+# 'Friday 24th May 2019 10:01:44'. Used in verified_at for subscribers
+VERBOSE_TIMESTAMP_PATTERN = re.compile(
+    r"([A-Za-z]+) ([0123]?[0-9])(?:st|nd|rd|th)? ([A-Za-z]+) (\d{4}) (\d{1,2}):(\d{2}):(\d{2})\Z"
+)
+WEEKDAYS = {
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+}
+MONTHS = {
+    name: num
+    for num, name in enumerate(
+        [
+            "january",
+            "february",
+            "march",
+            "april",
+            "may",
+            "june",
+            "july",
+            "august",
+            "september",
+            "october",
+            "november",
+            "december",
+        ],
+        start=1,
+    )
+}
+
 
 def to_datetime(timestamp: Optional[str]) -> Optional[datetime]:
     """
@@ -10,6 +47,8 @@ def to_datetime(timestamp: Optional[str]) -> Optional[datetime]:
         '2019-05-24 09:26:22'
         'Friday 24th May 2019 10:01:44'
 
+    Recently converted values are memoized.
+
     Args:
         timestamp (str): String timestamp
 
@@ -19,17 +58,107 @@ def to_datetime(timestamp: Optional[str]) -> Optional[datetime]:
     if timestamp is None:
         return None
 
+    return _cached_parse_datetime(timestamp)
+
+
+def _parse_datetime(timestamp: str) -> datetime:
+    """Parse a timestamp without memoization"""
+    # '2019-05-24 09:26:22'. Checking the separators by position is much
+    # cheaper than strptime and the most common format by far
+    if (
+        len(timestamp) == 19
+        and timestamp[4] == "-"
+        and timestamp[7] == "-"
+        and timestamp[10] == " "
+        and timestamp[13] == ":"
+        and timestamp[16] == ":"
+    ):
+        try:
+            return _from_fixed_timestamp(timestamp)
+        except ValueError:
+            pass
+
+    match = VERBOSE_TIMESTAMP_PATTERN.match(timestamp)
+    if match and match.group(1).lower() in WEEKDAYS:
+        _, day, month, year, hour, minute, second = match.groups()
+        try:
+            return datetime(
+                int(year),
+                MONTHS[month.lower()],
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+            )
+        except (KeyError, ValueError):
+            pass
+
     try:
-        # '2019-05-24 09:26:22'
+        # Variations such as single digit fields
         return datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
     except ValueError:
         pass
 
     try:
-        # 'Friday 1st May 2019 10:01:44'. Used in verified_at for subscribers
+        # Verbose variations such as single digit minutes
         sub_timestamp = re.sub(r"\b([0123]?[0-9])(st|th|nd|rd)\b", r"\1", timestamp)
         return datetime.strptime(sub_timestamp, "%A %d %B %Y %H:%M:%S")
     except ValueError:
         pass
 
     raise ValueError("datetime string '{}' not supported".format(timestamp))
+
+
+if hasattr(datetime, "fromisoformat"):
+    # python 3.7+. Only used for strings already matching 'YYYY-MM-DD HH:MM:SS'
+    _from_fixed_timestamp = datetime.fromisoformat
+else:
+
+    def _from_fixed_timestamp(timestamp: str) -> datetime:
+        return datetime(
+            int(timestamp[0:4]),
+            int(timestamp[5:7]),
+            int(timestamp[8:10]),
+            int(timestamp[11:13]),
+            int(timestamp[14:16]),
+            int(timestamp[17:19]),
+        )
+
+
+_cached_parse_datetime = functools.lru_cache(maxsize=4096)(_parse_datetime)
+
+
+def path_template(path: str) -> str:
+    """
+    Replace resource ids in an url path with ``{}``::
+
+        >> path_template('metrics/1/points/3')
+        'metrics/{}/points/{}'
+
+    Args:
+        path (str): url path relative to base url
+
+    Returns:
+        str: The path template
+    """
+    return PATH_ID_PATTERN.sub("{}", path)
+
+
+def copy_json(data: Any) -> Any:
+    """
+    Deep copy decoded json data.
+
+    Much faster than :py:func:`copy.deepcopy` since only
+    dicts and lists need to be copied.
+
+    Args:
+        data: Decoded json data
+
+    Returns:
+        A copy of the data
+    """
+    if isinstance(data, dict):
+        return {key: copy_json(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [copy_json(value) for value in data]
+    return data
@@ -1,11 +1,41 @@
-from cachetclient.v1.client import Client  # noqa
-
-from cachetclient.v1.subscribers import Subscriber  # noqa
-from cachetclient.v1.components import Component  # noqa
-from cachetclient.v1.component_groups import ComponentGroup  # noqa
-from cachetclient.v1.incidents import Incident  # noqa
-from cachetclient.v1.incident_updates import IncidentUpdate  # noqa
-from cachetclient.v1.metrics import Metric  # noqa
-from cachetclient.v1.metric_points import MetricPoint  # noqa
-from cachetclient.v1.schedules import Schedule  # noqa
-from cachetclient.v1 import enums  # noqa
+import importlib
+import sys
+
+# Public name: module it is imported from on first access
+LAZY_ATTRIBUTES = {
+    "AsyncClient": "cachetclient.v1.client",
+    "Client": "cachetclient.v1.client",
+    "Subscriber": "cachetclient.v1.subscribers",
+    "Component": "cachetclient.v1.components",
+    "ComponentGroup": "cachetclient.v1.component_groups",
+    "Incident": "cachetclient.v1.incidents",
+    "IncidentUpdate": "cachetclient.v1.incident_updates",
+    "Metric": "cachetclient.v1.metrics",
+    "MetricPoint": "cachetclient.v1.metric_points",
+    "Schedule": "cachetclient.v1.schedules",
+}
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name == "enums":
+            return importlib.import_module("cachetclient.v1.enums")
+        if name in LAZY_ATTRIBUTES:
+            return getattr(importlib.import_module(LAZY_ATTRIBUTES[name]), name)
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(list(globals()) + list(LAZY_ATTRIBUTES) + ["enums"])
+
+else:
+    from cachetclient.v1.client import AsyncClient, Client  # noqa
+
+    from cachetclient.v1.subscribers import Subscriber  # noqa
+    from cachetclient.v1.components import Component  # noqa
+    from cachetclient.v1.component_groups import ComponentGroup  # noqa
+    from cachetclient.v1.incidents import Incident  # noqa
+    from cachetclient.v1.incident_updates import IncidentUpdate  # noqa
+    from cachetclient.v1.metrics import Metric  # noqa
+    from cachetclient.v1.metric_points import MetricPoint  # noqa
+    from cachetclient.v1.schedules import Schedule  # noqa
+    from cachetclient.v1 import enums  # noqa
@@ -1,32 +1,126 @@
-from cachetclient.httpclient import HttpClient
-from cachetclient.v1.component_groups import ComponentGroupManager
-from cachetclient.v1.components import ComponentManager
-from cachetclient.v1.incidents import IncidentManager
-from cachetclient.v1.incident_updates import IncidentUpdatesManager
-from cachetclient.v1.metrics import MetricsManager
-from cachetclient.v1.metric_points import MetricPointsManager
-from cachetclient.v1.subscribers import SubscriberManager
-from cachetclient.v1.ping import PingManager
-from cachetclient.v1.version import VersionManager
-from cachetclient.v1.schedules import ScheduleManager
+import importlib
+import threading
+
+from cachetclient.httpclient import AsyncHttpClient, HttpClient
+
+
+class LazyManager:
+    """
+    Client attribute creating a manager on first access.
+
+    The manager module is imported and the manager created the first time
+    the attribute is read. The instance is then stored on the client so
+    later reads are plain attribute lookups. Managers depending on other
+    managers get them from the client, creating them if needed.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, module: str, class_name: str, *dependencies: str):
+        """
+        Args:
+            module (str): Module containing the manager class
+            class_name (str): Name of the manager class
+            dependencies (str): Client attributes passed to the manager after the http client
+        """
+        self.module = module
+        self.class_name = class_name
+        self.dependencies = dependencies
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+
+        with self._lock:
+            # Another thread may have created it while we waited
+            manager = client.__dict__.get(self.name)
+            if manager is None:
+                manager_class = getattr(
+                    importlib.import_module(self.module), self.class_name
+                )
+                manager = manager_class(
+                    client._http, *(getattr(client, dep) for dep in self.dependencies)
+                )
+                manager.compact = client._compact
+                client.__dict__[self.name] = manager
+        return manager
 
 
 class Client:
-    def __init__(self, http_client: HttpClient):
+    # Managers
+    ping = LazyManager("cachetclient.v1.ping", "PingManager")
+    version = LazyManager("cachetclient.v1.version", "VersionManager")
+    components = LazyManager("cachetclient.v1.components", "ComponentManager")
+    component_groups = LazyManager(
+        "cachetclient.v1.component_groups", "ComponentGroupManager", "components"
+    )
+    incident_updates = LazyManager(
+        "cachetclient.v1.incident_updates", "IncidentUpdatesManager"
+    )
+    incidents = LazyManager(
+        "cachetclient.v1.incidents", "IncidentManager", "incident_updates"
+    )
+    metric_points = LazyManager("cachetclient.v1.metric_points", "MetricPointsManager")
+    metrics = LazyManager("cachetclient.v1.metrics", "MetricsManager", "metric_points")
+    subscribers = LazyManager("cachetclient.v1.subscribers", "SubscriberManager")
+    schedules = LazyManager("cachetclient.v1.schedules", "ScheduleManager")
+
+    def __init__(self, http_client: HttpClient, compact: bool = False):
         """
         Args:
             http_client: The http client class to use
+
+        Keyword Args:
+            compact (bool): Managers create resources without an instance ``__dict__``
+        """
+        self._http = http_client
+        self._compact = compact
+
+
+class AsyncClient:
+    # Managers
+    ping = LazyManager("cachetclient.v1.ping", "AsyncPingManager")
+    version = LazyManager("cachetclient.v1.version", "AsyncVersionManager")
+    components = LazyManager("cachetclient.v1.components", "AsyncComponentManager")
+    component_groups = LazyManager(
+        "cachetclient.v1.component_groups", "AsyncComponentGroupManager", "components"
+    )
+    incident_updates = LazyManager(
+        "cachetclient.v1.incident_updates", "AsyncIncidentUpdatesManager"
+    )
+    incidents = LazyManager(
+        "cachetclient.v1.incidents", "AsyncIncidentManager", "incident_updates"
+    )
+    metric_points = LazyManager(
+        "cachetclient.v1.metric_points", "AsyncMetricPointsManager"
+    )
+    metrics = LazyManager(
+        "cachetclient.v1.metrics", "AsyncMetricsManager", "metric_points"
+    )
+    subscribers = LazyManager("cachetclient.v1.subscribers", "AsyncSubscriberManager")
+    schedules = LazyManager("cachetclient.v1.schedules", "AsyncScheduleManager")
+
+    def __init__(self, http_client: AsyncHttpClient, compact: bool = False):
+        """
+        Args:
+            http_client: The async http client class to use
+
+        Keyword Args:
+            compact (bool): Managers create resources without an instance ``__dict__``
         """
         self._http = http_client
+        self._compact = compact
+
+    async def close(self) -> None:
+        """Release the worker threads of the http client"""
+        await self._http.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
 
-        # Managers
-        self.ping = PingManager(self._http)
-        self.version = VersionManager(self._http)
-        self.components = ComponentManager(self._http)
-        self.component_groups = ComponentGroupManager(self._http, self.components)
-        self.incident_updates = IncidentUpdatesManager(self._http)
-        self.incidents = IncidentManager(self._http, self.incident_updates)
-        self.metric_points = MetricPointsManager(self._http)
-        self.metrics = MetricsManager(self._http, self.metric_points)
-        self.subscribers = SubscriberManager(self._http)
-        self.schedules = ScheduleManager(self._http)
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -1,14 +1,18 @@
 from datetime import datetime
 from typing import Generator, List, Optional
 
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 from cachetclient import utils
 from cachetclient.v1 import enums
 from cachetclient.v1.components import Component, ComponentManager
 from cachetclient.httpclient import HttpClient
 
 
-class ComponentGroup(Resource):
+class CompactComponentGroup(Resource):
+    """ComponentGroup without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         """int: Id of the component group"""
@@ -26,8 +30,9 @@ class ComponentGroup(Resource):
     @property
     def enabled_components(self) -> List[Component]:
         """List[Component]: Enabled components in this group"""
+        components = self._manager.components
         return [
-            Component(self._manager.components, comp)
+            components.resource_class(components, comp)
             for comp in self._data["enabled_components"]
         ]
 
@@ -95,8 +100,13 @@ class ComponentGroup(Resource):
         self._data["visible"] = value
 
 
+class ComponentGroup(CompactComponentGroup):
+    """ComponentGroup resource. Unlike :py:class:`CompactComponentGroup` instances have a ``__dict__``"""
+
+
 class ComponentGroupManager(Manager):
     resource_class = ComponentGroup
+    compact_resource_class = CompactComponentGroup
     path = "components/groups"
 
     def __init__(self, http_client: HttpClient, components_manager: ComponentManager):
@@ -171,7 +181,11 @@ class ComponentGroupManager(Manager):
         return self._count(self.path)
 
     def list(
-        self, page: int = 1, per_page: int = 20
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[ComponentGroup, None, None]:
         """
         List all component groups
@@ -179,11 +193,19 @@ class ComponentGroupManager(Manager):
         Keyword Args:
             page (int): The page to start listing
             per_page: Number of entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Returns:
             Generator of :py:data:`ComponentGroup` instances
         """
-        yield from self._list_paginated(self.path, page=page, per_page=per_page)
+        return self._list_paginated(
+            self.path,
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def get(self, group_id) -> ComponentGroup:
         """
@@ -210,4 +232,8 @@ class ComponentGroupManager(Manager):
         Raises:
             `requests.exceptions.HttpError`: if not found
         """
-        self._delete(self.path, group_id)
+        return self._delete(self.path, group_id)
+
+
+class AsyncComponentGroupManager(AsyncManager, ComponentGroupManager):
+    """Asyncio version of :py:class:`ComponentGroupManager`"""
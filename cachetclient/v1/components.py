@@ -1,20 +1,29 @@
 import copy
+import time
 from typing import (
+    Any,
     Dict,
     Iterable,
     Generator,
     List,
     Optional,
+    Tuple,
+    Union,
 )
 from datetime import datetime
 from collections import abc
+from concurrent.futures import ThreadPoolExecutor
 
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 from cachetclient.v1 import enums
 from cachetclient import utils
 
 
-class Component(Resource):
+class CompactComponent(Resource):
+    """Component without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     def __init__(self, manager, data):
         super().__init__(manager, data)
         if data.get("tags") is None:
@@ -228,8 +237,13 @@ class Component(Resource):
         return self._manager.update(self.get("id"), **data)
 
 
+class Component(CompactComponent):
+    """Component resource. Unlike :py:class:`CompactComponent` instances have a ``__dict__``"""
+
+
 class ComponentManager(Manager):
     resource_class = Component
+    compact_resource_class = CompactComponent
     path = "components"
 
     def create(
@@ -316,7 +330,7 @@ class ComponentManager(Manager):
             order (int): Order in component group
             group_id (int): Component group id
             enabled (bool): Enable status of component
-            tags (Iterable[str]): Iterable of tag strings
+            tags (Iterable[str]): Iterable of tag strings. An empty iterable removes all tags.
 
         Returns:
             Updated Component from server
@@ -335,23 +349,36 @@ class ComponentManager(Manager):
                 order=order,
                 group_id=group_id,
                 enabled=enabled,
-                tags=",".join(tags) if tags else None,
+                # An empty string clears the tags while None leaves them alone
+                tags=",".join(tags) if tags is not None else None,
             ),
         )
 
     def list(
-        self, page: int = 1, per_page: int = 20
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[Component, None, None]:
         """List all components
 
         Keyword Args:
             page (int): The page to start listing
             per_page (int): Number of entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Returns:
             Generator of Component instances
         """
-        yield from self._list_paginated(self.path, page=page, per_page=per_page)
+        return self._list_paginated(
+            self.path,
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def get(self, component_id: int) -> Component:
         """Get a component by id
@@ -376,7 +403,7 @@ class ComponentManager(Manager):
         Raises:
             HTTPError: if component do not exist
         """
-        self._delete(self.path, component_id)
+        return self._delete(self.path, component_id)
 
     def count(self) -> int:
         """Count the number of components
@@ -385,3 +412,257 @@ class ComponentManager(Manager):
             int: Total number of components
         """
         return self._count(self.path)
+
+    def reconciler(
+        self, workers: int = 4, max_age: Optional[float] = 60.0
+    ) -> "ComponentReconciler":
+        """
+        Create a reconciler only updating components that differ
+        from the desired state.
+
+        Keyword Args:
+            workers (int): Max number of concurrent updates
+            max_age (float): Seconds before the component snapshot is listed again,
+                             so changes made by others are noticed and corrected.
+                             ``None`` lists the snapshot once and then only follows
+                             the writes of the reconciler itself.
+
+        Returns:
+            :py:class:`ComponentReconciler` instance
+        """
+        return ComponentReconciler(self, workers=workers, max_age=max_age)
+
+
+class ReconcileReport:
+    """
+    The outcome of :py:meth:`ComponentReconciler.reconcile`.
+
+    Attributes:
+        changed (dict): ``{component_id: {field: (old, new)}}`` for updated components
+        unchanged (list): Ids of components already in the desired state
+        missing (list): Ids of components not found on the server
+        failed (dict): ``{component_id: exception}`` for failed updates
+                       and updates the server did not fully apply
+    """
+
+    def __init__(self):
+        self.changed: Dict[int, Dict[str, Tuple[Any, Any]]] = {}
+        self.unchanged: List[int] = []
+        self.missing: List[int] = []
+        self.failed: Dict[int, Exception] = {}
+
+    @property
+    def ok(self) -> bool:
+        """bool: All components are in the desired state"""
+        return not self.missing and not self.failed
+
+    def __repr__(self) -> str:
+        return "<ReconcileReport changed={} unchanged={} missing={} failed={}>".format(
+            len(self.changed),
+            len(self.unchanged),
+            len(self.missing),
+            len(self.failed),
+        )
+
+
+class ComponentReconciler:
+    """
+    Brings components to a desired state issuing only the updates needed.
+
+    The desired state is compared with a snapshot of all components
+    from :py:meth:`ComponentManager.list`. Components already in the
+    desired state are not touched, so pushing the same state over and
+    over only costs the writes for components that actually changed.
+    The snapshot is updated from the server response of each update
+    and listed again when older than ``max_age`` seconds (60 by default),
+    so components changed by someone else are corrected as well.
+
+    Example::
+
+        reconciler = client.components.reconciler(workers=8)
+        report = reconciler.reconcile({
+            1: enums.COMPONENT_STATUS_OPERATIONAL,
+            2: {"status": enums.COMPONENT_STATUS_MAJOR_OUTAGE, "enabled": True},
+        })
+        print(report.changed)
+    """
+
+    #: Fields that can be reconciled
+    fields = (
+        "status",
+        "name",
+        "description",
+        "link",
+        "order",
+        "group_id",
+        "enabled",
+        "tags",
+    )
+
+    def __init__(
+        self,
+        manager: ComponentManager,
+        workers: int = 4,
+        max_age: Optional[float] = 60.0,
+    ):
+        """
+        Args:
+            manager: The component manager
+
+        Keyword Args:
+            workers (int): Max number of concurrent updates
+            max_age (float): Seconds before the component snapshot is listed again.
+                             ``None`` never lists it again.
+        """
+        self._manager = manager
+        self.workers = workers
+        self.max_age = max_age
+        self._snapshot: Optional[Dict[int, Component]] = None
+        self._snapshot_time = 0.0
+
+    @property
+    def snapshot(self) -> Dict[int, Component]:
+        """dict: The current ``{component_id: Component}`` snapshot"""
+        if self._snapshot is None or (
+            self.max_age is not None
+            and time.monotonic() - self._snapshot_time > self.max_age
+        ):
+            self.refresh()
+        return self._snapshot
+
+    def refresh(self) -> None:
+        """List all components replacing the snapshot"""
+        self._snapshot = {
+            component.id: component for component in self._manager.list(per_page=100)
+        }
+        self._snapshot_time = time.monotonic()
+
+    def diff(self, component: Component, desired: dict) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Compare a component with the desired fields.
+
+        Args:
+            component (Component): The current component
+            desired (dict): The desired field values
+
+        Returns:
+            dict: ``{field: (old, new)}`` for fields that differ
+        """
+        changes = {}
+        for field, value in desired.items():
+            if field == "tags":
+                current = sorted(component.tag_names)
+                value = sorted(value)
+            else:
+                current = component.get(field)
+            if current != value:
+                changes[field] = (current, value)
+        return changes
+
+    def reconcile(
+        self, desired: Dict[int, Union[int, dict]], dry_run: bool = False
+    ) -> ReconcileReport:
+        """
+        Update the components that differ from the desired state.
+
+        Args:
+            desired (dict): ``{component_id: status}`` or ``{component_id: {field: value}}``
+
+        Keyword Args:
+            dry_run (bool): Only report the changes
+
+        Returns:
+            :py:class:`ReconcileReport` instance
+
+        Raises:
+            ValueError: for unknown fields, ``None`` values or invalid status ids
+        """
+        desired = {
+            component_id: value if isinstance(value, dict) else {"status": value}
+            for component_id, value in desired.items()
+        }
+        for fields in desired.values():
+            unknown = set(fields) - set(self.fields)
+            if unknown:
+                raise ValueError("Cannot reconcile fields {}".format(sorted(unknown)))
+            # update() leaves fields that are None untouched so they would never converge
+            empty = [field for field, value in fields.items() if value is None]
+            if empty:
+                raise ValueError(
+                    "Cannot reconcile None values for fields {}".format(sorted(empty))
+                )
+            if (
+                "status" in fields
+                and fields["status"] not in enums.COMPONENT_STATUS_LIST
+            ):
+                raise ValueError(
+                    "Invalid status id '{}'. Valid values :{}".format(
+                        fields["status"],
+                        enums.COMPONENT_STATUS_LIST,
+                    )
+                )
+
+        report = ReconcileReport()
+        snapshot = self.snapshot
+        for component_id, fields in desired.items():
+            component = snapshot.get(component_id)
+            if component is None:
+                report.missing.append(component_id)
+                continue
+
+            changes = self.diff(component, fields)
+            if changes:
+                report.changed[component_id] = changes
+            else:
+                report.unchanged.append(component_id)
+
+        if dry_run or not report.changed:
+            return report
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                component_id: executor.submit(
+                    self._manager.update,
+                    component_id,
+                    status=desired[component_id].get(
+                        "status", snapshot[component_id].status
+                    ),
+                    **{
+                        field: value
+                        for field, value in desired[component_id].items()
+                        if field != "status"
+                    }
+                )
+                for component_id in report.changed
+            }
+            for component_id, future in futures.items():
+                try:
+                    component = snapshot[component_id] = future.result()
+                except Exception as ex:
+                    report.failed[component_id] = ex
+                    continue
+
+                # The server may ignore or alter values, so check its response
+                mismatch = self.diff(component, desired[component_id])
+                if mismatch:
+                    report.failed[component_id] = RuntimeError(
+                        "Update not applied by the server: {}".format(mismatch)
+                    )
+
+        for component_id in report.failed:
+            del report.changed[component_id]
+
+        return report
+
+
+class AsyncComponentManager(AsyncManager, ComponentManager):
+    """Asyncio version of :py:class:`ComponentManager`"""
+
+    def reconciler(self, **kwargs) -> ComponentReconciler:
+        """
+        Create a :py:class:`ComponentReconciler` updating components through
+        the http client wrapped by the async client. Its methods block,
+        so run them in an executor from coroutines.
+        See :py:meth:`ComponentManager.reconciler` for arguments.
+        """
+        return ComponentManager(self._http.http_client).reconciler(**kwargs)
@@ -79,3 +79,9 @@ SCHEDULE_STATUS_LIST = [
     SCHEDULE_STATUS_IN_PROGRESS,
     SCHEDULE_STATUS_COMPLETE,
 ]
+
+# Metric calculation type
+#: [0] Sum. Points within the threshold are added together.
+METRIC_CALC_SUM = 0
+#: [1] Average. Points within the threshold are averaged.
+METRIC_CALC_AVG = 1
@@ -1,11 +1,15 @@
 from datetime import datetime
 from typing import Generator, Optional
 
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 from cachetclient import utils
 
 
-class IncidentUpdate(Resource):
+class CompactIncidentUpdate(Resource):
+    """IncidentUpdate without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         """int: Resource id"""
@@ -70,11 +74,16 @@ class IncidentUpdate(Resource):
 
     def delete(self) -> None:
         """Deletes the incident update"""
-        self._manager.delete(self.incident_id, self.id)
+        return self._manager.delete(self.incident_id, self.id)
+
+
+class IncidentUpdate(CompactIncidentUpdate):
+    """IncidentUpdate resource. Unlike :py:class:`CompactIncidentUpdate` instances have a ``__dict__``"""
 
 
 class IncidentUpdatesManager(Manager):
     resource_class = IncidentUpdate
+    compact_resource_class = CompactIncidentUpdate
     path = "incidents/{}/updates"
 
     def create(self, *, incident_id: int, status: int, message: str) -> IncidentUpdate:
@@ -143,7 +152,12 @@ class IncidentUpdatesManager(Manager):
         return self._count(self.path.format(incident_id))
 
     def list(
-        self, incident_id: int, page: int = 1, per_page: int = 20
+        self,
+        incident_id: int,
+        page: int = 1,
+        per_page: int = 20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[IncidentUpdate, None, None]:
         """
         List updates for an issue
@@ -154,6 +168,8 @@ class IncidentUpdatesManager(Manager):
         Keyword Args:
             page (int): The first page to request
             per_page (int): Entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Return:
             Generator of :py:data:`IncidentUpdate`s
@@ -162,6 +178,8 @@ class IncidentUpdatesManager(Manager):
             self.path.format(incident_id),
             page=page,
             per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
         )
 
     def get(self, incident_id: int, update_id: int) -> IncidentUpdate:
@@ -181,4 +199,8 @@ class IncidentUpdatesManager(Manager):
         """
         Delete an incident update
         """
-        self._delete(self.path.format(incident_id), update_id)
+        return self._delete(self.path.format(incident_id), update_id)
+
+
+class AsyncIncidentUpdatesManager(AsyncManager, IncidentUpdatesManager):
+    """Asyncio version of :py:class:`IncidentUpdatesManager`"""
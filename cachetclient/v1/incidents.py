@@ -2,13 +2,17 @@ import copy
 from datetime import datetime
 from typing import List, Generator, Optional
 
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 from cachetclient import utils
 from cachetclient.v1.incident_updates import IncidentUpdatesManager
 from cachetclient.httpclient import HttpClient
 
 
-class Incident(Resource):
+class CompactIncident(Resource):
+    """Incident without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         """int: unique id of the incident"""
@@ -134,8 +138,13 @@ class Incident(Resource):
         return self._manager.update(self.get("id"), **data)
 
 
+class Incident(CompactIncident):
+    """Incident resource. Unlike :py:class:`CompactIncident` instances have a ``__dict__``"""
+
+
 class IncidentManager(Manager):
     resource_class = Incident
+    compact_resource_class = CompactIncident
     path = "incidents"
 
     def __init__(
@@ -271,13 +280,21 @@ class IncidentManager(Manager):
             ),
         )
 
-    def list(self, page: int = 1, per_page: int = 1) -> Generator[Incident, None, None]:
+    def list(
+        self,
+        page: int = 1,
+        per_page: int = 1,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> Generator[Incident, None, None]:
         """
         List all incidents paginated
 
         Keyword Args:
             page (int): Page to start on
             per_page (int): entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Returns:
             Generator of :py:data:`Incident`s
@@ -286,6 +303,8 @@ class IncidentManager(Manager):
             self.path,
             page=page,
             per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
         )
 
     def get(self, incident_id: int) -> Incident:
@@ -319,4 +338,8 @@ class IncidentManager(Manager):
         Args:
             incident_id (int): The incident id
         """
-        self._delete(self.path, incident_id)
+        return self._delete(self.path, incident_id)
+
+
+class AsyncIncidentManager(AsyncManager, IncidentManager):
+    """Asyncio version of :py:class:`IncidentManager`"""
@@ -1,11 +1,22 @@
+import logging
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Generator, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
-from cachetclient.base import Manager, Resource
 from cachetclient import utils
+from cachetclient.base import AsyncManager, Manager, Resource
 
+logger = logging.getLogger(__name__)
+
+
+class CompactMetricPoint(Resource):
+    """MetricPoint without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
 
-class MetricPoint(Resource):
     @property
     def id(self) -> int:
         """int: unique id of the metric point"""
@@ -58,22 +69,70 @@ class MetricPoint(Resource):
         self._data["calculated_value"] = value
 
 
+class MetricPoint(CompactMetricPoint):
+    """MetricPoint resource. Unlike :py:class:`CompactMetricPoint` instances have a ``__dict__``"""
+
+
 class MetricPointsManager(Manager):
     resource_class = MetricPoint
+    compact_resource_class = CompactMetricPoint
     path = "metrics/{}/points"
 
-    def create(self, *, metric_id: int, value: float) -> MetricPoint:
+    def create(
+        self, *, metric_id: int, value: float, timestamp: datetime = None
+    ) -> MetricPoint:
         """
         Create an metric point
 
         Keyword Args:
             metric_id (int): The metric to tag with the point
             value (fload): Metric point value for graph
+            timestamp (datetime): When the value was measured. Server time if omitted.
 
         Returns:
             :py:data:`MetricPoint` instance
         """
-        return self._create(self.path.format(metric_id), {"value": value})
+        return self._create(
+            self.path.format(metric_id),
+            self._build_data_dict(
+                value=value,
+                timestamp=int(timestamp.timestamp()) if timestamp else None,
+            ),
+        )
+
+    def buffered(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_queued: int = 10000,
+        workers: int = 1,
+    ) -> "MetricPointBuffer":
+        """
+        Create a buffer queueing metric points in memory.
+        Points are created from a background thread when
+        ``batch_size`` points are queued or every ``flush_interval`` seconds.
+
+        Example::
+
+            with client.metric_points.buffered(flush_interval=10) as points:
+                points.add(metric_id, 42)
+
+        Keyword Args:
+            batch_size (int): Number of queued points triggering a flush
+            flush_interval (float): Max seconds between each flush
+            max_queued (int): Max number of queued points. New points are dropped when full.
+            workers (int): Number of threads creating points during a flush
+
+        Returns:
+            :py:class:`MetricPointBuffer` instance
+        """
+        return MetricPointBuffer(
+            self,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queued=max_queued,
+            workers=workers,
+        )
 
     def count(self, metric_id) -> int:
         """
@@ -88,7 +147,12 @@ class MetricPointsManager(Manager):
         return self._count(self.path.format(metric_id))
 
     def list(
-        self, metric_id: int, page: int = 1, per_page: int = 20
+        self,
+        metric_id: int,
+        page: int = 1,
+        per_page: int = 20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[MetricPoint, None, None]:
         """
         List updates for a metric
@@ -99,16 +163,335 @@ class MetricPointsManager(Manager):
         Keyword Args:
             page (int): The first page to request
             per_page (int): Entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Return:
             Generator of :py:data:`MetricPoint`
         """
-        yield from self._list_paginated(
-            self.path.format(metric_id), page=page, per_page=per_page
+        return self._list_paginated(
+            self.path.format(metric_id),
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    def columns(
+        self,
+        metric_id: int,
+        page: int = 1,
+        per_page: int = 100,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> "MetricPointColumns":
+        """
+        Export the points of a metric as typed columns.
+
+        Pages are appended straight to the columns without
+        creating :py:data:`MetricPoint` instances, making this
+        much cheaper than :py:meth:`list` for large histories.
+
+        Example::
+
+            columns = client.metric_points.columns(metric_id, workers=4)
+            values = columns.to_numpy().values
+            print(values.mean(), numpy.percentile(values, 95))
+
+        Args:
+            metric_id: The metric id to export points for
+
+        Keyword Args:
+            page (int): The first page to request
+            per_page (int): Entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while appending
+
+        Returns:
+            :py:class:`MetricPointColumns` instance
+        """
+        columns = MetricPointColumns()
+        pages = self._iter_pages(
+            self.path.format(metric_id),
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
         )
+        for entries in pages:
+            columns.extend(entries)
+        return columns
 
     def delete(self, metric_id: int, point_id: int) -> None:
         """
         Delete a metric point
         """
-        self._delete(self.path.format(metric_id), point_id)
+        return self._delete(self.path.format(metric_id), point_id)
+
+
+class MetricPointBuffer:
+    """
+    Queues metric points per metric and creates them from a background thread.
+
+    Points keep the time they were added to the buffer. Use as a
+    context manager or call :py:meth:`close` to flush the remaining points.
+    """
+
+    def __init__(
+        self,
+        manager: MetricPointsManager,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_queued: int = 10000,
+        workers: int = 1,
+    ):
+        """
+        Args:
+            manager: The manager creating the points
+
+        Keyword Args:
+            batch_size (int): Number of queued points triggering a flush
+            flush_interval (float): Max seconds between each flush
+            max_queued (int): Max number of queued points. New points are dropped when full.
+            workers (int): Number of threads creating points during a flush
+        """
+        self._manager = manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queued = max_queued
+        self.workers = workers
+
+        self._queue: Dict[int, List[Tuple[float, datetime]]] = OrderedDict()
+        self._queued = 0
+        self._in_flight = 0
+        self._dropped = 0
+        self._sent = 0
+        self._failed = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+
+        self._thread = threading.Thread(
+            target=self._run, name="cachetclient-metric-points", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def queued(self) -> int:
+        """int: Number of points waiting to be sent"""
+        return self._queued
+
+    @property
+    def dropped(self) -> int:
+        """int: Number of points dropped because the buffer was full"""
+        return self._dropped
+
+    @property
+    def sent(self) -> int:
+        """int: Number of points successfully created"""
+        return self._sent
+
+    @property
+    def failed(self) -> int:
+        """int: Number of points the server failed to create"""
+        return self._failed
+
+    def add(self, metric_id: int, value: float, timestamp: datetime = None) -> bool:
+        """
+        Queue a metric point.
+
+        Args:
+            metric_id (int): The metric to add the point to
+            value (float): Metric point value
+            timestamp (datetime): When the value was measured. Defaults to now.
+
+        Returns:
+            bool: ``False`` if the point was dropped because the buffer is full
+
+        Raises:
+            RuntimeError: if the buffer is closed
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Metric point buffer is closed")
+
+            if self._queued >= self.max_queued:
+                self._dropped += 1
+                return False
+
+            self._queue.setdefault(metric_id, []).append(
+                (value, timestamp or datetime.now())
+            )
+            self._queued += 1
+            if self._queued >= self.batch_size:
+                self._cond.notify_all()
+
+        return True
+
+    def flush(self) -> None:
+        """Create all queued points, blocking until they are sent"""
+        self._flush()
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight == 0)
+
+    def close(self) -> None:
+        """Stop the background thread and flush the remaining points"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> "MetricPointBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Background thread flushing on size or interval"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or self._queued >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                if self._closed:
+                    return
+
+            self._flush()
+
+    def _flush(self) -> None:
+        """Take the queued points and send them"""
+        with self._flush_lock:
+            with self._cond:
+                queue, self._queue = self._queue, OrderedDict()
+                self._in_flight += self._queued
+                self._queued = 0
+
+            points = [
+                (metric_id, value, timestamp)
+                for metric_id, entries in queue.items()
+                for value, timestamp in entries
+            ]
+            if not points:
+                return
+
+            if self.workers > 1:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    results = list(executor.map(self._send, points))
+            else:
+                results = [self._send(point) for point in points]
+
+            with self._cond:
+                self._in_flight -= len(points)
+                self._sent += results.count(True)
+                self._failed += results.count(False)
+                self._cond.notify_all()
+
+    def _send(self, point: Tuple[int, float, datetime]) -> bool:
+        """Create a single metric point"""
+        metric_id, value, timestamp = point
+        try:
+            self._manager.create(metric_id=metric_id, value=value, timestamp=timestamp)
+        except Exception as ex:
+            logger.warning("Failed to create point for metric %s: %s", metric_id, ex)
+            return False
+        return True
+
+
+class MetricPointColumns:
+    """
+    Metric points stored column wise in typed arrays.
+
+    ``ids`` and ``timestamps`` are ``array('q')`` and ``values``
+    is ``array('d')``, all in the order returned by the server.
+    Timestamps are unix time in seconds of ``created_at``
+    interpreted as local time, like the ``timestamp`` passed to
+    :py:meth:`MetricPointsManager.create`. Use :py:meth:`to_numpy`
+    to get the columns as NumPy arrays.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.values = array("d")
+        self.timestamps = array("q")
+
+    def extend(self, entries: List[dict]) -> None:
+        """
+        Append raw metric point data.
+
+        Args:
+            entries (list): Metric points as returned by the api
+        """
+        to_datetime = utils.to_datetime
+        self.ids.extend(entry["id"] for entry in entries)
+        self.values.extend(float(entry["value"]) for entry in entries)
+        self.timestamps.extend(
+            int(to_datetime(entry["created_at"]).timestamp()) for entry in entries
+        )
+
+    def to_numpy(self) -> "MetricPointColumns":
+        """
+        Copy the columns to NumPy arrays.
+        Requires NumPy (``pip install cachet-client[numpy]``).
+
+        Returns:
+            :py:class:`MetricPointColumns` with ``int64`` ids and timestamps
+            and ``float64`` values
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "NumPy is required to export numpy arrays: "
+                "pip install cachet-client[numpy]"
+            )
+
+        columns = MetricPointColumns()
+        columns.ids = numpy.array(self.ids, dtype=numpy.int64)
+        columns.values = numpy.array(self.values, dtype=numpy.float64)
+        columns.timestamps = numpy.array(self.timestamps, dtype=numpy.int64)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class AsyncMetricPointsManager(AsyncManager, MetricPointsManager):
+    """Asyncio version of :py:class:`MetricPointsManager`"""
+
+    async def columns(
+        self,
+        metric_id: int,
+        page: int = 1,
+        per_page: int = 100,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> MetricPointColumns:
+        """
+        Export the points of a metric as typed columns.
+        See :py:meth:`MetricPointsManager.columns` for arguments.
+        """
+        columns = MetricPointColumns()
+        pages = self._iter_pages(
+            self.path.format(metric_id),
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+        async for entries in pages:
+            columns.extend(entries)
+        return columns
+
+    def buffered(self, **kwargs) -> MetricPointBuffer:
+        """
+        Create a :py:class:`MetricPointBuffer` sending points through the
+        http client wrapped by the async client. Adding points never blocks
+        the event loop. See :py:meth:`MetricPointsManager.buffered` for arguments.
+        """
+        return MetricPointsManager(self._http.http_client).buffered(**kwargs)
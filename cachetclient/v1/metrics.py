@@ -1,13 +1,20 @@
+import threading
+import time
 from datetime import datetime
-from typing import Generator, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 from cachetclient import utils
-from cachetclient.v1.metric_points import MetricPointsManager
+from cachetclient.v1 import enums
+from cachetclient.v1.metric_points import MetricPointBuffer, MetricPointsManager
 from cachetclient.httpclient import HttpClient
 
 
-class Metric(Resource):
+class CompactMetric(Resource):
+    """Metric without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         return self.get("id")
@@ -115,8 +122,13 @@ class Metric(Resource):
         return self._manager.points.list(self.id)
 
 
+class Metric(CompactMetric):
+    """Metric resource. Unlike :py:class:`CompactMetric` instances have a ``__dict__``"""
+
+
 class MetricsManager(Manager):
     resource_class = Metric
+    compact_resource_class = CompactMetric
     path = "metrics"
 
     def __init__(
@@ -158,13 +170,21 @@ class MetricsManager(Manager):
             },
         )
 
-    def list(self, page: int = 1, per_page: int = 1) -> Generator[Metric, None, None]:
+    def list(
+        self,
+        page: int = 1,
+        per_page: int = 1,
+        workers: int = None,
+        read_ahead: int = None,
+    ) -> Generator[Metric, None, None]:
         """
         List all metrics paginated
 
         Keyword Args:
             page (int): Page to start on
             per_page (int): entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Returns:
             Generator of :py:data:`Metric`s
@@ -173,6 +193,8 @@ class MetricsManager(Manager):
             self.path,
             page=page,
             per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
         )
 
     def count(self) -> int:
@@ -206,4 +228,186 @@ class MetricsManager(Manager):
         Args:
             metric_id (int): The metric id
         """
-        self._delete(self.path, metric_id)
+        return self._delete(self.path, metric_id)
+
+    def aggregator(
+        self, buffer: MetricPointBuffer = None, default_threshold: int = 5
+    ) -> "MetricPointAggregator":
+        """
+        Create an aggregator folding samples into one metric point
+        per metric and threshold period.
+
+        Keyword Args:
+            buffer (MetricPointBuffer): Queue the aggregated points in this buffer
+                                        instead of creating them right away
+            default_threshold (int): Minutes per bucket for metrics without a threshold
+
+        Returns:
+            :py:class:`MetricPointAggregator` instance
+        """
+        return MetricPointAggregator(
+            self, buffer=buffer, default_threshold=default_threshold
+        )
+
+
+class MetricPointAggregator:
+    """
+    Folds metric samples into time buckets before they are uploaded.
+
+    The bucket size is the ``threshold`` (minutes) of the metric and
+    samples in a bucket are summed or averaged according to the
+    ``calc_type`` of the metric (see :py:data:`enums`). One point is
+    created per bucket with the start of the bucket as timestamp.
+    Metrics are fetched from the server the first time a sample is added
+    unless registered up front with :py:meth:`register`.
+
+    A bucket is emitted when a sample for a later bucket of the same metric
+    arrives or when :py:meth:`flush` is called after the bucket has ended.
+    """
+
+    def __init__(
+        self,
+        manager: MetricsManager,
+        buffer: MetricPointBuffer = None,
+        default_threshold: int = 5,
+    ):
+        """
+        Args:
+            manager: The metrics manager
+
+        Keyword Args:
+            buffer (MetricPointBuffer): Queue the aggregated points in this buffer
+                                        instead of creating them right away
+            default_threshold (int): Minutes per bucket for metrics without a threshold
+        """
+        self._manager = manager
+        self._buffer = buffer
+        self.default_threshold = default_threshold
+
+        self._lock = threading.RLock()
+        self._metrics: Dict[int, Tuple[int, int]] = {}
+        # metric_id -> {bucket_start: [sum, count]}
+        self._buckets: Dict[int, Dict[int, List[float]]] = {}
+        self._samples = 0
+        self._emitted = 0
+
+    @property
+    def samples(self) -> int:
+        """int: Number of samples added"""
+        return self._samples
+
+    @property
+    def emitted(self) -> int:
+        """int: Number of aggregated points emitted"""
+        return self._emitted
+
+    def register(self, metric: Metric) -> None:
+        """
+        Register the calc type and threshold of a metric.
+        Avoids fetching the metric on the first sample.
+
+        Args:
+            metric (Metric): The metric
+        """
+        with self._lock:
+            self._metrics[metric.id] = (
+                metric.calc_type or enums.METRIC_CALC_SUM,
+                metric.threshold or self.default_threshold,
+            )
+
+    def add(self, metric_id: int, value: float, timestamp: datetime = None) -> None:
+        """
+        Add a sample.
+
+        Args:
+            metric_id (int): The metric
+            value (float): Sample value
+            timestamp (datetime): When the sample was measured. Defaults to now.
+        """
+        if metric_id not in self._metrics:
+            self.register(self._manager.get(metric_id))
+
+        epoch = timestamp.timestamp() if timestamp else time.time()
+        with self._lock:
+            _, threshold = self._metrics[metric_id]
+            bucket = int(epoch // (threshold * 60) * threshold * 60)
+            buckets = self._buckets.setdefault(metric_id, {})
+            totals = buckets.setdefault(bucket, [0.0, 0])
+            totals[0] += value
+            totals[1] += 1
+            self._samples += 1
+            ended = [b for b in buckets if b < bucket]
+
+        if ended:
+            self._emit(metric_id, ended)
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Emit all buckets that have ended.
+
+        Keyword Args:
+            force (bool): Also emit buckets that are still open
+
+        Returns:
+            int: Number of points emitted
+        """
+        now = time.time()
+        with self._lock:
+            ended = {
+                metric_id: [
+                    b
+                    for b in buckets
+                    if force or b + self._metrics[metric_id][1] * 60 <= now
+                ]
+                for metric_id, buckets in self._buckets.items()
+            }
+
+        return sum(
+            self._emit(metric_id, buckets) for metric_id, buckets in ended.items()
+        )
+
+    def close(self) -> None:
+        """Emit all buckets including the open ones"""
+        self.flush(force=True)
+
+    def __enter__(self) -> "MetricPointAggregator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _emit(self, metric_id: int, buckets: List[int]) -> int:
+        """Remove buckets and send one point for each"""
+        with self._lock:
+            calc_type, _ = self._metrics[metric_id]
+            pending = self._buckets[metric_id]
+            points = [(b, pending.pop(b)) for b in sorted(buckets) if b in pending]
+            self._emitted += len(points)
+
+        for bucket, (total, count) in points:
+            value = total / count if calc_type == enums.METRIC_CALC_AVG else total
+            timestamp = datetime.fromtimestamp(bucket)
+            if self._buffer is not None:
+                self._buffer.add(metric_id, value, timestamp=timestamp)
+            else:
+                self._manager.points.create(
+                    metric_id=metric_id, value=value, timestamp=timestamp
+                )
+
+        return len(points)
+
+
+class AsyncMetricsManager(AsyncManager, MetricsManager):
+    """Asyncio version of :py:class:`MetricsManager`"""
+
+    def aggregator(self, **kwargs) -> MetricPointAggregator:
+        """
+        Create a :py:class:`MetricPointAggregator` sending points through the
+        http client wrapped by the async client. Register the metrics up front
+        with :py:meth:`MetricPointAggregator.register` to avoid blocking
+        requests on the first sample. See :py:meth:`MetricsManager.aggregator`
+        for arguments.
+        """
+        http_client = self._http.http_client
+        manager = MetricsManager(http_client, MetricPointsManager(http_client))
+        return manager.aggregator(**kwargs)
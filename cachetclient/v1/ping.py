@@ -1,5 +1,5 @@
 import logging
-from cachetclient.base import Manager
+from cachetclient.base import AsyncManager, Manager
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +34,35 @@ class PingManager(Manager):
         """
         # FIXME: Test more explicit exceptions
         try:
-            response = self._http.get(self.path)
-            data = response.json()
-            return data["data"] == "Pong!"
+            with self._span("get", self.path):
+                response = self._http.get(self.path)
+                data = self._decode(response)
+                return data["data"] == "Pong!"
+        except Exception as ex:
+            logger.warning("Ping: %s", ex)
+            return False
+
+
+class AsyncPingManager(AsyncManager, PingManager):
+    """Asyncio version of :py:class:`PingManager`"""
+
+    async def get(self) -> bool:
+        """
+        Check if the cachet api is responding.
+
+        Example::
+
+            >> await client.ping.get()
+            True
+
+        Returns:
+            bool: ``True`` if a successful response. Otherwise ``False``.
+        """
+        try:
+            with self._span("get", self.path):
+                response = await self._http.get(self.path)
+                data = self._decode(response)
+                return data["data"] == "Pong!"
         except Exception as ex:
             logger.warning("Ping: %s", ex)
             return False
@@ -2,11 +2,15 @@ from datetime import datetime
 from cachetclient.v1 import enums
 from typing import Generator, Optional
 
-from cachetclient.base import Resource, Manager
+from cachetclient.base import AsyncManager, Resource, Manager
 from cachetclient import utils
 
 
-class Schedule(Resource):
+class CompactSchedule(Resource):
+    """Schedule without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         """int: Resource ID"""
@@ -38,9 +42,14 @@ class Schedule(Resource):
         return utils.to_datetime(self.get("completed_at"))
 
 
+class Schedule(CompactSchedule):
+    """Schedule resource. Unlike :py:class:`CompactSchedule` instances have a ``__dict__``"""
+
+
 class ScheduleManager(Manager):
     path = "schedules"
     resource_class = Schedule
+    compact_resource_class = CompactSchedule
 
     def create(
         self,
@@ -117,18 +126,30 @@ class ScheduleManager(Manager):
         )
 
     def list(
-        self, page: int = 1, per_page: int = 20
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[Schedule, None, None]:
         """List all schedules
 
         Keyword Args:
             page (int): The page to start listing
             per_page (int): Number of entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Returns:
             Generator of Schedules instances
         """
-        yield from self._list_paginated(self.path, page=page, per_page=per_page)
+        return self._list_paginated(
+            self.path,
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def get(self, schedule_id: int) -> Schedule:
         """Get a schedule by id
@@ -153,7 +174,7 @@ class ScheduleManager(Manager):
         Raises:
             HTTPError: if schedule do not exist
         """
-        self._delete(self.path, schedule_id)
+        return self._delete(self.path, schedule_id)
 
     def count(self) -> int:
         """Count the total number of scheduled events
@@ -162,3 +183,7 @@ class ScheduleManager(Manager):
             int: Number of subscribers
         """
         return self._count(self.path)
+
+
+class AsyncScheduleManager(AsyncManager, ScheduleManager):
+    """Asyncio version of :py:class:`ScheduleManager`"""
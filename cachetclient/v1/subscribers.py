@@ -1,11 +1,15 @@
 from datetime import datetime
 from typing import Generator, List, Optional
 
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 from cachetclient import utils
 
 
-class Subscriber(Resource):
+class CompactSubscriber(Resource):
+    """Subscriber without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         """int: Resource ID"""
@@ -45,10 +49,15 @@ class Subscriber(Resource):
         return "<Subscriber {}: {}>".format(self.id, self.email)
 
 
+class Subscriber(CompactSubscriber):
+    """Subscriber resource. Unlike :py:class:`CompactSubscriber` instances have a ``__dict__``"""
+
+
 class SubscriberManager(Manager):
     """Manager for subscriber endpoints"""
 
     resource_class = Subscriber
+    compact_resource_class = CompactSubscriber
     path = "subscribers"
 
     def create(
@@ -76,18 +85,30 @@ class SubscriberManager(Manager):
         )
 
     def list(
-        self, page: int = 1, per_page: int = 20
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        workers: int = None,
+        read_ahead: int = None,
     ) -> Generator[Subscriber, None, None]:
         """List all subscribers
 
         Keyword Args:
             page (int): The page to start listing
             per_page: Number of entries per page
+            workers (int): Fetch the remaining pages concurrently using this many threads
+            read_ahead (int): Number of pages fetched in the background while iterating
 
         Returns:
             Generator of Subscriber instances
         """
-        yield from self._list_paginated(self.path, page=page, per_page=per_page)
+        return self._list_paginated(
+            self.path,
+            page=page,
+            per_page=per_page,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def delete(self, subscriber_id: int) -> None:
         """Delete a specific subscriber id
@@ -98,7 +119,7 @@ class SubscriberManager(Manager):
         Raises:
             :py:data:`requests.exceptions.HttpError`: if subscriber do not exist
         """
-        self._delete(self.path, subscriber_id)
+        return self._delete(self.path, subscriber_id)
 
     def count(self) -> int:
         """Count the total number of subscribers
@@ -107,3 +128,7 @@ class SubscriberManager(Manager):
             int: Number of subscribers
         """
         return self._count(self.path)
+
+
+class AsyncSubscriberManager(AsyncManager, SubscriberManager):
+    """Asyncio version of :py:class:`SubscriberManager`"""
@@ -0,0 +1,538 @@
+"""
+Declarative sync of components and component groups.
+
+The desired state is an inventory dictionary, typically loaded from
+a yaml or json file with :py:func:`load_inventory`::
+
+    groups:
+      - name: Global Services
+        order: 1
+        visible: true
+        components:
+          - name: Website
+            description: Public website
+            link: https://example.com
+            tags: [web]
+    components:
+      - name: Build server
+        status: 1
+
+Components and groups are matched by name. Only the fields present in
+the inventory are managed and they cannot be empty (``null``), but
+``tags: []`` removes all tags. The sync lists the existing groups and
+components once and only issues requests for the resources that need
+to change.
+"""
+
+import json
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from cachetclient.base import Resource
+from cachetclient.v1 import enums
+from cachetclient.v1.components import Component
+from cachetclient.v1.component_groups import ComponentGroup
+
+COMPONENT_FIELDS = ("description", "link", "status", "order", "enabled", "tags")
+GROUP_FIELDS = ("order", "collapsed", "visible")
+
+
+class Action:
+    """A single change in a :py:class:`Plan`"""
+
+    CREATE = "create"
+    UPDATE = "update"
+    MOVE = "move"
+    DELETE = "delete"
+
+    def __init__(
+        self,
+        kind: str,
+        resource: str,
+        name: str,
+        current: Resource = None,
+        data: dict = None,
+        changes: Dict[str, Tuple[Any, Any]] = None,
+    ):
+        """
+        Args:
+            kind (str): ``create``, ``update``, ``move`` or ``delete``
+            resource (str): ``component`` or ``group``
+            name (str): Name of the resource
+
+        Keyword Args:
+            current (Resource): The existing resource
+            data (dict): The desired fields
+            changes (dict): ``{field: (old, new)}`` for updates and moves
+        """
+        self.kind = kind
+        self.resource = resource
+        self.name = name
+        self.current = current
+        self.data = data or {}
+        self.changes = changes or {}
+        self.error: Optional[Exception] = None
+
+    def __str__(self) -> str:
+        symbol = {"create": "+", "update": "~", "move": ">", "delete": "-"}[self.kind]
+        text = "{} {} '{}'".format(symbol, self.resource, self.name)
+        if self.changes:
+            text += ": " + ", ".join(
+                "{} {!r} -> {!r}".format(field, old, new)
+                for field, (old, new) in sorted(self.changes.items())
+            )
+        return text
+
+    @property
+    def resource_id(self) -> Optional[int]:
+        """int: Id of the existing resource"""
+        return self.current.id if self.current is not None else None
+
+    def __repr__(self) -> str:
+        return "<Action {}>".format(self)
+
+
+class Plan:
+    """Ordered list of actions bringing the server to the desired state"""
+
+    def __init__(self, actions: List[Action] = None, group_ids: Dict[str, int] = None):
+        """
+        Keyword Args:
+            actions (list): The actions
+            group_ids (dict): Ids of existing groups by name
+        """
+        self.actions = actions or []
+        self.group_ids = group_ids or {}
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __iter__(self):
+        return iter(self.actions)
+
+    def filter(self, kind: str = None, resource: str = None) -> List[Action]:
+        """
+        Get actions of a kind and/or resource type.
+
+        Keyword Args:
+            kind (str): ``create``, ``update``, ``move`` or ``delete``
+            resource (str): ``component`` or ``group``
+
+        Returns:
+            List of :py:class:`Action`
+        """
+        return [
+            action
+            for action in self.actions
+            if (kind is None or action.kind == kind)
+            and (resource is None or action.resource == resource)
+        ]
+
+    @property
+    def failed(self) -> List[Action]:
+        """List[Action]: Actions that failed when the plan was applied"""
+        return [action for action in self.actions if action.error is not None]
+
+    def print(self, file: TextIO = None) -> None:
+        """
+        Print the plan.
+
+        Keyword Args:
+            file: File object to write to. Defaults to stdout.
+        """
+        file = file or sys.stdout
+        for action in self.actions:
+            print(action, file=file)
+        print(
+            "{} to create, {} to update, {} to move, {} to delete".format(
+                len(self.filter(kind=Action.CREATE)),
+                len(self.filter(kind=Action.UPDATE)),
+                len(self.filter(kind=Action.MOVE)),
+                len(self.filter(kind=Action.DELETE)),
+            ),
+            file=file,
+        )
+
+
+class Index:
+    """Existing resources indexed by id, name and tag"""
+
+    def __init__(self, resources: List[Any]):
+        self.by_id: Dict[int, Any] = {}
+        self.by_name: Dict[str, List[Any]] = defaultdict(list)
+        self.by_tag: Dict[str, List[Any]] = defaultdict(list)
+        for resource in resources:
+            self.by_id[resource.id] = resource
+            self.by_name[resource.name].append(resource)
+            for tag in getattr(resource, "tag_names", ()):
+                self.by_tag[tag.lower()].append(resource)
+
+    def find(self, name: str) -> Optional[Any]:
+        """
+        Find a resource by name.
+
+        Raises:
+            ValueError: if several resources have the name
+        """
+        matches = self.by_name.get(name, [])
+        if len(matches) > 1:
+            raise ValueError(
+                "Name '{}' is ambiguous: ids {}".format(name, [r.id for r in matches])
+            )
+        return matches[0] if matches else None
+
+
+class Synchronizer:
+    """
+    Converges components and component groups to an inventory.
+
+    Example::
+
+        sync = Synchronizer(client, prune=True, tag="inventory")
+        plan = sync.plan(load_inventory("inventory.yaml"))
+        plan.print()
+        sync.apply(plan)
+    """
+
+    def __init__(self, client, prune: bool = False, tag: str = None, workers: int = 8):
+        """
+        Args:
+            client: The v1 client
+
+        Keyword Args:
+            prune (bool): Delete components and groups missing from the inventory
+            tag (str): Tag added to created components. When pruning only components
+                       with this tag are deleted and groups are left alone.
+            workers (int): Max number of concurrent requests
+        """
+        self._client = client
+        self.prune = prune
+        self.tag = tag
+        self.workers = workers
+
+    def plan(self, inventory: dict) -> Plan:
+        """
+        Compute the actions needed to reach the inventory.
+
+        Args:
+            inventory (dict): The desired state
+
+        Returns:
+            :py:class:`Plan` instance
+
+        Raises:
+            ValueError: for duplicate or ambiguous names and empty field values
+        """
+        groups, components = self._flatten(inventory)
+        group_index = Index(
+            list(self._client.component_groups.list(per_page=100, workers=self.workers))
+        )
+        component_index = Index(
+            list(self._client.components.list(per_page=100, workers=self.workers))
+        )
+
+        actions = []
+        for name, data in groups.items():
+            group = group_index.find(name)
+            if group is None:
+                actions.append(Action(Action.CREATE, "group", name, data=data))
+                continue
+            changes = self._diff_group(group, data)
+            if changes:
+                actions.append(
+                    Action(
+                        Action.UPDATE,
+                        "group",
+                        name,
+                        current=group,
+                        data=data,
+                        changes=changes,
+                    )
+                )
+
+        for name, data in components.items():
+            component = component_index.find(name)
+            if component is None:
+                actions.append(Action(Action.CREATE, "component", name, data=data))
+                continue
+
+            changes = self._diff_component(component, data)
+            current_group = group_index.by_id.get(component.get("group_id") or 0)
+            current_group_name = current_group.name if current_group else None
+            if current_group_name != data["group"]:
+                changes["group"] = (current_group_name, data["group"])
+            if changes:
+                actions.append(
+                    Action(
+                        Action.MOVE if "group" in changes else Action.UPDATE,
+                        "component",
+                        name,
+                        current=component,
+                        data=data,
+                        changes=changes,
+                    )
+                )
+
+        if self.prune:
+            if self.tag:
+                candidates = component_index.by_tag.get(self.tag.lower(), [])
+            else:
+                candidates = component_index.by_id.values()
+            for component in candidates:
+                if component.name not in components:
+                    actions.append(
+                        Action(
+                            Action.DELETE,
+                            "component",
+                            component.name,
+                            current=component,
+                        )
+                    )
+            if not self.tag:
+                for group in group_index.by_id.values():
+                    if group.name not in groups:
+                        actions.append(
+                            Action(Action.DELETE, "group", group.name, current=group)
+                        )
+
+        return Plan(
+            actions,
+            group_ids={
+                name: matches[0].id
+                for name, matches in group_index.by_name.items()
+                if len(matches) == 1
+            },
+        )
+
+    def apply(self, plan: Plan) -> Plan:
+        """
+        Execute a plan.
+
+        Groups are created and updated first, then components are
+        created, updated and moved, and finally components and groups
+        are deleted. Actions within each step run concurrently.
+        Failed actions get their ``error`` set and do not stop the sync.
+
+        Args:
+            plan (Plan): The plan to execute
+
+        Returns:
+            The same :py:class:`Plan`
+        """
+        group_ids = dict(plan.group_ids)
+
+        def save_group(action: Action) -> None:
+            group = self._save_group(action)
+            group_ids[group.name] = group.id
+
+        self._run(
+            save_group,
+            plan.filter(Action.CREATE, "group") + plan.filter(Action.UPDATE, "group"),
+        )
+        self._run(
+            lambda action: self._save_component(action, group_ids),
+            [
+                action
+                for action in plan.filter(resource="component")
+                if action.kind != Action.DELETE
+            ],
+        )
+        self._run(
+            lambda action: self._client.components.delete(action.resource_id),
+            plan.filter(Action.DELETE, "component"),
+        )
+        self._run(
+            lambda action: self._client.component_groups.delete(action.resource_id),
+            plan.filter(Action.DELETE, "group"),
+        )
+        return plan
+
+    def sync(self, inventory: dict, dry_run: bool = False, file: TextIO = None) -> Plan:
+        """
+        Plan and apply in one go.
+
+        Args:
+            inventory (dict): The desired state
+
+        Keyword Args:
+            dry_run (bool): Print the plan without applying it
+            file: Where to print the plan in dry run mode. Defaults to stdout.
+
+        Returns:
+            :py:class:`Plan` instance
+        """
+        plan = self.plan(inventory)
+        if dry_run:
+            plan.print(file=file)
+            return plan
+        return self.apply(plan)
+
+    def _run(self, func, actions: List[Action]) -> None:
+        """Run a step of the plan concurrently"""
+        if not actions:
+            return
+
+        def run(action: Action) -> None:
+            try:
+                func(action)
+            except Exception as ex:
+                action.error = ex
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(run, actions))
+
+    def _save_group(self, action: Action) -> ComponentGroup:
+        data = action.data
+        if action.kind == Action.CREATE:
+            return self._client.component_groups.create(
+                name=action.name,
+                order=data.get("order", 0),
+                collapsed=data.get("collapsed", 0),
+                visible=data.get("visible", False),
+            )
+
+        # update() resets visible unless it's passed
+        return self._client.component_groups.update(
+            action.resource_id,
+            name=action.name,
+            order=data.get("order"),
+            collapsed=data.get("collapsed"),
+            visible=data.get("visible", action.current.get("visible")),
+        )
+
+    def _save_component(self, action: Action, group_ids: Dict[str, int]) -> Component:
+        data = action.data
+        group_id = group_ids.get(data["group"], 0) if data["group"] else 0
+        if data["group"] and not group_id:
+            raise ValueError("Group '{}' was not created".format(data["group"]))
+
+        if action.kind == Action.CREATE:
+            tags = list(data.get("tags") or [])
+            if self.tag and self.tag not in tags:
+                tags.append(self.tag)
+            return self._client.components.create(
+                name=action.name,
+                status=data.get("status", enums.COMPONENT_STATUS_OPERATIONAL),
+                description=data.get("description"),
+                link=data.get("link"),
+                order=data.get("order"),
+                group_id=group_id or None,
+                enabled=data.get("enabled", True),
+                tags=tags or None,
+            )
+
+        fields = {
+            field: new for field, (_, new) in action.changes.items() if field != "group"
+        }
+        if "tags" in fields and self.tag and self.tag not in fields["tags"]:
+            fields["tags"] = list(fields["tags"]) + [self.tag]
+        if "group" in action.changes:
+            fields["group_id"] = group_id
+        fields.setdefault("status", action.current.status)
+        return self._client.components.update(action.resource_id, **fields)
+
+    def _diff_group(
+        self, group: ComponentGroup, data: dict
+    ) -> Dict[str, Tuple[Any, Any]]:
+        changes = {}
+        for field in GROUP_FIELDS:
+            if field not in data:
+                continue
+            current, value = group.get(field), data[field]
+            if field == "visible":
+                current, value = bool(current), bool(value)
+            if current != value:
+                changes[field] = (current, value)
+        return changes
+
+    def _diff_component(
+        self, component: Component, data: dict
+    ) -> Dict[str, Tuple[Any, Any]]:
+        changes = {}
+        for field in COMPONENT_FIELDS:
+            if field not in data:
+                continue
+            if field == "tags":
+                current = sorted(
+                    name for name in component.tag_names if name != self.tag
+                )
+                value = sorted(data["tags"])
+            else:
+                current, value = component.get(field), data[field]
+            if current != value:
+                changes[field] = (current, value)
+        return changes
+
+    @staticmethod
+    def _flatten(inventory: dict) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+        """Get the desired groups and components by name"""
+        groups: Dict[str, dict] = {}
+        components: Dict[str, dict] = {}
+
+        def check_values(
+            kind: str, name: str, data: dict, fields: Tuple[str, ...]
+        ) -> None:
+            # Updates leave None values untouched so they would be planned on every run
+            empty = [field for field in fields if field in data and data[field] is None]
+            if empty:
+                raise ValueError(
+                    "Empty values for {} '{}': {}".format(kind, name, ", ".join(empty))
+                )
+
+        def add_component(entry: dict, group: Optional[str]) -> None:
+            if entry["name"] in components:
+                raise ValueError("Duplicate component '{}'".format(entry["name"]))
+            data = {key: value for key, value in entry.items() if key != "name"}
+            if "status" in data and data["status"] not in enums.COMPONENT_STATUS_LIST:
+                raise ValueError(
+                    "Invalid status id '{}' for component '{}'".format(
+                        data["status"], entry["name"]
+                    )
+                )
+            check_values("component", entry["name"], data, COMPONENT_FIELDS)
+            data["group"] = group
+            components[entry["name"]] = data
+
+        for entry in inventory.get("groups") or []:
+            if entry["name"] in groups:
+                raise ValueError("Duplicate group '{}'".format(entry["name"]))
+            groups[entry["name"]] = {
+                key: value
+                for key, value in entry.items()
+                if key not in ("name", "components")
+            }
+            check_values("group", entry["name"], groups[entry["name"]], GROUP_FIELDS)
+            for component in entry.get("components") or []:
+                add_component(component, entry["name"])
+
+        for entry in inventory.get("components") or []:
+            add_component(entry, entry.get("group"))
+
+        return groups, components
+
+
+def load_inventory(path: str) -> dict:
+    """
+    Load an inventory from a yaml or json file.
+    Yaml files require PyYAML (``pip install cachet-client[yaml]``).
+
+    Args:
+        path (str): Path to a ``.yaml``, ``.yml`` or ``.json`` file
+
+    Returns:
+        dict: The inventory
+    """
+    with open(path) as fd:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(
+                    "PyYAML is required to load yaml inventories: "
+                    "pip install cachet-client[yaml]"
+                )
+            return yaml.safe_load(fd) or {}
+
+        return json.load(fd)
@@ -1,7 +1,11 @@
-from cachetclient.base import Manager, Resource
+from cachetclient.base import AsyncManager, Manager, Resource
 
 
-class Version(Resource):
+class CompactVersion(Resource):
+    """Version without an instance ``__dict__``. See :py:attr:`Manager.compact`"""
+
+    __slots__ = ()
+
     @property
     def value(self) -> str:
         """str: Version string from Cachet service"""
@@ -31,8 +35,13 @@ class Version(Resource):
         return self._data["meta"]["latest"]
 
 
+class Version(CompactVersion):
+    """Version resource. Unlike :py:class:`CompactVersion` instances have a ``__dict__``"""
+
+
 class VersionManager(Manager):
     resource_class = Version
+    compact_resource_class = CompactVersion
     path = "version"
 
     def __call__(self) -> Version:
@@ -58,5 +67,26 @@ class VersionManager(Manager):
         Returns:
             :py:data:`Version` instance
         """
-        response = self._http.get(self.path)
-        return Version(self, response.json())
+        with self._span("get", self.path):
+            response = self._http.get(self.path)
+            return self.resource_class(self, self._decode(response))
+
+
+class AsyncVersionManager(AsyncManager, VersionManager):
+    """Asyncio version of :py:class:`VersionManager`"""
+
+    async def get(self) -> Version:
+        """Get version info from the server
+
+        Example::
+
+            >> version = await client.version.get()
+            >> version.value
+            v2.3.10
+
+        Returns:
+            :py:data:`Version` instance
+        """
+        with self._span("get", self.path):
+            response = await self._http.get(self.path)
+            return self.resource_class(self, self._decode(response))
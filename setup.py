@@ -28,6 +28,13 @@ setup(
     install_requires=[
         'requests>=2.21.0'
     ],
+    extras_require={
+        'yaml': ['PyYAML>=5.1'],
+        'numpy': ['numpy>=1.16'],
+        'orjson': ['orjson>=3.0'],
+        'msgpack': ['msgpack>=1.0'],
+        'tracing': ['opentelemetry-api>=1.0'],
+    },
     entry_points={'console_scripts': [
         'cachet = cachetclient.cli:execute_from_command_line',
     ]},
@@ -1,4 +1,5 @@
 """Fake cachet api"""
+import json
 import math
 import random
 import re
@@ -129,6 +130,7 @@ class FakeComponents(FakeData):
             "status_name": "Operational",
             "order": data.get('order'),
             "group_id": data.get('group_id'),
+            "enabled": data.get('enabled'),
             "created_at": "2015-08-01 12:00:00",
             "updated_at": "2015-08-01 12:00:00",
             "deleted_at": None,
@@ -141,7 +143,8 @@ class FakeComponents(FakeData):
         # TODO: Rules on what field can be updated
         instance = self.get_by_id(component_id)
         instance.update(data)
-        instance['tags'] = self._transform_tags(instance.get('tags'))
+        if 'tags' in data:
+            instance['tags'] = self._transform_tags(data['tags'])
         return FakeHttpResponse(data={'data': instance})
 
     def delete(self, component_id=None, params=None, data=None):
@@ -344,6 +347,8 @@ class FakeMetrics(FakeData):
             'suffix': data.get('suffix'),
             'default_value': data.get('default_value'),
             'display_chart': data.get('display_chart'),
+            'calc_type': data.get('calc_type', 0),
+            'threshold': data.get('threshold', 5),
             'created_at': '2019-05-25 15:21:34',
             'updated_at': '2019-05-25 15:21:34',
         }
@@ -360,12 +365,16 @@ class FakeMetricPoints(FakeData):
 
     def post(self, metric_id=None, params=None, data=None):
         new_id = self.next_id()
+        created_at = '2019-05-25 15:21:34'
+        if data.get('timestamp'):
+            created_at = datetime.fromtimestamp(data['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+
         instance = {
             'id': new_id,
             'metric_id': int(metric_id),
             'value': data['value'],
-            'created_at': '2019-05-25 15:21:34',
-            'updated_at': '2019-05-25 15:21:34',
+            'created_at': created_at,
+            'updated_at': created_at,
         }
         self.add_entry(instance)
         return FakeHttpResponse(data={'data': instance})
@@ -459,17 +468,31 @@ class FakeHttpClient:
     """Fake implementation of the httpclient"""
     is_fake_client = True
 
-    def __init__(self, base_url, api_token, timeout=None, verify_tls=True, user_agent=None):
+    def __init__(self, base_url, api_token, timeout=None, verify_tls=True, user_agent=None,
+                 pool_size=10, pool_block=False, keep_alive=True, retry=None, rate_limiter=None,
+                 cache=None, conditional=False, codec=None, hooks=None):
         self.routes = Routes()
         self.base_url = base_url
         self.api_token = api_token
         self.timeout = timeout
         self.verify_tls = verify_tls
         self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.conditional = conditional
+        self.codec = codec
+        self.hooks = hooks
 
     def get(self, path, params=None):
         return self.request('get', path, params=params)
 
+    def get_json(self, path, params=None):
+        return self.get(path, params=params).json()
+
     def post(self, path, data=None, params=None):
         return self.request('post', path, data=data, params=params)
 
@@ -480,7 +503,7 @@ class FakeHttpClient:
         return self.request('delete', "{}/{}".format(path, resource_id))
 
     def request(self, method, path, params=None, data=None):
-        return self.routes.dispatch(method, path, params=params, data=data)
+        return self.routes.dispatch(method.lower(), path, params=params, data=data)
 
 
 class FakeHttpResponse:
@@ -492,6 +515,10 @@ class FakeHttpResponse:
     def json(self):
         return self._data
 
+    @property
+    def content(self):
+        return json.dumps(self._data).encode()
+
     def raise_for_status(self):
         if self.status_code > 300:
             raise HTTPError(self.status_code)
@@ -0,0 +1,251 @@
+"""
+Local http server serving the fake cachet api.
+
+Wraps :py:class:`fakeapi.Routes` in a real http server so the
+actual ``HttpClient`` and ``requests`` stack can be exercised
+without a cachet instance. Latency, random errors and throttling
+can be injected to test pooling, retries and concurrency::
+
+    python tests/fakeserver.py --port 8000 --latency 0.05 --error-rate 0.1 --rate-limit 50
+
+    CACHET_ENDPOINT=http://127.0.0.1:8000/api/v1 CACHET_API_TOKEN=token cachet components list
+
+From python::
+
+    with FakeServer(latency=0.01, error_rate=0.05) as server:
+        client = cachetclient.Client(endpoint=server.endpoint, api_token=server.token)
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qsl, urlsplit
+
+from requests.exceptions import HTTPError
+
+from fakeapi import Routes
+
+API_PREFIX = '/api/v1/'
+
+
+class FakeServer:
+    """Threaded http server dispatching requests to the fake api"""
+
+    def __init__(self, host='127.0.0.1', port=0, token='token', latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, rate_limit=None, burst=None, retry_after=1, seed=None,
+                 verbose=False):
+        """
+        Keyword Args:
+            host (str): Interface to listen on
+            port (int): Port to listen on. A free port is picked by default.
+            token (str): Required ``X-Cachet-Token``. ``None`` accepts any token.
+            latency (float): Seconds to wait before each response
+            jitter (float): Max random seconds added to the latency
+            error_rate (float): Fraction of requests failing with ``error_status``
+            error_status (int): Status code of injected errors
+            rate_limit (float): Requests per second before answering ``429``
+            burst (int): Requests allowed in a burst. Defaults to ``rate_limit``.
+            retry_after (int): ``Retry-After`` seconds sent with ``429``
+            seed (int): Seed for the random error injection
+            verbose (bool): Log every request to stderr
+        """
+        self.token = token
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.burst = burst or max(1, int(rate_limit or 1))
+        self.retry_after = retry_after
+        self.verbose = verbose
+        self.routes = Routes()
+
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+
+        self._random = random.Random(seed)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._server = _ThreadingHTTPServer((host, port), _Handler)
+        self._server.fake = self
+
+    @property
+    def endpoint(self):
+        """str: The api endpoint of the server"""
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}{}'.format(host, port, API_PREFIX.rstrip('/'))
+
+    def start(self):
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={'poll_interval': 0.05}, name='fakeserver', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve requests until interrupted"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, method, path, params=None, data=None, headers=None):
+        """
+        Handle a request.
+
+        Returns:
+            tuple: status code, response data and extra headers
+        """
+        with self._lock:
+            self.requests += 1
+            inject_error = self._random.random() < self.error_rate
+            throttle = self.rate_limit is not None and not self._take_token()
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        if self.token is not None and (headers or {}).get('X-Cachet-Token') != self.token:
+            return 401, {'errors': [{'status': 401, 'title': 'Unauthorized'}]}, {}
+
+        if throttle:
+            with self._lock:
+                self.throttled += 1
+            return 429, {'errors': [{'status': 429, 'title': 'Too Many Requests'}]}, {
+                'Retry-After': str(self.retry_after)
+            }
+
+        if inject_error:
+            with self._lock:
+                self.errors += 1
+            return self.error_status, {'errors': [{'status': self.error_status, 'title': 'Injected error'}]}, {}
+
+        if not path.startswith(API_PREFIX):
+            return 404, {'errors': [{'status': 404, 'title': 'Not Found'}]}, {}
+
+        try:
+            # The fake api is not thread safe
+            with self._lock:
+                response = self.routes.dispatch(
+                    method.lower(), path[len(API_PREFIX):], params=params or {}, data=data
+                )
+        except HTTPError as ex:
+            return int(str(ex)), {'errors': [{'status': int(str(ex)), 'title': 'Not Found'}]}, {}
+        except ValueError as ex:
+            return 405, {'errors': [{'status': 405, 'title': str(ex)}]}, {}
+
+        return response.status_code, response.json(), {}
+
+    def _take_token(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_limit)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    # Lots of concurrent clients during load tests
+    request_queue_size = 128
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        params = {key: int(value) if value.isdigit() else value for key, value in parse_qsl(url.query)}
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        try:
+            data = json.loads(body.decode()) if body else None
+        except ValueError:
+            self._respond(400, {'errors': [{'status': 400, 'title': 'Invalid json'}]}, {})
+            return
+
+        status, payload, headers = self.server.fake.handle(
+            method, url.path, params=params, data=data, headers=self.headers,
+        )
+        self._respond(status, payload, headers)
+
+    def _respond(self, status, payload, headers):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        if self.server.fake.verbose:
+            super().log_message(fmt, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the fake cachet api over http')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--token', default='token', help='Required api token')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to each response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Max random seconds added to the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing')
+    parser.add_argument('--error-status', type=int, default=503, help='Status code of injected errors')
+    parser.add_argument('--rate-limit', type=float, help='Requests per second before answering 429')
+    parser.add_argument('--burst', type=int, help='Requests allowed in a burst')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    server = FakeServer(
+        host=args.host, port=args.port, token=args.token, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, error_status=args.error_status, rate_limit=args.rate_limit,
+        burst=args.burst, retry_after=args.retry_after, seed=args.seed, verbose=True,
+    )
+    print('Serving {} (token {})'.format(server.endpoint, args.token))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+import asyncio
+from unittest import mock
+
+import cachetclient
+from base import CachetTestcase
+from fakeapi import FakeHttpClient
+from cachetclient.v1 import enums
+
+
+def run(coro):
+    """Run a coroutine in a fresh event loop"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def collect(agen):
+    return [item async for item in agen]
+
+
+@mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+class AsyncClientTests(CachetTestcase):
+
+    @mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+    def setUp(self):
+        self.client = cachetclient.AsyncClient(endpoint=self.endpoint, api_token=self.token)
+
+    def tearDown(self):
+        run(self.client.close())
+
+    def test_ping(self):
+        self.assertTrue(run(self.client.ping()))
+
+    def test_version(self):
+        version = run(self.client.version())
+        self.assertEqual(version.value, "2.3.11-dev")
+
+    def test_components(self):
+        async def scenario():
+            await asyncio.gather(*[
+                self.client.components.create(
+                    name="Component {}".format(i),
+                    status=enums.COMPONENT_STATUS_OPERATIONAL,
+                )
+                for i in range(25)
+            ])
+            self.assertEqual(await self.client.components.count(), 25)
+
+            components = await collect(self.client.components.list(per_page=10))
+            self.assertEqual(len(components), 25)
+            concurrent = await collect(self.client.components.list(per_page=3, workers=4))
+            self.assertEqual([c.id for c in concurrent], [c.id for c in components])
+
+            comp = await self.client.components.get(1)
+            comp.status = enums.COMPONENT_STATUS_MAJOR_OUTAGE
+            comp = await comp.update()
+            self.assertEqual(comp.status, enums.COMPONENT_STATUS_MAJOR_OUTAGE)
+
+            await comp.delete()
+            self.assertEqual(await self.client.components.count(), 24)
+
+        run(scenario())
+
+    def test_list_read_ahead(self):
+        """Pages ahead are fetched while the first page is consumed"""
+        import asyncio
+
+        manager = self.client.components
+        fetched = []
+        fetch_page = manager._fetch_page
+
+        async def record(path, page, per_page):
+            fetched.append(page)
+            return await fetch_page(path, page, per_page)
+
+        async def scenario():
+            for i in range(25):
+                await manager.create(name="Component {}".format(i), status=enums.COMPONENT_STATUS_OPERATIONAL)
+
+            with mock.patch.object(manager, '_fetch_page', side_effect=record):
+                comps = manager.list(per_page=10, read_ahead=2)
+                self.assertEqual((await comps.__anext__()).id, 1)
+                for _ in range(20):
+                    await asyncio.sleep(0.01)
+                self.assertEqual(sorted(fetched), [1, 2, 3])
+                ids = [c.id async for c in comps]
+            self.assertEqual(ids, list(range(2, 26)))
+
+        run(scenario())
+
+    def test_validation(self):
+        """Validation from the sync managers still applies"""
+        with self.assertRaises(ValueError):
+            run(self.client.components.create(name="Bad", status=-1))
+
+    def test_incident_updates(self):
+        async def scenario():
+            incident = await self.client.incidents.create(
+                name="Something blew up!",
+                message="We are looking into it",
+                status=enums.INCIDENT_INVESTIGATING,
+            )
+            await self.client.incident_updates.create(
+                incident_id=incident.id,
+                status=enums.INCIDENT_IDENTIFIED,
+                message="Found it",
+            )
+            updates = await collect(incident.updates())
+            self.assertEqual(len(updates), 1)
+            self.assertEqual(updates[0].message, "Found it")
+
+        run(scenario())
+
+    def test_metric_points(self):
+        async def scenario():
+            metric = await self.client.metrics.create(
+                name="Latency", description="Latency", suffix="ms",
+            )
+            for value in range(3):
+                await self.client.metric_points.create(metric_id=metric.id, value=value)
+
+            points = await collect(metric.points())
+            self.assertEqual([p.value for p in points], [0, 1, 2])
+
+            columns = await self.client.metric_points.columns(metric.id, per_page=2)
+            self.assertEqual(columns.values.tolist(), [0, 1, 2])
+
+        run(scenario())
+
+    def test_close(self):
+        """Closing waits for busy workers without blocking the event loop"""
+        import time
+
+        async def scenario():
+            loop = asyncio.get_event_loop()
+            busy = loop.run_in_executor(self.client._http._executor, time.sleep, 0.3)
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while not busy.done():
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            await asyncio.gather(self.client.close(), tick())
+            self.assertTrue(busy.done())
+            self.assertGreater(ticks, 5)
+
+        run(scenario())
+
+    def test_context_manager(self):
+        async def scenario():
+            async with self.client as client:
+                self.assertTrue(await client.ping())
+
+        run(scenario())
@@ -0,0 +1,103 @@
+from unittest import mock, TestCase
+
+import cachetclient
+from base import CachetTestcase
+from fakeapi import FakeHttpClient
+from cachetclient.cache import ResponseCache
+from cachetclient.v1 import enums
+
+
+class ResponseCacheTests(TestCase):
+
+    @mock.patch('cachetclient.cache.time.monotonic')
+    def test_ttl(self, monotonic):
+        monotonic.return_value = 100.0
+        cache = ResponseCache(ttl=10, ttls={"components/groups": 60, "metrics/{}/points": 0})
+        self.assertEqual(cache.ttl_for("components"), 10)
+        self.assertEqual(cache.ttl_for("components/groups/1"), 60)
+        self.assertEqual(cache.ttl_for("metrics/1/points"), 0)
+
+        cache.set("components", None, {"data": []})
+        cache.set("components/groups", None, {"data": []})
+        cache.set("metrics/1/points", None, {"data": []})
+        self.assertEqual(len(cache), 2)
+
+        monotonic.return_value = 120.0
+        self.assertIsNone(cache.get("components"))
+        self.assertEqual(cache.get("components/groups"), {"data": []})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_ratio, 0.5)
+
+    def test_params(self):
+        cache = ResponseCache()
+        cache.set("components", {"page": 1, "per_page": 20}, {"page": 1})
+        self.assertEqual(cache.get("components", {"per_page": 20, "page": 1}), {"page": 1})
+        self.assertIsNone(cache.get("components", {"per_page": 20, "page": 2}))
+        self.assertIsNone(cache.get("components"))
+
+    def test_copies(self):
+        """Mutating returned data must not affect the cache"""
+        cache = ResponseCache()
+        data = {"data": {"tags": {}}}
+        cache.set("components/1", None, data)
+        data["data"]["tags"]["a"] = "b"
+        cache.get("components/1")["data"]["tags"]["c"] = "d"
+        self.assertEqual(cache.get("components/1"), {"data": {"tags": {}}})
+
+    def test_lru(self):
+        cache = ResponseCache(maxsize=2)
+        cache.set("components/1", None, 1)
+        cache.set("components/2", None, 2)
+        cache.get("components/1")
+        cache.set("components/3", None, 3)
+        self.assertEqual(cache.get("components/1"), 1)
+        self.assertIsNone(cache.get("components/2"))
+        self.assertEqual(cache.get("components/3"), 3)
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        for path in ["components", "components/1", "components/groups", "incidents", "metrics/1/points", "metrics"]:
+            cache.set(path, None, path)
+
+        self.assertEqual(cache.invalidate("components"), 3)
+        self.assertEqual(cache.get("incidents"), "incidents")
+        self.assertEqual(cache.invalidate("metrics/1/points"), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+@mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+class CachedClientTests(CachetTestcase):
+
+    def test_get_list_count(self):
+        client = cachetclient.Client(endpoint=self.endpoint, api_token=self.token, cache=ResponseCache())
+        cache = client.components._http.cache
+        for i in range(3):
+            client.components.create(name="Component {}".format(i), status=enums.COMPONENT_STATUS_OPERATIONAL)
+
+        with mock.patch.object(FakeHttpClient, 'get', wraps=client.components._http.get) as get:
+            self.assertEqual(client.components.count(), 3)
+            self.assertEqual(client.components.count(), 3)
+            self.assertEqual(len(list(client.components.list(per_page=2))), 3)
+            self.assertEqual(len(list(client.components.list(per_page=2))), 3)
+            self.assertEqual(client.components.get(1).name, "Component 0")
+            self.assertEqual(client.components.get(1).name, "Component 0")
+            self.assertEqual(get.call_count, 4)
+
+        self.assertEqual(cache.hits, 4)
+        self.assertEqual(cache.misses, 4)
+
+    def test_invalidation(self):
+        client = cachetclient.Client(endpoint=self.endpoint, api_token=self.token, cache=ResponseCache())
+        comp = client.components.create(name="Component", status=enums.COMPONENT_STATUS_OPERATIONAL)
+        self.assertEqual(client.components.count(), 1)
+
+        client.components.create(name="Other", status=enums.COMPONENT_STATUS_OPERATIONAL)
+        self.assertEqual(client.components.count(), 2)
+
+        client.components.update(comp.id, status=enums.COMPONENT_STATUS_MAJOR_OUTAGE)
+        self.assertEqual(client.components.get(comp.id).status, enums.COMPONENT_STATUS_MAJOR_OUTAGE)
+
+        client.components.delete(comp.id)
+        self.assertEqual(client.components.count(), 1)
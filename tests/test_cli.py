@@ -0,0 +1,134 @@
+import io
+import json
+import subprocess
+import sys
+import unittest
+from unittest import mock, TestCase
+
+from requests.exceptions import HTTPError
+
+from fakeapi import FakeHttpClient
+from cachetclient import cli
+
+ENDPOINT = 'https://status.example.com/api/v1'
+
+
+class CliTests(TestCase):
+
+    def setUp(self):
+        self.http = FakeHttpClient(ENDPOINT, 'token')
+        patcher = mock.patch('cachetclient.client.HttpClient', new=lambda *args, **kwargs: self.http)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_cli(self, *argv, stdin=''):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        status = cli.main(
+            ['--endpoint', ENDPOINT, '--token', 'token'] + list(argv),
+            stdin=io.StringIO(stdin),
+            stdout=stdout,
+            stderr=stderr,
+        )
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_single(self):
+        status, out, _ = self.run_cli('components', 'create', 'name=Website', 'status=1', 'tags=web,public')
+        self.assertEqual(status, 0)
+        created = json.loads(out)
+        self.assertEqual(created['name'], 'Website')
+        self.assertEqual(created['tags'], {'web': 'web', 'public': 'public'})
+
+        status, out, _ = self.run_cli('components', 'update', 'id=1', 'status=4')
+        self.assertEqual(json.loads(out)['status'], 4)
+
+        # Partial updates keep the required status
+        status, out, _ = self.run_cli('components', 'update', 'id=1', 'name=API')
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out)['name'], 'API')
+        self.assertEqual(json.loads(out)['status'], 4)
+
+        status, out, _ = self.run_cli('components', 'get', '1')
+        self.assertEqual(json.loads(out)['id'], 1)
+
+        status, out, _ = self.run_cli('components', 'count')
+        self.assertEqual(out.strip(), '1')
+
+        status, out, _ = self.run_cli('components', 'delete', 'id=1')
+        self.assertEqual((status, out), (0, ''))
+
+    def test_bulk_ndjson(self):
+        stdin = '\n'.join(json.dumps({'name': 'Component {}'.format(i), 'status': 1}) for i in range(30))
+        status, out, _ = self.run_cli('--workers', '8', 'components', 'create', '--input', 'ndjson', stdin=stdin)
+        self.assertEqual(status, 0)
+        # Results are written in input order
+        self.assertEqual([json.loads(line)['name'] for line in out.splitlines()],
+                         ['Component {}'.format(i) for i in range(30)])
+
+        status, out, _ = self.run_cli('components', 'list', '--per-page', '7')
+        self.assertEqual(len(out.splitlines()), 30)
+
+    def test_bulk_csv(self):
+        status, out, _ = self.run_cli('metrics', 'create', 'name=Latency', 'description=Latency', 'suffix=ms')
+        stdin = 'metric_id,value,timestamp\n1,10,1600000000\n1,20,\n'
+        status, out, _ = self.run_cli('--output', 'csv', 'points', 'create', '--input', 'csv', stdin=stdin)
+        self.assertEqual(status, 0)
+        lines = out.splitlines()
+        self.assertTrue(lines[0].startswith('id,'))
+        self.assertEqual(len(lines), 3)
+
+        status, out, _ = self.run_cli('points', 'count', '--metric-id', '1')
+        self.assertEqual(out.strip(), '2')
+
+    def test_errors(self):
+        stdin = '{"id": 1, "status": 1}\n{"status": 1}\n'
+        self.run_cli('components', 'create', 'name=Website', 'status=1')
+        status, out, err = self.run_cli('components', 'update', '--input', 'ndjson', stdin=stdin)
+        self.assertEqual(status, 1)
+        self.assertEqual(len(out.splitlines()), 1)
+        self.assertIn("'id' is required", err)
+
+        status, _, err = self.run_cli('components', 'create', 'name')
+        self.assertEqual(status, 2)
+        self.assertIn('key=value', err)
+
+        status, _, err = self.run_cli('components', 'update', '--input', 'ndjson', stdin='[1]')
+        self.assertEqual(status, 2)
+
+    def test_parse_value(self):
+        self.assertEqual(cli.parse_value('status', '1'), 1)
+        self.assertEqual(cli.parse_value('name', 'Website'), 'Website')
+        self.assertEqual(cli.parse_value('visible', 'true'), True)
+        self.assertEqual(cli.parse_value('components', '1,2'), [1, 2])
+        self.assertEqual(cli.parse_value('tags', ['a']), ['a'])
+        self.assertEqual(cli.parse_value('scheduled_at', '2019-05-24 09:26:22').year, 2019)
+        self.assertEqual(cli.parse_value('timestamp', '1600000000').year, 2020)
+        # Only known non-string fields are decoded
+        self.assertEqual(cli.parse_value('name', '123'), '123')
+        self.assertEqual(cli.parse_value('description', 'null'), 'null')
+        self.assertEqual(cli.parse_value('message', 'true'), 'true')
+
+    def test_string_values(self):
+        status, out, _ = self.run_cli('components', 'create', 'name=123', 'description=null', 'status=1')
+        self.assertEqual(status, 0)
+        created = json.loads(out)
+        self.assertEqual(created['name'], '123')
+        self.assertEqual(created['description'], 'null')
+
+    def test_list_errors(self):
+        with mock.patch.object(self.http, 'get_json', side_effect=HTTPError('500 Server Error')):
+            for action in ('list', 'count'):
+                status, out, err = self.run_cli('components', action)
+                self.assertEqual(status, 1)
+                self.assertEqual(out, '')
+                self.assertEqual(err, 'error: 500 Server Error\n')
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Lazy imports require python 3.7+")
+    def test_lazy_imports(self):
+        """Importing the cli must not load requests or the managers"""
+        code = (
+            "import sys, cachetclient.cli; "
+            "print(sorted(m for m in sys.modules if m == 'requests' or m.startswith('cachetclient.v1.')))"
+        )
+        output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True)
+        self.assertEqual(output.strip(), '[]')
+
@@ -54,3 +54,36 @@ class ClientTests(CachetTestcase):
         with mock.patch.dict('os.environ', envs):
             with self.assertRaises(ValueError):
                 cachetclient.Client()
+
+    def test_http_options(self):
+        """Http options are passed on to the http client"""
+        client = cachetclient.Client(
+            endpoint=self.endpoint,
+            api_token=self.token,
+            timeout=5,
+            user_agent="cachet-test",
+            pool_size=32,
+            pool_block=True,
+            keep_alive=False,
+        )
+        self.assertEqual(client._http.timeout, 5)
+        self.assertEqual(client._http.user_agent, "cachet-test")
+        self.assertEqual(client._http.pool_size, 32)
+        self.assertTrue(client._http.pool_block)
+        self.assertFalse(client._http.keep_alive)
+
+
+    def test_lazy_managers(self):
+        """Managers are created on first access and reused"""
+        client = cachetclient.Client(endpoint=self.endpoint, api_token=self.token)
+        self.assertNotIn('components', vars(client))
+
+        groups = client.component_groups
+        self.assertIs(groups, client.component_groups)
+        self.assertIs(groups.components, client.components)
+        self.assertIs(client.incidents.updates, client.incident_updates)
+        self.assertIs(client.metrics.points, client.metric_points)
+        self.assertNotIn('schedules', vars(client))
+
+        other = cachetclient.Client(endpoint=self.endpoint, api_token=self.token)
+        self.assertIsNot(other.components, client.components)
@@ -0,0 +1,56 @@
+from unittest import mock, TestCase
+
+import cachetclient
+from base import CachetTestcase
+from fakeapi import FakeHttpClient
+from cachetclient import codec
+from cachetclient.codec import JsonCodec, get_codec
+
+DATA = {"data": [{"id": 1, "name": "Website ✓", "tags": {}, "enabled": True, "value": 1.5, "group_id": None}]}
+
+
+class CodecTests(TestCase):
+
+    def test_codecs(self):
+        for name in codec.CODECS:
+            try:
+                json_codec = get_codec(name)
+            except ImportError:
+                continue
+
+            self.assertEqual(json_codec.name, name)
+            encoded = json_codec.dumps(DATA)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(json_codec.loads(encoded), DATA)
+            self.assertEqual(json_codec.loads(encoded.decode()), DATA)
+            with self.assertRaises(ValueError):
+                json_codec.loads(b"{")
+
+    def test_default(self):
+        self.assertIs(get_codec(), get_codec())
+        self.assertIn(get_codec().name, codec.CODECS)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+
+@mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+class ManagerCodecTests(CachetTestcase):
+
+    def test_instance_from_json(self):
+        """Managers decode with the codec of the http client"""
+        json_codec = get_codec("json")
+        client = cachetclient.Client(
+            endpoint=self.endpoint,
+            api_token=self.token,
+            codec=JsonCodec("test", loads=mock.Mock(wraps=json_codec.loads), dumps=json_codec.dumps),
+        )
+
+        component = client.components.instance_from_json('{"id": 1, "name": "Website"}')
+        self.assertEqual(component.name, "Website")
+        components = client.components.instance_list_from_json('[{"id": 1}, {"id": 2}]')
+        self.assertEqual([c.id for c in components], [1, 2])
+
+        client.components.create(name="API", status=1)
+        self.assertEqual(client._http.codec._loads.call_count, 3)
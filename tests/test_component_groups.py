@@ -123,3 +123,30 @@ class ComponentGroupTests(CachetTestcase):
         # Attempt to deserialize a single object as a list
         with self.assertRaises(ValueError):
             groups = client.component_groups.instance_list_from_json(json.dumps(group.attrs))
+
+    def test_dump_instances(self):
+        """Bulk serialize and recreate instances"""
+        client = self.create_client()
+        for num in range(3):
+            client.component_groups.create(name="Group {}".format(num))
+        groups = list(client.component_groups.list())
+
+        formats = ['json', 'pickle']
+        try:
+            import msgpack  # noqa
+            formats.append('msgpack')
+        except ImportError:
+            pass
+
+        for fmt in formats:
+            data = client.component_groups.dump_instances(groups, fmt=fmt)
+            self.assertIsInstance(data, bytes)
+            loaded = client.component_groups.load_instances(data, fmt=fmt)
+            self.assertEqual([g.attrs for g in loaded], [g.attrs for g in groups])
+            self.assertIs(loaded[0]._manager, client.component_groups)
+            self.assertIsInstance(loaded[0].enabled_components, list)
+
+        with self.assertRaises(ValueError):
+            client.component_groups.dump_instances(groups, fmt='xml')
+        with self.assertRaises(ValueError):
+            client.component_groups.load_instances(b'{"id": 1}')
@@ -1,9 +1,13 @@
+import time
 from datetime import datetime
 from unittest import mock
 from requests.exceptions import HTTPError
 
 from base import CachetTestcase
 from fakeapi import FakeHttpClient
+from fakeserver import FakeServer
+from cachetclient import v1
+from cachetclient.httpclient import HttpClient
 from cachetclient.v1 import enums
 
 
@@ -96,3 +100,145 @@ class ComponentsTests(CachetTestcase):
         self.assertTrue(comp.has_tag(slug="tag-3"))
         self.assertTrue(comp.has_tag(name="tag 3"))
         self.assertEqual(len(comp.tags), 2)
+
+    def test_list_workers(self):
+        """List pages concurrently"""
+        for i in range(45):
+            self.create_component(self.client, name="Component {}".format(i))
+
+        expected = [c.id for c in self.client.components.list(per_page=10)]
+        self.assertEqual(len(expected), 45)
+        for workers in (1, 2, 3, 10):
+            ids = [c.id for c in self.client.components.list(per_page=10, workers=workers)]
+            self.assertEqual(ids, expected)
+
+        # Start on a later page
+        ids = [c.id for c in self.client.components.list(page=3, per_page=10, workers=2)]
+        self.assertEqual(ids, expected[20:])
+
+        # Stop early
+        comps = self.client.components.list(per_page=10, workers=4)
+        self.assertEqual(next(comps).id, 1)
+        comps.close()
+
+    def test_list_read_ahead(self):
+        """Read ahead a bounded number of pages"""
+        for i in range(45):
+            self.create_component(self.client, name="Component {}".format(i))
+
+        manager = self.client.components
+        fetched = []
+        fetch_page = manager._fetch_page
+
+        def record(path, page, per_page):
+            fetched.append(page)
+            return fetch_page(path, page, per_page)
+
+        with mock.patch.object(manager, '_fetch_page', side_effect=record):
+            comps = manager.list(per_page=10, read_ahead=2)
+            self.assertEqual([next(comps).id for _ in range(10)], list(range(1, 11)))
+            # Pages 2 and 3 are fetched while page 1 is consumed, but no more
+            deadline = time.monotonic() + 5
+            while len(fetched) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(sorted(fetched), [1, 2, 3])
+            ids = [c.id for c in comps]
+
+        self.assertEqual(ids, list(range(11, 46)))
+        self.assertEqual(sorted(fetched), [1, 2, 3, 4, 5])
+
+    def test_reconcile(self):
+        for i in range(5):
+            self.create_component(self.client, name="Component {}".format(i))
+
+        reconciler = self.client.components.reconciler(workers=2)
+        desired = {i: enums.COMPONENT_STATUS_OPERATIONAL for i in range(1, 6)}
+        desired[2] = enums.COMPONENT_STATUS_MAJOR_OUTAGE
+        desired[3] = {"status": enums.COMPONENT_STATUS_OPERATIONAL, "name": "Renamed", "tags": ["a", "b"]}
+        desired[99] = enums.COMPONENT_STATUS_OPERATIONAL
+
+        with mock.patch.object(self.client.components, 'update', wraps=self.client.components.update) as update:
+            report = reconciler.reconcile(desired, dry_run=True)
+            self.assertEqual(update.call_count, 0)
+            self.assertEqual(set(report.changed), {2, 3})
+
+            report = reconciler.reconcile(desired)
+            self.assertEqual(update.call_count, 2)
+            self.assertEqual(report.changed[2], {"status": (1, 4)})
+            self.assertEqual(report.changed[3], {"name": ("Component 2", "Renamed"), "tags": ([], ["a", "b"])})
+            self.assertEqual(sorted(report.unchanged), [1, 4, 5])
+            self.assertEqual(report.missing, [99])
+            self.assertFalse(report.ok)
+
+            # Steady state does not write anything
+            del desired[99]
+            report = reconciler.reconcile(desired)
+            self.assertEqual(update.call_count, 2)
+            self.assertEqual(sorted(report.unchanged), [1, 2, 3, 4, 5])
+            self.assertTrue(report.ok)
+
+        self.assertEqual(self.client.components.get(2).status, enums.COMPONENT_STATUS_MAJOR_OUTAGE)
+        self.assertEqual(self.client.components.get(3).tag_names, ["a", "b"])
+
+    def test_reconcile_external_changes(self):
+        """Components changed by others are corrected once the snapshot expires"""
+        with FakeServer() as server:
+            # The real http client so the snapshot does not share data with the fake api
+            client = v1.Client(HttpClient(server.endpoint, server.token))
+            client.components.create(name="Component", status=enums.COMPONENT_STATUS_OPERATIONAL)
+            reconciler = client.components.reconciler()
+            self.assertEqual(reconciler.max_age, 60)
+
+            desired = {1: enums.COMPONENT_STATUS_OPERATIONAL}
+            self.assertEqual(reconciler.reconcile(desired).unchanged, [1])
+            client.components.update(1, status=enums.COMPONENT_STATUS_MAJOR_OUTAGE)
+            # Still within max_age
+            self.assertEqual(reconciler.reconcile(desired).unchanged, [1])
+
+            later = time.monotonic() + 61
+            with mock.patch('cachetclient.v1.components.time.monotonic', return_value=later):
+                report = reconciler.reconcile(desired)
+            self.assertEqual(report.changed, {1: {"status": (4, 1)}})
+            self.assertEqual(client.components.get(1).status, enums.COMPONENT_STATUS_OPERATIONAL)
+
+    def test_reconcile_converges(self):
+        """Removing all tags is sent to the server and the response is checked"""
+        with FakeServer() as server:
+            client = v1.Client(HttpClient(server.endpoint, server.token))
+            client.components.create(name="Component", status=enums.COMPONENT_STATUS_OPERATIONAL, tags=["x"])
+            reconciler = client.components.reconciler()
+
+            with self.assertRaises(ValueError):
+                reconciler.reconcile({1: {"description": None}})
+
+            report = reconciler.reconcile({1: {"tags": []}})
+            self.assertEqual(report.changed, {1: {"tags": (["x"], [])}})
+            self.assertTrue(report.ok)
+            self.assertEqual(client.components.get(1).tag_names, [])
+            self.assertEqual(reconciler.reconcile({1: {"tags": []}}).unchanged, [1])
+
+            # The server ignoring an update is reported
+            def ignored(component_id, **kwargs):
+                return client.components.get(component_id)
+
+            with mock.patch.object(client.components, 'update', side_effect=ignored):
+                report = reconciler.reconcile({1: {"name": "Renamed"}})
+            self.assertEqual(report.changed, {})
+            self.assertIsInstance(report.failed[1], RuntimeError)
+
+    def test_reconcile_errors(self):
+        self.create_component(self.client)
+        reconciler = self.client.components.reconciler()
+
+        with self.assertRaises(ValueError):
+            reconciler.reconcile({1: -1})
+        with self.assertRaises(ValueError):
+            reconciler.reconcile({1: {"color": "red"}})
+
+        with mock.patch.object(self.client.components, 'update', side_effect=HTTPError(500)):
+            report = reconciler.reconcile({1: enums.COMPONENT_STATUS_MAJOR_OUTAGE})
+        self.assertEqual(report.changed, {})
+        self.assertIsInstance(report.failed[1], HTTPError)
+        # The snapshot still holds the old status so the update is retried
+        report = reconciler.reconcile({1: enums.COMPONENT_STATUS_MAJOR_OUTAGE})
+        self.assertEqual(list(report.changed), [1])
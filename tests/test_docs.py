@@ -54,7 +54,37 @@ class DocTestCase(unittest.TestCase):
         self.assertSetEqual(documented - implemented - ignored, set(), msg='Documented but not Implemented')
 
     def test_client(self):
-        self.validate('cachetclient.client.rst', 'cachetclient.client', ignore=['detect_version'])
+        self.validate('cachetclient.client.rst', 'cachetclient.client', ignore=['detect_version', '_resolve_credentials'])
+
+    def test_codec(self):
+        self.validate('cachetclient.codec.rst', 'cachetclient.codec')
+
+    def test_json_codec(self):
+        self.validate('cachetclient.codec.rst', 'cachetclient.codec', classname='JsonCodec')
+
+    def test_response_cache(self):
+        self.validate('cachetclient.cache.rst', 'cachetclient.cache', classname='ResponseCache')
+
+    def test_http_client(self):
+        self.validate('cachetclient.httpclient.rst', 'cachetclient.httpclient', classname='HttpClient')
+
+    def test_request_event(self):
+        self.validate('cachetclient.httpclient.rst', 'cachetclient.httpclient', classname='RequestEvent')
+
+    def test_stats_collector(self):
+        self.validate('cachetclient.stats.rst', 'cachetclient.stats', classname='StatsCollector')
+
+    def test_tracing(self):
+        self.validate('cachetclient.tracing.rst', 'cachetclient.tracing', ignore=['_import_trace'])
+
+    def test_retry_policy(self):
+        self.validate('cachetclient.httpclient.rst', 'cachetclient.httpclient', classname='RetryPolicy')
+
+    def test_rate_limiter(self):
+        self.validate('cachetclient.ratelimit.rst', 'cachetclient.ratelimit', classname='RateLimiter')
+
+    def test_token_bucket(self):
+        self.validate('cachetclient.ratelimit.rst', 'cachetclient.ratelimit', classname='TokenBucket')
 
     def test_component_group(self):
         self.validate('cachetclient.v1.component_groups.rst', 'cachetclient.v1.component_groups', classname='ComponentGroup')
@@ -68,6 +98,12 @@ class DocTestCase(unittest.TestCase):
     def test_component_manager(self):
         self.validate('cachetclient.v1.components.rst', 'cachetclient.v1.components', classname='ComponentManager')
 
+    def test_component_reconciler(self):
+        self.validate('cachetclient.v1.components.rst', 'cachetclient.v1.components', classname='ComponentReconciler')
+
+    def test_reconcile_report(self):
+        self.validate('cachetclient.v1.components.rst', 'cachetclient.v1.components', classname='ReconcileReport')
+
     def test_enums(self):
         self.validate('cachetclient.v1.enums.rst', 'cachetclient.v1.enums')
 
@@ -89,14 +125,23 @@ class DocTestCase(unittest.TestCase):
     def test_metric_points_manager(self):
         self.validate('cachetclient.v1.metric_points.rst', 'cachetclient.v1.metric_points', classname='MetricPointsManager')
 
+    def test_metric_point_buffer(self):
+        self.validate('cachetclient.v1.metric_points.rst', 'cachetclient.v1.metric_points', classname='MetricPointBuffer')
+
+    def test_metric_point_columns(self):
+        self.validate('cachetclient.v1.metric_points.rst', 'cachetclient.v1.metric_points', classname='MetricPointColumns')
+
     def test_metrics(self):
         self.validate('cachetclient.v1.metrics.rst', 'cachetclient.v1.metrics', classname='Metric')
 
     def test_metrics_manager(self):
         self.validate('cachetclient.v1.metrics.rst', 'cachetclient.v1.metrics', classname='MetricsManager')
 
+    def test_metric_point_aggregator(self):
+        self.validate('cachetclient.v1.metrics.rst', 'cachetclient.v1.metrics', classname='MetricPointAggregator')
+
     def test_ping(self):
-        self.validate('cachetclient.v1.ping.rst', 'cachetclient.v1.ping', classname='PingManager', ignore=['instance_from_dict', 'instance_list_from_json', 'instance_from_json'])
+        self.validate('cachetclient.v1.ping.rst', 'cachetclient.v1.ping', classname='PingManager', ignore=['instance_from_dict', 'instance_list_from_json', 'instance_from_json', 'dump_instances', 'load_instances', 'compact', 'compact_resource_class'])
 
     def test_subscribers(self):
         self.validate('cachetclient.v1.subscribers.rst', 'cachetclient.v1.subscribers', classname='Subscriber')
@@ -109,3 +154,18 @@ class DocTestCase(unittest.TestCase):
 
     def test_version(self):
         self.validate('cachetclient.v1.version.rst', 'cachetclient.v1.version', classname='VersionManager')
+
+    def test_sync(self):
+        self.validate('cachetclient.v1.sync.rst', 'cachetclient.v1.sync')
+
+    def test_synchronizer(self):
+        self.validate('cachetclient.v1.sync.rst', 'cachetclient.v1.sync', classname='Synchronizer')
+
+    def test_sync_plan(self):
+        self.validate('cachetclient.v1.sync.rst', 'cachetclient.v1.sync', classname='Plan')
+
+    def test_sync_action(self):
+        self.validate('cachetclient.v1.sync.rst', 'cachetclient.v1.sync', classname='Action')
+
+    def test_sync_index(self):
+        self.validate('cachetclient.v1.sync.rst', 'cachetclient.v1.sync', classname='Index')
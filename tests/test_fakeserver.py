@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+import requests
+
+import cachetclient
+from cachetclient.httpclient import RetryPolicy
+from fakeserver import FakeServer
+
+
+class FakeServerTests(TestCase):
+    """Exercise the real http client against the local fake server"""
+
+    def test_crud(self):
+        with FakeServer() as server:
+            client = cachetclient.Client(endpoint=server.endpoint, api_token=server.token)
+            self.assertTrue(client.ping())
+
+            component = client.components.create(name="Website", status=1, tags=["web"])
+            self.assertEqual(client.components.get(component.id).name, "Website")
+            client.components.update(component.id, status=4)
+            self.assertEqual(client.components.get(component.id).status, 4)
+
+            for num in range(30):
+                client.components.create(name="Component {}".format(num), status=1)
+            components = list(client.components.list(per_page=7, workers=4))
+            self.assertEqual(len(components), 31)
+            self.assertEqual([c.id for c in components], list(range(1, 32)))
+            self.assertEqual(client.components.count(), 31)
+
+            client.components.delete(component.id)
+            with self.assertRaises(requests.HTTPError) as ctx:
+                client.components.get(component.id)
+            self.assertEqual(ctx.exception.response.status_code, 404)
+
+    def test_token(self):
+        with FakeServer(token="secret") as server:
+            client = cachetclient.Client(endpoint=server.endpoint, api_token="wrong")
+            with self.assertRaises(requests.HTTPError) as ctx:
+                client.components.count()
+            self.assertEqual(ctx.exception.response.status_code, 401)
+
+    def test_errors(self):
+        """Injected errors are retried by the retry policy"""
+        with FakeServer(error_rate=0.3, seed=1) as server:
+            client = cachetclient.Client(
+                endpoint=server.endpoint,
+                api_token=server.token,
+                # Injected errors happen before the fake api sees the request
+                retry=RetryPolicy(max_retries=10, backoff_factor=0.001, methods=("GET", "POST")),
+            )
+            for num in range(20):
+                client.metrics.create(name="Metric {}".format(num), description="", suffix="ms")
+            self.assertEqual(client.metrics.count(), 20)
+            self.assertGreater(server.errors, 0)
+            self.assertEqual(sum(client._http.retries.values()), server.errors)
+
+    def test_throttling(self):
+        with FakeServer(rate_limit=50, burst=5, retry_after=0) as server:
+            client = cachetclient.Client(
+                endpoint=server.endpoint,
+                api_token=server.token,
+                retry=RetryPolicy(max_retries=20, backoff_factor=0.01, max_backoff=0.05, respect_retry_after=False),
+            )
+            for num in range(20):
+                client.components.create(name="Component {}".format(num), status=1)
+            self.assertEqual(len(server.routes.components.data), 20)
+            self.assertGreater(server.throttled, 0)
+            self.assertEqual(client._http.retries["POST components"], server.throttled)
+
+    def test_latency(self):
+        with FakeServer(latency=0.05) as server:
+            client = cachetclient.Client(endpoint=server.endpoint, api_token=server.token, pool_size=8)
+            for num in range(8):
+                server.routes.components.add_entry({"id": num + 1, "name": "Component", "tags": []})
+            components = list(client.components.list(per_page=1, workers=8))
+            self.assertEqual(len(components), 8)
+            self.assertEqual(server.requests, 8)
@@ -0,0 +1,283 @@
+import asyncio
+from unittest import mock, TestCase
+
+import requests
+from requests.exceptions import ConnectTimeout, HTTPError, ReadTimeout
+
+from cachetclient.codec import JsonCodec, get_codec
+from cachetclient.httpclient import HOOK_EVENTS, AsyncHttpClient, HttpClient, RetryPolicy
+
+ENDPOINT = "https://status.example.com/api/v1"
+
+
+def make_response(status_code=200, headers=None, body=b'{"data": []}'):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = body
+    response.url = ENDPOINT
+    return response
+
+
+class HttpClientTests(TestCase):
+
+    def test_pool(self):
+        """Connection pool is configured on the session adapters"""
+        http = HttpClient(ENDPOINT, "token", pool_size=32, pool_block=True)
+        adapter = http._session.get_adapter(http.base_url)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(http._session.headers["Connection"], "keep-alive")
+
+    def test_no_keep_alive(self):
+        http = HttpClient(ENDPOINT, "token", keep_alive=False)
+        self.assertEqual(http._session.headers["Connection"], "close")
+
+    def test_async_workers(self):
+        """Async client defaults to one worker per pooled connection"""
+        http = AsyncHttpClient(HttpClient(ENDPOINT, "token", pool_size=16))
+        self.assertEqual(http._executor._max_workers, 16)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(http.close())
+        loop.close()
+
+
+@mock.patch('cachetclient.httpclient.time.sleep')
+class RetryTests(TestCase):
+
+    def create_client(self, responses, **kwargs):
+        http = HttpClient(ENDPOINT, "token", retry=RetryPolicy(**kwargs))
+        http._session.request = mock.Mock(side_effect=responses)
+        return http
+
+    def test_no_policy(self, sleep):
+        http = HttpClient(ENDPOINT, "token")
+        http._session.request = mock.Mock(side_effect=[make_response(503)])
+        with self.assertRaises(HTTPError):
+            http.get("components")
+        self.assertEqual(http.retries, {})
+
+    def test_retry_status(self, sleep):
+        http = self.create_client([make_response(503), make_response(502), make_response(200)])
+        response = http.get("components/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(http._session.request.call_count, 3)
+        self.assertEqual(http.retries, {"GET components/{}": 2})
+
+    def test_max_retries(self, sleep):
+        http = self.create_client([make_response(503)] * 3, max_retries=2)
+        with self.assertRaises(HTTPError):
+            http.put("components/1", data={})
+        self.assertEqual(http._session.request.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_not_retryable_status(self, sleep):
+        http = self.create_client([make_response(404)])
+        with self.assertRaises(HTTPError):
+            http.get("components/1")
+        self.assertEqual(http._session.request.call_count, 1)
+
+    def test_post_not_retried(self, sleep):
+        """POST is not retried on errors where the request may have been processed"""
+        http = self.create_client([make_response(503)])
+        with self.assertRaises(HTTPError):
+            http.post("incidents", data={})
+
+        http = self.create_client([ReadTimeout()])
+        with self.assertRaises(ReadTimeout):
+            http.post("incidents", data={})
+
+    def test_post_retried(self, sleep):
+        """POST is retried when throttled or when no connection was made"""
+        http = self.create_client([make_response(429), ConnectTimeout(), make_response(200)])
+        http.post("metrics/1/points", data={"value": 1})
+        self.assertEqual(http.retries, {"POST metrics/{}/points": 2})
+
+    def test_connection_errors(self, sleep):
+        http = self.create_client([requests.ConnectionError(), ReadTimeout(), make_response(200)])
+        http.delete("components", 1)
+        self.assertEqual(http.retries, {"DELETE components/{}": 2})
+
+    def test_backoff(self, sleep):
+        http = self.create_client([make_response(503)] * 5, max_retries=4, jitter=False, max_backoff=1.5)
+        with self.assertRaises(HTTPError):
+            http.get("components")
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [0.5, 1.0, 1.5, 1.5])
+
+    def test_jitter(self, sleep):
+        policy = RetryPolicy(backoff_factor=1)
+        for attempt in range(5):
+            delay = policy.backoff(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, 2 ** attempt)
+
+    def test_retry_after(self, sleep):
+        http = self.create_client([make_response(429, {"Retry-After": "7"}), make_response(200)])
+        http.get("components")
+        sleep.assert_called_once_with(7.0)
+
+        policy = RetryPolicy()
+        self.assertIsNone(policy.retry_after(make_response(429, {"Retry-After": "garbage"})))
+        self.assertEqual(policy.retry_after(make_response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})), 0)
+        self.assertEqual(policy.backoff(0, make_response(429, {"Retry-After": "120"})), 30)
+
+
+class ConditionalTests(TestCase):
+
+    def test_etag(self):
+        http = HttpClient(ENDPOINT, "token", conditional=True)
+        http._session.request = mock.Mock(side_effect=[
+            make_response(200, headers={"ETag": '"v1"'}, body=b'{"data": [1]}'),
+            make_response(304),
+            make_response(200, headers={"ETag": '"v2"'}, body=b'{"data": [2]}'),
+        ])
+
+        first = http.get_json("components", params={"page": 1})
+        self.assertEqual(first, {"data": [1]})
+        self.assertEqual(http._session.request.call_args[1]["headers"], {})
+
+        # Not modified returns a copy of the stored body
+        first["data"].append(3)
+        self.assertEqual(http.get_json("components", params={"page": 1}), {"data": [1]})
+        self.assertEqual(http._session.request.call_args[1]["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(http.not_modified, 1)
+
+        self.assertEqual(http.get_json("components", params={"page": 1}), {"data": [2]})
+        self.assertEqual(http._validators[("components", (("page", 1),))][0], '"v2"')
+
+    def test_last_modified(self):
+        http = HttpClient(ENDPOINT, "token", conditional=True)
+        modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        http._session.request = mock.Mock(side_effect=[
+            make_response(200, headers={"Last-Modified": modified}),
+            make_response(304),
+        ])
+        http.get_json("components")
+        self.assertEqual(http.get_json("components"), {"data": []})
+        self.assertEqual(http._session.request.call_args[1]["headers"], {"If-Modified-Since": modified})
+
+    def test_bounded(self):
+        http = HttpClient(ENDPOINT, "token", conditional=True)
+        http.conditional_maxsize = 2
+        http._session.request = mock.Mock(
+            side_effect=lambda *args, **kwargs: make_response(200, headers={"ETag": '"v1"'})
+        )
+        for i in range(5):
+            http.get_json("components/{}".format(i))
+        self.assertEqual(len(http._validators), 2)
+
+    def test_disabled(self):
+        http = HttpClient(ENDPOINT, "token")
+        http._session.request = mock.Mock(return_value=make_response(200, headers={"ETag": '"v1"'}))
+        http.get_json("components")
+        http.get_json("components")
+        self.assertIsNone(http._session.request.call_args[1]["headers"])
+        self.assertEqual(len(http._validators), 0)
+
+    def test_async(self):
+        http = HttpClient(ENDPOINT, "token", conditional=True)
+        http._session.request = mock.Mock(side_effect=[
+            make_response(200, headers={"ETag": '"v1"'}),
+            make_response(304),
+        ])
+        client = AsyncHttpClient(http)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(client.get_json("components"))
+            self.assertEqual(loop.run_until_complete(client.get_json("components")), {"data": []})
+        finally:
+            loop.run_until_complete(client.close())
+            loop.close()
+        self.assertEqual(http.not_modified, 1)
+
+
+class CodecTests(TestCase):
+
+    def test_body(self):
+        """Request and response bodies go through the codec"""
+        codec = JsonCodec("test", loads=mock.Mock(return_value={"data": {"id": 1}}), dumps=mock.Mock(return_value="{}"))
+        http = HttpClient(ENDPOINT, "token", codec=codec)
+        http._session.request = mock.Mock(return_value=make_response(200, body=b'{"data": {"id": 1}}'))
+
+        http.post("components", data={"name": "Website"})
+        codec._dumps.assert_called_once_with({"name": "Website"})
+        self.assertEqual(http._session.request.call_args[1]["data"], b"{}")
+
+        self.assertEqual(http.get_json("components/1"), {"data": {"id": 1}})
+        codec._loads.assert_called_once_with(b'{"data": {"id": 1}}')
+
+        http.get("components")
+        self.assertIsNone(http._session.request.call_args[1]["data"])
+
+    def test_default(self):
+        http = HttpClient(ENDPOINT, "token")
+        self.assertIs(http.codec, get_codec())
+        self.assertIs(AsyncHttpClient(http).codec, http.codec)
+
+
+@mock.patch('cachetclient.httpclient.time.sleep')
+class HookTests(TestCase):
+
+    def test_events(self, sleep):
+        events = {name: [] for name in HOOK_EVENTS}
+        http = HttpClient(
+            ENDPOINT, "token",
+            retry=RetryPolicy(),
+            hooks={name: [events[name].append] for name in HOOK_EVENTS},
+        )
+        http._session.request = mock.Mock(side_effect=[
+            make_response(503, body=b''),
+            ConnectTimeout(),
+            make_response(200, body=b'{"data": {"id": 1}}'),
+        ])
+        http.put("components/1", data={"status": 1})
+
+        self.assertEqual([e.retries for e in events["before_request"]], [0, 1, 2])
+        first, failed, last = events["before_request"]
+        self.assertEqual(events["after_response"], [first, last])
+        self.assertEqual(events["on_error"], [first, failed])
+
+        self.assertEqual(last.endpoint, "PUT components/{}")
+        self.assertEqual(last.path, "components/1")
+        self.assertEqual(last.status, 200)
+        self.assertEqual(last.bytes, 19)
+        self.assertEqual(last.request_bytes, len(http.codec.dumps({"status": 1})))
+        self.assertIsNotNone(last.ttfb)
+        self.assertGreaterEqual(last.total, 0)
+        self.assertIsNone(last.dns)
+
+        self.assertEqual(first.status, 503)
+        self.assertTrue(first.will_retry)
+        self.assertIsNone(first.error)
+        self.assertIsInstance(failed.error, ConnectTimeout)
+        self.assertIsNone(failed.status)
+
+    def test_final_error(self, sleep):
+        errors = []
+        http = HttpClient(ENDPOINT, "token")
+        http.add_hook("on_error", errors.append)
+        http._session.request = mock.Mock(return_value=make_response(404))
+        with self.assertRaises(HTTPError):
+            http.get("components/1")
+        self.assertEqual(len(errors), 1)
+        self.assertFalse(errors[0].will_retry)
+
+    def test_add_remove(self, sleep):
+        http = HttpClient(ENDPOINT, "token")
+        events = []
+        http.add_hook("after_response", events.append)
+        with self.assertRaises(ValueError):
+            http.add_hook("after_request", events.append)
+
+        http._session.request = mock.Mock(return_value=make_response(200))
+        http.get_json("components")
+        http.remove_hook("after_response", events.append)
+        http.get_json("components")
+        self.assertEqual(len(events), 1)
+
+    def test_failing_hook(self, sleep):
+        """Hook errors do not break requests"""
+        http = HttpClient(ENDPOINT, "token", hooks={"before_request": [lambda event: 1 / 0]})
+        http._session.request = mock.Mock(return_value=make_response(200))
+        with self.assertLogs("cachetclient.httpclient", level="ERROR"):
+            self.assertEqual(http.get_json("components"), {"data": []})
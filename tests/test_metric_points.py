@@ -1,9 +1,16 @@
+import time
+from array import array
 from unittest import mock
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from requests.exceptions import HTTPError
 
 from base import CachetTestcase
 from fakeapi import FakeHttpClient
+from cachetclient.base import Resource
+from cachetclient import v1
 from cachetclient.v1 import enums
+from cachetclient.v1.metric_points import CompactMetricPoint, MetricPoint
 
 
 @mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
@@ -54,3 +61,136 @@ class MetricPointsTest(CachetTestcase):
             [{k: i.attrs[k] for k in ['id', 'metric_id', 'value']} for i in points],
             check_list
         )
+
+    def test_create_timestamp(self):
+        metric = self.client.metrics.create(name="Issue 1", description="Descr", suffix='IS')
+        timestamp = datetime(2020, 1, 2, 3, 4, 5)
+        point = self.client.metric_points.create(metric_id=metric.id, value=1, timestamp=timestamp)
+        self.assertEqual(point.created_at, timestamp)
+
+    def test_buffered(self):
+        metric = self.client.metrics.create(name="Issue 1", description="Descr", suffix='IS')
+        other = self.client.metrics.create(name="Issue 2", description="Descr", suffix='IS')
+
+        with self.client.metric_points.buffered(batch_size=1000, flush_interval=60) as buffer:
+            for value in range(10):
+                self.assertTrue(buffer.add(metric.id, value))
+                self.assertTrue(buffer.add(other.id, value * 2))
+            self.assertEqual(buffer.queued, 20)
+            self.assertEqual(self.client.metric_points.count(metric.id), 0)
+
+            buffer.flush()
+            self.assertEqual(buffer.queued, 0)
+            self.assertEqual(buffer.sent, 20)
+            self.assertEqual(
+                [p.value for p in self.client.metric_points.list(metric.id, per_page=100)
+                 if p.metric_id == metric.id],
+                list(range(10)),
+            )
+
+            buffer.add(metric.id, 100)
+
+        # Remaining points are flushed on close
+        self.assertEqual(buffer.sent, 21)
+        with self.assertRaises(RuntimeError):
+            buffer.add(metric.id, 1)
+
+    def test_buffered_batch_size(self):
+        metric = self.client.metrics.create(name="Issue 1", description="Descr", suffix='IS')
+        buffer = self.client.metric_points.buffered(batch_size=5, flush_interval=60)
+        for value in range(5):
+            buffer.add(metric.id, value)
+
+        # Background thread flushes when the batch is full
+        for _ in range(100):
+            if buffer.sent == 5:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(buffer.sent, 5)
+        buffer.close()
+
+    def test_buffered_dropped(self):
+        metric = self.client.metrics.create(name="Issue 1", description="Descr", suffix='IS')
+        with self.client.metric_points.buffered(max_queued=3, flush_interval=60) as buffer:
+            results = [buffer.add(metric.id, value) for value in range(5)]
+
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(buffer.dropped, 2)
+        self.assertEqual(buffer.sent, 3)
+
+    def test_buffered_failures(self):
+        with mock.patch.object(self.client.metric_points, 'create', side_effect=HTTPError("500")):
+            with self.client.metric_points.buffered(workers=2) as buffer:
+                buffer.add(1, 1)
+                buffer.add(2, 1)
+
+        self.assertEqual(buffer.failed, 2)
+        self.assertEqual(buffer.sent, 0)
+
+    def test_columns(self):
+        metric = self.client.metrics.create(name="Issue 1", description="Descr", suffix='IS')
+        start = datetime(2020, 1, 2, 3, 4, 5)
+        for num in range(25):
+            self.client.metric_points.create(
+                metric_id=metric.id, value=num / 2, timestamp=start + timedelta(minutes=num)
+            )
+
+        columns = self.client.metric_points.columns(metric.id, per_page=10, workers=2)
+        self.assertEqual(len(columns), 25)
+        self.assertIsInstance(columns.values, array)
+        self.assertEqual(columns.ids.tolist(), list(range(1, 26)))
+        self.assertEqual(columns.values.tolist(), [num / 2 for num in range(25)])
+        self.assertEqual(
+            columns.timestamps.tolist(),
+            [int((start + timedelta(minutes=num)).timestamp()) for num in range(25)],
+        )
+
+        try:
+            import numpy
+        except ImportError:
+            return
+
+        arrays = columns.to_numpy()
+        self.assertEqual(arrays.values.dtype, numpy.float64)
+        self.assertEqual(arrays.timestamps.dtype, numpy.int64)
+        self.assertEqual(arrays.values.sum(), sum(columns.values))
+        self.assertEqual(arrays.timestamps.tolist(), columns.timestamps.tolist())
+
+    def test_resource_slots(self):
+        """Compact resources have no instance dict"""
+        data = {
+            'id': 1, 'metric_id': 1, 'value': 1,
+            'created_at': '2019-05-24 09:26:22', 'updated_at': '2019-05-24 09:26:22',
+        }
+        manager = self.client.metric_points
+        self.assertFalse(manager.compact)
+        point = manager.instance_from_dict(dict(data))
+        self.assertIsInstance(point, MetricPoint)
+        point.note = 'Regular resources still take arbitrary attributes'
+        self.assertIn('note', point.__dict__)
+
+        manager.compact = True
+        point = manager.instance_from_dict(data)
+        self.assertIsInstance(point, CompactMetricPoint)
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual(point.attrs['id'], 1)
+        manager.compact = False
+        self.assertIsInstance(manager.instance_from_dict(dict(data)), MetricPoint)
+
+        self.assertEqual(point.created_at, datetime(2019, 5, 24, 9, 26, 22))
+        # Reading timestamps does not add state to the resource
+        self.assertEqual(Resource.__slots__, ("_manager", "_data"))
+        point.attrs["created_at"] = "2020-01-01 00:00:00"
+        self.assertEqual(point.created_at, datetime(2020, 1, 1))
+
+        # Compact mode for all managers of a client
+        client = v1.Client(self.client._http, compact=True)
+        for name in ('components', 'component_groups', 'incidents', 'incident_updates',
+                     'metrics', 'metric_points', 'schedules', 'subscribers', 'version'):
+            manager = getattr(client, name)
+            self.assertTrue(manager.compact, name)
+            # Every class of a compact resource must declare __slots__ to stay dict free
+            for cls in manager.resource_class.__mro__[:-1]:
+                self.assertIn('__slots__', vars(cls), cls)
+
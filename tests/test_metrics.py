@@ -47,3 +47,54 @@ class MetricsTests(CachetTestcase):
         self.assertIsInstance(metric.updated_at, datetime)
 
         metric.delete()
+
+    def test_aggregator(self):
+        metric = self.client.metrics.create(name="Sum", description="Descr", suffix='IS')
+        avg = self.client.metrics.instance_from_dict({
+            'id': 1337, 'calc_type': enums.METRIC_CALC_AVG, 'threshold': 1,
+        })
+
+        start = datetime(2020, 1, 1, 12, 0, 0)
+        with self.client.metrics.aggregator() as aggregator:
+            aggregator.register(avg)
+            for second in range(0, 600, 10):
+                timestamp = start.replace(minute=second // 60, second=second % 60)
+                aggregator.add(metric.id, 1, timestamp=timestamp)
+                aggregator.add(avg.id, second % 60, timestamp=timestamp)
+
+            # The sum metric has a 5 minute threshold. The first bucket is complete
+            self.assertEqual(self.client.metric_points.count(metric.id), 10)
+            self.assertEqual(aggregator.emitted, 10)
+
+        self.assertEqual(aggregator.samples, 120)
+        self.assertEqual(aggregator.emitted, 12)
+
+        points = list(self.client.metric_points.list(metric.id, per_page=100))
+        sums = [p.value for p in points if p.metric_id == metric.id]
+        averages = [p.value for p in points if p.metric_id == avg.id]
+        self.assertEqual(sums, [30, 30])
+        self.assertEqual(averages, [25] * 10)
+        self.assertEqual(points[0].created_at, start)
+
+    def test_aggregator_flush(self):
+        metric = self.client.metrics.create(name="Sum", description="Descr", suffix='IS')
+        aggregator = self.client.metrics.aggregator()
+        aggregator.add(metric.id, 1, timestamp=datetime(2020, 1, 1, 12, 0, 0))
+        self.assertEqual(aggregator.flush(), 1)
+
+        # Open buckets are only emitted when forced
+        aggregator.add(metric.id, 2)
+        self.assertEqual(aggregator.flush(), 0)
+        self.assertEqual(aggregator.flush(force=True), 1)
+        self.assertEqual(self.client.metric_points.count(metric.id), 2)
+
+    def test_aggregator_buffer(self):
+        metric = self.client.metrics.create(name="Sum", description="Descr", suffix='IS')
+        with self.client.metric_points.buffered(flush_interval=60) as buffer:
+            with self.client.metrics.aggregator(buffer=buffer) as aggregator:
+                for _ in range(100):
+                    aggregator.add(metric.id, 1)
+
+            self.assertEqual(buffer.queued, 1)
+
+        self.assertEqual([p.value for p in metric.points()], [100])
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+from unittest import mock, TestCase
+
+import requests
+
+from cachetclient.httpclient import AsyncHttpClient, HttpClient, RetryPolicy
+from cachetclient.ratelimit import RateLimiter, TokenBucket
+
+
+class TokenBucketTests(TestCase):
+
+    @mock.patch('cachetclient.ratelimit.time.monotonic')
+    def test_reserve(self, monotonic):
+        monotonic.return_value = 100.0
+        bucket = TokenBucket(2, burst=2)
+
+        # Burst is available right away
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        # Then one token every 0.5 seconds
+        self.assertEqual(bucket.reserve(), 0.5)
+        self.assertEqual(bucket.reserve(), 1.0)
+
+        # Refill after two seconds pays back the debt of two tokens
+        monotonic.return_value = 102.0
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+class RateLimiterTests(TestCase):
+
+    def test_matching(self):
+        limiter = RateLimiter()
+        limiter.add_limit(1, method="post", path="incidents")
+        limiter.add_limit(1, path="metrics/{}/points")
+
+        # Unmatched requests are never limited
+        for _ in range(5):
+            self.assertEqual(limiter.reserve("GET", "components"), 0)
+            self.assertEqual(limiter.reserve("GET", "incidents"), 0)
+            self.assertEqual(limiter.reserve("POST", "metrics/1"), 0)
+
+        self.assertEqual(limiter.reserve("POST", "incidents"), 0)
+        self.assertGreater(limiter.reserve("POST", "incidents"), 0)
+
+        self.assertEqual(limiter.reserve("POST", "metrics/1/points"), 0)
+        self.assertGreater(limiter.reserve("POST", "/metrics/2/points"), 0)
+
+        # Prefixes end at a path segment
+        limiter = RateLimiter()
+        limiter.add_limit(1, path="components")
+        self.assertEqual(limiter.reserve("GET", "components_archive"), 0)
+        self.assertEqual(limiter.reserve("GET", "components_archive"), 0)
+        self.assertEqual(limiter.reserve("GET", "components"), 0)
+        self.assertGreater(limiter.reserve("GET", "components/1"), 0)
+
+    def test_waiting(self):
+        limiter = RateLimiter()
+        limiter.add_limit(20, burst=1)
+        limiter.acquire("GET", "components")
+
+        thread = threading.Thread(target=limiter.acquire, args=("GET", "components"))
+        thread.start()
+        for _ in range(100):
+            if limiter.waiting:
+                break
+            time.sleep(0.001)
+        self.assertEqual(limiter.waiting, 1)
+        thread.join()
+        self.assertEqual(limiter.waiting, 0)
+
+    def test_acquire_async(self):
+        limiter = RateLimiter()
+        limiter.add_limit(100, burst=1)
+
+        async def acquire():
+            return [await limiter.acquire_async("GET", "components") for _ in range(3)]
+
+        loop = asyncio.new_event_loop()
+        delays = loop.run_until_complete(acquire())
+        loop.close()
+        self.assertEqual(delays[0], 0)
+        self.assertGreater(delays[1], 0)
+
+    def test_http_client(self):
+        response = requests.Response()
+        response.status_code = 200
+        limiter = mock.Mock(spec=RateLimiter)
+
+        http = HttpClient("https://status.example.com/api/v1", "token", rate_limiter=limiter)
+        http._session.request = mock.Mock(return_value=response)
+        http.put("components/1", data={})
+        limiter.acquire.assert_called_once_with("PUT", "components/1")
+
+        # The async client waits in the event loop and skips the blocking wait
+        awaited = []
+
+        async def acquire_async(method, path):
+            awaited.append((method, path))
+            return 0
+
+        limiter.acquire_async = acquire_async
+        async_http = AsyncHttpClient(http)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(async_http.get("components"))
+        loop.run_until_complete(async_http.close())
+        loop.close()
+        self.assertEqual(awaited, [("GET", "components")])
+        self.assertEqual(limiter.acquire.call_count, 1)
+
+    @mock.patch('cachetclient.httpclient.time.sleep')
+    def test_retries(self, sleep):
+        """Every retry takes a token"""
+        failed = requests.Response()
+        failed.status_code = 503
+        ok = requests.Response()
+        ok.status_code = 200
+        limiter = mock.Mock(spec=RateLimiter)
+
+        http = HttpClient(
+            "https://status.example.com/api/v1", "token", rate_limiter=limiter, retry=RetryPolicy(),
+        )
+        http._session.request = mock.Mock(side_effect=[failed, failed, ok])
+        http.get("components")
+        self.assertEqual(http._session.request.call_count, 3)
+        self.assertEqual(limiter.acquire.call_args_list, [mock.call("GET", "components")] * 3)
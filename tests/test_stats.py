@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+import requests
+
+import cachetclient
+from cachetclient.cache import ResponseCache
+from cachetclient.httpclient import RetryPolicy
+from cachetclient.stats import StatsCollector
+from fakeserver import FakeServer
+
+
+class StatsCollectorTests(TestCase):
+
+    def test_collect(self):
+        stats = StatsCollector(buckets=(0.001, 10))
+        cache = ResponseCache()
+        stats.track_cache(cache)
+        with FakeServer() as server:
+            client = cachetclient.Client(
+                endpoint=server.endpoint, api_token=server.token, cache=cache, hooks=stats.hooks(),
+            )
+            for num in range(5):
+                client.components.create(name="Component {}".format(num), status=1)
+            self.assertEqual(len(list(client.components.list(per_page=2))), 5)
+            self.assertEqual(len(list(client.components.list(per_page=2))), 5)
+            with self.assertRaises(requests.HTTPError):
+                client.components.get(100)
+
+        self.assertEqual(stats.in_flight, 0)
+        text = stats.render()
+        lines = text.splitlines()
+        self.assertEqual(lines[-1], "# EOF")
+        self.assertIn('cachetclient_requests_total{method="POST",path="components",status="200"} 5', lines)
+        self.assertIn('cachetclient_requests_total{method="GET",path="components/{}",status="404"} 1', lines)
+        self.assertIn('cachetclient_request_errors_total{method="GET",path="components/{}",status="404"} 1', lines)
+        self.assertIn('cachetclient_request_duration_seconds_bucket{method="POST",path="components",le="+Inf"} 5', lines)
+        self.assertIn('cachetclient_request_duration_seconds_count{method="GET",path="components"} 3', lines)
+        self.assertIn('# TYPE cachetclient_requests counter', lines)
+        # The second listing is served from the cache
+        self.assertIn('cachetclient_pages_fetched_total{path="components"} 3', lines)
+        self.assertIn('cachetclient_cache_hits_total 3', lines)
+        self.assertIn('cachetclient_cache_misses_total 4', lines)
+        self.assertIn('cachetclient_cache_hit_ratio {!r}'.format(3 / 7), lines)
+        self.assertIn('cachetclient_requests_in_flight 0', lines)
+
+        text = stats.render(openmetrics=False)
+        self.assertNotIn("# EOF", text)
+        self.assertIn('# TYPE cachetclient_requests_total counter', text)
+
+    def test_retries(self):
+        stats = StatsCollector(prefix="cachet")
+        with FakeServer(error_rate=0.5, seed=2) as server:
+            client = cachetclient.Client(
+                endpoint=server.endpoint,
+                api_token=server.token,
+                retry=RetryPolicy(max_retries=20, backoff_factor=0.001),
+                hooks=stats.hooks(),
+            )
+            for _ in range(10):
+                client.components.count()
+
+        text = stats.render()
+        self.assertIn('cachet_request_retries_total{method="GET",path="components"} %s' % server.errors, text)
+        self.assertIn('cachet_request_errors_total{method="GET",path="components",status="503"} %s' % server.errors, text)
+
+    def test_connection_errors(self):
+        stats = StatsCollector()
+        with FakeServer() as server:
+            endpoint = server.endpoint
+        client = cachetclient.Client(endpoint=endpoint, api_token="token", hooks=stats.hooks())
+        with self.assertRaises(requests.ConnectionError):
+            client.components.count()
+        self.assertEqual(stats.in_flight, 0)
+        self.assertIn('status="ConnectionError"} 1', stats.render())
+
+    def test_http_server(self):
+        stats = StatsCollector()
+        server = stats.start_http_server(0, host="127.0.0.1")
+        try:
+            url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+            response = requests.get(url, headers={"Accept": "application/openmetrics-text"})
+            self.assertTrue(response.headers["Content-Type"].startswith("application/openmetrics-text"))
+            self.assertTrue(response.text.endswith("# EOF\n"))
+            response = requests.get(url)
+            self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+        finally:
+            server.shutdown()
+            server.server_close()
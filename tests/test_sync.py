@@ -0,0 +1,142 @@
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from base import CachetTestcase
+from fakeapi import FakeHttpClient
+from fakeserver import FakeServer
+from cachetclient import v1
+from cachetclient.httpclient import HttpClient
+from cachetclient.v1 import enums
+from cachetclient.v1.sync import Action, Synchronizer, load_inventory
+
+INVENTORY = {
+    "groups": [
+        {
+            "name": "Global Services",
+            "order": 1,
+            "visible": True,
+            "components": [
+                {"name": "Website", "description": "Public website", "tags": ["web"]},
+                {"name": "API", "status": enums.COMPONENT_STATUS_OPERATIONAL},
+            ],
+        },
+    ],
+    "components": [
+        {"name": "Build server", "link": "https://ci.example.com"},
+    ],
+}
+
+
+@mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+class SyncTests(CachetTestcase):
+
+    @mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+    def setUp(self):
+        self.client = self.create_client()
+
+    def test_create(self):
+        sync = Synchronizer(self.client, tag="inventory")
+        plan = sync.sync(INVENTORY)
+        self.assertEqual(len(plan.filter(Action.CREATE, "group")), 1)
+        self.assertEqual(len(plan.filter(Action.CREATE, "component")), 3)
+        self.assertEqual(plan.failed, [])
+
+        group = self.client.component_groups.get(1)
+        self.assertEqual(group.name, "Global Services")
+        website = [c for c in self.client.components.list() if c.name == "Website"][0]
+        self.assertEqual(website.group_id, group.id)
+        self.assertEqual(sorted(website.tag_names), ["inventory", "web"])
+
+        # Converged
+        self.assertEqual(len(sync.plan(INVENTORY)), 0)
+
+    def test_update_move_delete(self):
+        sync = Synchronizer(self.client, prune=True)
+        sync.sync(INVENTORY)
+        self.client.components.create(name="Legacy", status=enums.COMPONENT_STATUS_OPERATIONAL)
+
+        inventory = json.loads(json.dumps(INVENTORY))
+        inventory["groups"][0]["order"] = 2
+        website = inventory["groups"][0]["components"].pop(0)
+        website["description"] = "Website"
+        inventory["components"].append(website)
+
+        plan = sync.plan(inventory)
+        self.assertEqual([str(a) for a in plan.filter(Action.UPDATE)], [
+            "~ group 'Global Services': order 1 -> 2",
+        ])
+        self.assertEqual([str(a) for a in plan.filter(Action.MOVE)], [
+            "> component 'Website': description 'Public website' -> 'Website', group 'Global Services' -> None",
+        ])
+        self.assertEqual([a.name for a in plan.filter(Action.DELETE)], ["Legacy"])
+
+        with mock.patch.object(self.client.components, 'list', wraps=self.client.components.list) as list_:
+            sync.apply(plan)
+            list_.assert_not_called()
+
+        self.assertEqual(plan.failed, [])
+        self.assertEqual(self.client.components.count(), 3)
+        self.assertEqual(self.client.component_groups.get(1).order, 2)
+        self.assertTrue(self.client.component_groups.get(1).visible)
+        self.assertEqual(len(sync.plan(inventory)), 0)
+
+    def test_remove_tags(self):
+        """Removing all tags converges"""
+        with FakeServer() as server:
+            client = v1.Client(HttpClient(server.endpoint, server.token))
+            client.components.create(name="A", status=enums.COMPONENT_STATUS_OPERATIONAL, tags=["x"])
+            sync = Synchronizer(client)
+            inventory = {"components": [{"name": "A", "tags": []}]}
+
+            plan = sync.sync(inventory)
+            self.assertEqual([str(a) for a in plan], ["~ component 'A': tags ['x'] -> []"])
+            self.assertEqual(plan.failed, [])
+            self.assertEqual(client.components.get(1).tag_names, [])
+            self.assertEqual(len(sync.plan(inventory)), 0)
+
+    def test_prune_by_tag(self):
+        self.client.components.create(name="Unmanaged", status=enums.COMPONENT_STATUS_OPERATIONAL)
+        self.client.components.create(
+            name="Stale", status=enums.COMPONENT_STATUS_OPERATIONAL, tags=["inventory"],
+        )
+        plan = Synchronizer(self.client, prune=True, tag="inventory").plan(INVENTORY)
+        self.assertEqual([a.name for a in plan.filter(Action.DELETE)], ["Stale"])
+
+    def test_dry_run(self):
+        out = io.StringIO()
+        plan = Synchronizer(self.client).sync(INVENTORY, dry_run=True, file=out)
+        self.assertEqual(self.client.components.count(), 0)
+        self.assertIn("+ component 'Website'", out.getvalue())
+        self.assertIn("4 to create, 0 to update, 0 to move, 0 to delete", out.getvalue())
+        self.assertEqual(len(plan), 4)
+
+    def test_errors(self):
+        sync = Synchronizer(self.client)
+        with self.assertRaises(ValueError):
+            sync.plan({"components": [{"name": "A"}, {"name": "A"}]})
+        with self.assertRaises(ValueError):
+            sync.plan({"components": [{"name": "A", "status": -1}]})
+
+        with self.assertRaises(ValueError):
+            sync.plan({"components": [{"name": "A", "description": None}]})
+        with self.assertRaises(ValueError):
+            sync.plan({"groups": [{"name": "G", "order": None}]})
+
+        with mock.patch.object(self.client.components, 'create', side_effect=RuntimeError):
+            plan = sync.sync({"components": [{"name": "A"}]})
+        self.assertIsInstance(plan.failed[0].error, RuntimeError)
+
+    def test_load_inventory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "inventory.yaml")
+            with open(path, "w") as fd:
+                fd.write("components:\n  - name: Website\n    status: 1\n")
+            self.assertEqual(load_inventory(path), {"components": [{"name": "Website", "status": 1}]})
+
+            path = os.path.join(tmp, "inventory.json")
+            with open(path, "w") as fd:
+                json.dump(INVENTORY, fd)
+            self.assertEqual(load_inventory(path), INVENTORY)
@@ -0,0 +1,173 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import cachetclient
+from cachetclient import tracing
+from fakeserver import FakeServer
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None
+
+
+def run(coro):
+    """Run a coroutine in a fresh event loop"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class TracingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        tracing.enable(provider.get_tracer("test"))
+        self.server = FakeServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+        tracing.enable()
+
+    def spans(self, name):
+        return [span for span in self.exporter.get_finished_spans() if span.name == name]
+
+    def test_operations(self):
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token)
+        component = client.components.create(name="Test", status=1)
+        client.components.get(component.id)
+        client.components.count()
+        client.components.delete(component.id)
+
+        create, = self.spans("ComponentManager.create")
+        self.assertEqual(create.attributes["cachet.resource"], "Component")
+        self.assertEqual(create.attributes["cachet.path"], "components")
+        self.assertGreater(create.attributes["cachet.response_bytes"], 0)
+        self.assertGreaterEqual(create.attributes["cachet.decode_seconds"], 0)
+
+        get, = self.spans("ComponentManager.get")
+        self.assertEqual(get.attributes["cachet.resource_id"], component.id)
+        self.assertIn("cachet.response_bytes", get.attributes)
+        self.assertEqual(len(self.spans("ComponentManager.count")), 1)
+        self.assertEqual(len(self.spans("ComponentManager.delete")), 1)
+
+    def test_compact(self):
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token, compact=True)
+        client.components.create(name="Test", status=1)
+        create, = self.spans("ComponentManager.create")
+        self.assertEqual(create.attributes["cachet.resource"], "Component")
+
+    def test_path_template(self):
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token)
+        metric = client.metrics.create(name="Latency", description="Latency", suffix="ms")
+        client.metric_points.create(metric_id=metric.id, value=1)
+        list(client.metric_points.list(metric.id))
+
+        create, = self.spans("MetricPointsManager.create")
+        self.assertEqual(create.attributes["cachet.path"], "metrics/{}/points")
+        list_span, = self.spans("MetricPointsManager.list")
+        self.assertEqual(list_span.attributes["cachet.path"], "metrics/{}/points")
+        page, = self.spans("MetricPointsManager.page")
+        self.assertEqual(page.attributes["cachet.path"], "metrics/{}/points")
+
+        component = client.components.create(name="Test", status=1)
+        client.components.get(component.id)
+        get, = self.spans("ComponentManager.get")
+        self.assertEqual(get.attributes["cachet.path"], "components")
+
+    def test_ping_version(self):
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token)
+        self.assertTrue(client.ping())
+        client.version()
+
+        ping, = self.spans("PingManager.get")
+        self.assertEqual(ping.attributes["cachet.path"], "ping")
+        self.assertIn("cachet.response_bytes", ping.attributes)
+        version, = self.spans("VersionManager.get")
+        self.assertEqual(version.attributes["cachet.resource"], "Version")
+
+    def test_list(self):
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token)
+        for num in range(5):
+            client.components.create(name="Component {}".format(num), status=1)
+
+        for workers in (None, 2):
+            self.exporter.clear()
+            self.assertEqual(len(list(client.components.list(per_page=2, workers=workers))), 5)
+
+            list_span, = self.spans("ComponentManager.list")
+            self.assertEqual(list_span.attributes["cachet.per_page"], 2)
+            pages = sorted(self.spans("ComponentManager.page"), key=lambda span: span.attributes["cachet.page"])
+            self.assertEqual([span.attributes["cachet.page"] for span in pages], [1, 2, 3])
+            for span in pages:
+                self.assertEqual(span.parent.span_id, list_span.context.span_id)
+                self.assertEqual(span.attributes["cachet.per_page"], 2)
+                self.assertGreater(span.attributes["cachet.response_bytes"], 0)
+
+    def test_error(self):
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token)
+        with self.assertRaises(Exception):
+            client.components.get(100)
+
+        get, = self.spans("ComponentManager.get")
+        self.assertFalse(get.status.is_ok)
+        self.assertEqual(get.events[0].name, "exception")
+
+    def test_async(self):
+        client = cachetclient.AsyncClient(endpoint=self.server.endpoint, api_token=self.server.token)
+
+        async def main():
+            self.assertTrue(await client.ping())
+            for num in range(3):
+                await client.components.create(name="Component {}".format(num), status=1)
+            return [component async for component in client.components.list(per_page=1, workers=2)]
+
+        try:
+            self.assertEqual(len(run(main())), 3)
+        finally:
+            run(client.close())
+
+        self.assertEqual(len(self.spans("AsyncPingManager.get")), 1)
+        self.assertEqual(len(self.spans("AsyncComponentManager.create")), 3)
+        list_span, = self.spans("AsyncComponentManager.list")
+        pages = self.spans("AsyncComponentManager.page")
+        self.assertEqual(len(pages), 3)
+        for span in pages:
+            self.assertEqual(span.parent.span_id, list_span.context.span_id)
+            # Decoded in a worker thread
+            self.assertIn("cachet.response_bytes", span.attributes)
+
+    def test_disable(self):
+        tracing.disable()
+        client = cachetclient.Client(endpoint=self.server.endpoint, api_token=self.server.token)
+        client.components.create(name="Test", status=1)
+        self.assertEqual(len(list(client.components.list())), 1)
+        self.assertEqual(self.exporter.get_finished_spans(), ())
+
+
+class NoOpTests(unittest.TestCase):
+
+    def tearDown(self):
+        tracing.enable()
+
+    @mock.patch.dict("sys.modules", {"opentelemetry": None})
+    @mock.patch.object(tracing, "_trace", None)
+    def test_missing_library(self):
+        tracing.enable()
+        self.assertIsNone(tracing.get_tracer())
+        self.assertIsNone(tracing.current_span())
+        self.assertIsNone(tracing.start_span("test"))
+        tracing.end_span(None)
+        with tracing.span("test"), tracing.use_span(None):
+            pass
+        func = len
+        self.assertIs(tracing.bind(None, func), func)
+        self.assertEqual(tracing.decode(len, b"abc"), 3)
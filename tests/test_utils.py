@@ -0,0 +1,50 @@
+from datetime import datetime
+from unittest import TestCase
+
+from cachetclient import utils
+
+
+class ToDatetimeTests(TestCase):
+
+    def test_formats(self):
+        self.assertEqual(utils.to_datetime('2019-05-24 09:26:22'), datetime(2019, 5, 24, 9, 26, 22))
+        self.assertEqual(utils.to_datetime('Friday 24th May 2019 10:01:44'), datetime(2019, 5, 24, 10, 1, 44))
+        self.assertEqual(utils.to_datetime('Wednesday 1st May 2019 10:01:44'), datetime(2019, 5, 1, 10, 1, 44))
+        self.assertEqual(utils.to_datetime('sunday 3rd march 2019 7:01:44'), datetime(2019, 3, 3, 7, 1, 44))
+        self.assertEqual(utils.to_datetime('Friday 24 May 2019 10:01:44'), datetime(2019, 5, 24, 10, 1, 44))
+        self.assertEqual(utils.to_datetime('Tuesday 24th September 2019 10:1:4'), datetime(2019, 9, 24, 10, 1, 4))
+        # Single digit fields are handled by the slow path
+        self.assertEqual(utils.to_datetime('2019-5-4 9:02:03'), datetime(2019, 5, 4, 9, 2, 3))
+        self.assertIsNone(utils.to_datetime(None))
+
+    def test_invalid(self):
+        for value in (
+            '',
+            '2019-02-30 10:00:00',
+            '2019-05-24T09:26:22',
+            '2019-05-24 09:26:22+00:00',
+            'Someday 1st May 2019 10:00:00',
+            'Friday 1st Mai 2019 10:00:00',
+            'Friday 32nd May 2019 10:00:00',
+        ):
+            with self.assertRaises(ValueError, msg=value):
+                utils.to_datetime(value)
+
+    def test_memoized(self):
+        timestamp = '2019-05-24 09:26:22'
+        self.assertIs(utils.to_datetime(timestamp), utils.to_datetime(timestamp))
+        self.assertEqual(utils._parse_datetime(timestamp), utils.to_datetime(timestamp))
+
+
+class UtilsTests(TestCase):
+
+    def test_path_template(self):
+        self.assertEqual(utils.path_template('metrics/1/points/3'), 'metrics/{}/points/{}')
+        self.assertEqual(utils.path_template('components'), 'components')
+
+    def test_copy_json(self):
+        data = {'data': [{'id': 1, 'tags': {'a': 'A'}}]}
+        copy = utils.copy_json(data)
+        self.assertEqual(copy, data)
+        copy['data'][0]['tags']['b'] = 'B'
+        self.assertEqual(data['data'][0]['tags'], {'a': 'A'})